@@ -23,10 +23,29 @@ export DJANGO_ENV
 python /code/manage.py migrate --noinput
 python /code/manage.py collectstatic --noinput
 
-# Start gunicorn with 4 workers:
-/usr/local/bin/gunicorn server.wsgi \
-  -w 4 \
-  -b 0.0.0.0:8000 \
-  --chdir=/code \
-  --log-file=- \
-  --worker-tmp-dir /dev/shm
+# `SERVER_MODE` selects how the app is served:
+#   - `wsgi` (default): 4 synchronous workers running `server/wsgi.py`. Each
+#     worker serves one request at a time.
+#   - `asgi`: 4 uvicorn workers running `server/asgi.py`. `/graphql` queries
+#     run on each worker's event loop, so one worker overlaps many requests
+#     (and slow uploads) instead of being pinned by them.
+SERVER_MODE="${SERVER_MODE:-wsgi}"
+
+if [ "$SERVER_MODE" = 'asgi' ]; then
+  # Start gunicorn with 4 uvicorn workers:
+  /usr/local/bin/gunicorn server.asgi:application \
+    -k uvicorn.workers.UvicornWorker \
+    -w 4 \
+    -b 0.0.0.0:8000 \
+    --chdir=/code \
+    --log-file=- \
+    --worker-tmp-dir /dev/shm
+else
+  # Start gunicorn with 4 workers:
+  /usr/local/bin/gunicorn server.wsgi \
+    -w 4 \
+    -b 0.0.0.0:8000 \
+    --chdir=/code \
+    --log-file=- \
+    --worker-tmp-dir /dev/shm
+fi
@@ -1,15 +1,25 @@
 # -*- coding: utf-8 -*-
 
+from abc import ABCMeta, abstractmethod
+from asyncio import AbstractEventLoop, Future, gather, get_event_loop
+from concurrent.futures import Executor
+from enum import Enum
 from functools import partial
+from itertools import groupby
+from operator import attrgetter
 from typing import (
     Any,
     Callable,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     MutableMapping,
     Optional,
+    Set,
     Tuple,
     TypeVar,
+    Union,
 )
 
 from promise import Promise
@@ -17,18 +27,26 @@ from promise.dataloader import DataLoader
 
 from logics.resumes import ResumesLogic
 from logics.resumes.resumes_types import (  # noqa E501
+    FullResume,
     PersonalInfoLike,
     TextOnlyEnumType,
     RatableEnumType,
+    ResumeChildTagType,
+    ResumeComponentEnumType,
 )
 from logics.logics_utils import UUIDType
 
 T = TypeVar("T")
 IndexIdListType = List[Tuple[int, UUIDType]]
-ResourceListFromIdLoaderType = List[Tuple[int, List[Optional[T]]]]
-ResourceFromIdLoaderType = List[Tuple[int, Optional[T]]]
+# (user id, resume id)
+UserResumeIdType = Tuple[str, str]
+# the resources of a batch of keys, in the order of the keys
+ResultsType = List[Any]  # type: ignore
 TagType = str
-BatchKeyType = Tuple[TagType, UUIDType]
+BatchKeyType = Tuple[TagType, Union[UUIDType, UserResumeIdType]]
+TagsIndexArgsMapType = Mapping[TagType, IndexIdListType]
+# loader tag => the only attributes read from the resources of that tag
+TagsFieldsMapType = Mapping[TagType, Set[str]]
 
 
 PERSONAL_INFO_FROM_RESUME_ID_LOADER_TAG = "0"
@@ -41,6 +59,7 @@ SUPPLEMENTARY_SKILL_FROM_RESUME_ID_LOADER_TAG = "6"
 ACHIEVEMENT_FROM_EDUCATION_ID_LOADER_TAG = "7"
 ACHIEVEMENT_FROM_EXPERIENCE_ID_LOADER_TAG = "8"
 ACHIEVEMENT_FROM_SKILL_ID_LOADER_TAG = "9"
+RESUME_FROM_ID_LOADER_TAG = "10"
 
 
 def make_personal_info_from_resume_id_loader_hash(
@@ -103,53 +122,117 @@ def make_supplementary_skill_from_resume_id_loader_hash(
     return (SUPPLEMENTARY_SKILL_FROM_RESUME_ID_LOADER_TAG, str(owner_id))
 
 
+def make_resume_from_id_loader_hash(
+    resume_id: UUIDType, user_id: UUIDType
+) -> BatchKeyType:  # noqa E501
+    # a resume is only loaded for its owner
+    return (RESUME_FROM_ID_LOADER_TAG, (str(user_id), str(resume_id)))
+
+
+class DispatchMode(Enum):
+    # one query per tag, one tag after the other
+    sequential = "sequential"
+    # all tags in a single query
+    combined = "combined"
+    # one query per tag, all tags at the same time (on an executor)
+    threaded = "threaded"
+
+
 def personal_info_from_resume_id_loader(
+    resource_getter_fn: Callable[[List[UUIDType]], List[PersonalInfoLike]],
     index_resume_id_list: IndexIdListType,
-) -> ResourceFromIdLoaderType[PersonalInfoLike]:
-    index_personal_info_list = resources_from_ids_loader(
-        ResumesLogic.get_personal_infos, index_resume_id_list
-    )  # noqa E501
-
-    # This is not optimal. We should not be doing a second iteration here
-    return [
-        (index, ps[0] if ps else None) for index, ps in index_personal_info_list
-    ]  # noqa E501
+    results: ResultsType,
+    from_id_attr_name: str = "resume_id",
+) -> None:
+    resources_from_ids_loader(
+        resource_getter_fn,
+        index_resume_id_list,
+        results,
+        from_id_attr_name,
+        one=True,
+    )
 
 
 def resources_from_ids_loader(
     resource_getter_fn: Callable[[List[UUIDType]], List[T]],
     index_arg_id_list: IndexIdListType,
+    results: ResultsType,
     from_id_attr_name: str = "resume_id",
-) -> ResourceListFromIdLoaderType[T]:
-    from_ids_list: List[UUIDType] = []
-    from_id_index_map: MutableMapping[UUIDType, int] = {}
-
-    for (index, from_id) in index_arg_id_list:
-        from_ids_list.append(from_id)
-        from_id_index_map[from_id] = index
-
-    from_id_to_resource_map: MutableMapping[UUIDType, List[Optional[T]]] = {}
-
-    for p in resource_getter_fn(from_ids_list):
-        from_id = str(getattr(p, from_id_attr_name))
-        resources = from_id_to_resource_map.get(from_id, [])
-        resources.append(p)
-        from_id_to_resource_map[from_id] = resources
-
-    index_resource_list: List[Tuple[int, List[Optional[T]]]] = []
+    one: bool = False,
+) -> None:
+    group_into_results(
+        resource_getter_fn([from_id for _, from_id in index_arg_id_list]),
+        index_arg_id_list,
+        results,
+        from_id_attr_name,
+        one,
+    )
+
+
+def index_resume_id_lists_of_users(
+    index_user_resume_id_list: List[Tuple[int, UserResumeIdType]],
+) -> Mapping[str, IndexIdListType]:
+    """
+    The resume ids (with their indices) of `RESUME_FROM_ID_LOADER_TAG` keys,
+    by the id of the user they were loaded for.
+    """
+    lists_map: MutableMapping[str, IndexIdListType] = {}
+
+    for index, (user_id, resume_id) in index_user_resume_id_list:
+        lists_map.setdefault(user_id, []).append((index, resume_id))
+
+    return lists_map
+
+
+def resumes_of_users_loader(
+    index_user_resume_id_list: List[Tuple[int, UserResumeIdType]],
+    results: ResultsType,
+) -> None:
+    for user_id, index_resume_id_list in index_resume_id_lists_of_users(
+        index_user_resume_id_list
+    ).items():  # noqa E501
+        resources_from_ids_loader(
+            partial(ResumesLogic.get_resumes, user_id=user_id),
+            index_resume_id_list,
+            results,
+            from_id_attr_name="id",
+            one=True,
+        )
 
-    for from_id in from_ids_list:
-        index = from_id_index_map[from_id]
-        resources = from_id_to_resource_map.get(from_id, [])
-        index_resource_list.append((index, resources))
 
-    return index_resource_list
+def group_into_results(
+    resources: Iterable[T],
+    index_arg_id_list: IndexIdListType,
+    results: ResultsType,
+    from_id_attr_name: str,
+    one: bool = False,
+) -> None:
+    """
+    Write the resources of each id in `index_arg_id_list` into `results`, at
+    the index paired with the id: the first resource if `one` (`None` if
+    there is none), else the list of them. `resources` must come grouped by
+    id - as the `ResumesLogic` getters return them, ordered by owner and
+    then index - so they are split in a single pass, without sorting.
+    """
+    from_id_index_map: MutableMapping[str, int] = {}
+
+    for index, from_id in index_arg_id_list:
+        from_id_index_map[str(from_id)] = index
+        results[index] = None if one else []
+
+    for from_id, group in groupby(resources, attrgetter(from_id_attr_name)):
+        index = from_id_index_map.get(str(from_id))  # type: ignore
+
+        if index is not None:
+            results[index] = next(group) if one else list(group)
 
 
 TAG_TO_RESOURCES_GETTER_FUNCTION_MAP: Mapping[  # type: ignore[disable_any_explicit] # noqa F821
-    TagType, Callable[[IndexIdListType], Any]
+    TagType, Callable[[IndexIdListType, ResultsType], None]
 ] = {  # noqa E501
-    PERSONAL_INFO_FROM_RESUME_ID_LOADER_TAG: personal_info_from_resume_id_loader,  # noqa E501
+    PERSONAL_INFO_FROM_RESUME_ID_LOADER_TAG: partial(
+        personal_info_from_resume_id_loader, ResumesLogic.get_personal_infos
+    ),
     EDUCATION_FROM_RESUME_ID_LOADER_TAG: partial(
         resources_from_ids_loader, ResumesLogic.get_educations
     ),
@@ -205,35 +288,689 @@ TAG_TO_RESOURCES_GETTER_FUNCTION_MAP: Mapping[  # type: ignore[disable_any_expli
         ),
         from_id_attr_name="owner_id",
     ),
+    RESUME_FROM_ID_LOADER_TAG: resumes_of_users_loader,  # type: ignore
 }
 
 
-class AppDataLoader(DataLoader):
-    def batch_load_fn(self, keys: List[BatchKeyType]) -> None:
-        tags_index_args_map: MutableMapping[
-            TagType, List[Tuple[int, UUIDType]]
-        ] = {}  # noqa E501
-
-        for index, key in enumerate(keys):
-            tag, args = key
-            index_args_list = tags_index_args_map.get(tag, [])
-            index_args_list.append((index, args))
-            tags_index_args_map[tag] = index_args_list
-
-        index_resource_list: List[Tuple[int, Any]] = []  # type: ignore
-
-        for tag in tags_index_args_map:
-            index_args_list = tags_index_args_map[tag]
-
-            index_resource_list.extend(
-                TAG_TO_RESOURCES_GETTER_FUNCTION_MAP[tag](index_args_list)
-            )  # noqa E502
-
-        return Promise.resolve(
-            [
-                resource[1]
-                for resource in sorted(
-                    index_resource_list, key=lambda member: member[0]
+# loader tag => (resume child tag, name of attribute pointing to the owner)
+TAG_TO_RESUME_CHILD_MAP: Mapping[TagType, Tuple[ResumeChildTagType, str]] = {
+    PERSONAL_INFO_FROM_RESUME_ID_LOADER_TAG: (
+        ResumeComponentEnumType.personal_info,
+        "resume_id",
+    ),
+    EDUCATION_FROM_RESUME_ID_LOADER_TAG: (
+        ResumeComponentEnumType.education,
+        "resume_id",
+    ),
+    EXPERIENCE_FROM_RESUME_ID_LOADER_TAG: (
+        ResumeComponentEnumType.experience,
+        "resume_id",
+    ),
+    SKILL_FROM_RESUME_ID_LOADER_TAG: (
+        ResumeComponentEnumType.skill,
+        "resume_id",
+    ),
+    HOBBY_FROM_RESUME_ID_LOADER_TAG: (
+        TextOnlyEnumType.resume_hobby,
+        "owner_id",
+    ),
+    ACHIEVEMENT_FROM_EDUCATION_ID_LOADER_TAG: (
+        TextOnlyEnumType.education_achievement,
+        "owner_id",
+    ),
+    ACHIEVEMENT_FROM_EXPERIENCE_ID_LOADER_TAG: (
+        TextOnlyEnumType.experience_achievement,
+        "owner_id",
+    ),
+    ACHIEVEMENT_FROM_SKILL_ID_LOADER_TAG: (
+        TextOnlyEnumType.skill_achievement,
+        "owner_id",
+    ),
+    SPOKEN_LANGUAGE_FROM_RESUME_ID_LOADER_TAG: (
+        RatableEnumType.spoken_language,
+        "owner_id",
+    ),
+    SUPPLEMENTARY_SKILL_FROM_RESUME_ID_LOADER_TAG: (
+        RatableEnumType.supplementary_skill,
+        "owner_id",
+    ),
+}
+
+
+# achievements loader tag => loader tag of the owners of the achievements
+ACHIEVEMENT_TAG_TO_OWNER_TAG_MAP: Mapping[TagType, TagType] = {
+    ACHIEVEMENT_FROM_EDUCATION_ID_LOADER_TAG: EDUCATION_FROM_RESUME_ID_LOADER_TAG,  # noqa E501
+    ACHIEVEMENT_FROM_EXPERIENCE_ID_LOADER_TAG: EXPERIENCE_FROM_RESUME_ID_LOADER_TAG,  # noqa E501
+    ACHIEVEMENT_FROM_SKILL_ID_LOADER_TAG: SKILL_FROM_RESUME_ID_LOADER_TAG,
+}
+
+OWNER_TAG_TO_ACHIEVEMENT_TAG_MAP: Mapping[TagType, TagType] = {
+    owner_tag: tag
+    for tag, owner_tag in ACHIEVEMENT_TAG_TO_OWNER_TAG_MAP.items()
+}
+
+# kind of resume child => loader tag that loads children of that kind
+RESUME_CHILD_TO_LOADER_TAG_MAP: Mapping[ResumeChildTagType, TagType] = {
+    child_tag: tag for tag, (child_tag, _) in TAG_TO_RESUME_CHILD_MAP.items()
+}
+
+# loader tags of the (direct) children of a resume
+RESUME_LOADER_TAGS = [
+    tag
+    for tag in TAG_TO_RESUME_CHILD_MAP
+    if tag not in ACHIEVEMENT_TAG_TO_OWNER_TAG_MAP
+]
+
+
+def sequential_resources_loader(
+    tags_index_args_map: TagsIndexArgsMapType, results: ResultsType,
+) -> None:
+    for tag, index_args_list in tags_index_args_map.items():
+        TAG_TO_RESOURCES_GETTER_FUNCTION_MAP[tag](index_args_list, results)
+
+
+def threaded_resources_loader(
+    tags_index_args_map: TagsIndexArgsMapType,
+    results: ResultsType,
+    executor: Executor,
+) -> None:
+    # every tag writes to its own indices of `results`
+    futures = [
+        executor.submit(
+            TAG_TO_RESOURCES_GETTER_FUNCTION_MAP[tag], index_args_list, results
+        )  # noqa E501
+        for tag, index_args_list in tags_index_args_map.items()
+    ]
+
+    for future in futures:
+        future.result()
+
+
+def combined_resources_loader(
+    tags_index_args_map: TagsIndexArgsMapType,
+    results: ResultsType,
+    fields_map: Optional[Mapping[ResumeChildTagType, Set[str]]] = None,
+) -> None:
+    children_tags_map = resume_children_tags_index_args_map(tags_index_args_map)
+
+    if RESUME_FROM_ID_LOADER_TAG in tags_index_args_map:
+        TAG_TO_RESOURCES_GETTER_FUNCTION_MAP[RESUME_FROM_ID_LOADER_TAG](
+            tags_index_args_map[RESUME_FROM_ID_LOADER_TAG], results
+        )  # noqa E501
+
+    if not children_tags_map:
+        return
+
+    group_resume_children(
+        children_tags_map,
+        ResumesLogic.get_resume_children(
+            resume_child_owner_ids_map(children_tags_map), fields_map
+        ),
+        results,
+    )
+
+
+async def async_combined_resources_loader(
+    tags_index_args_map: TagsIndexArgsMapType,
+    results: ResultsType,
+    fields_map: Optional[Mapping[ResumeChildTagType, Set[str]]] = None,
+) -> None:
+    children_tags_map = resume_children_tags_index_args_map(tags_index_args_map)
+    index_user_resume_id_list = tags_index_args_map.get(
+        RESUME_FROM_ID_LOADER_TAG, []
+    )  # noqa E501
+
+    for user_id, index_resume_id_list in index_resume_id_lists_of_users(
+        index_user_resume_id_list  # type: ignore
+    ).items():  # noqa E501
+        group_into_results(
+            await ResumesLogic.async_get_resumes(
+                [resume_id for _, resume_id in index_resume_id_list], user_id
+            ),
+            index_resume_id_list,
+            results,
+            "id",
+            one=True,
+        )
+
+    if not children_tags_map:
+        return
+
+    group_resume_children(
+        children_tags_map,
+        await ResumesLogic.async_get_resume_children(
+            resume_child_owner_ids_map(children_tags_map), fields_map
+        ),
+        results,
+    )
+
+
+def resume_children_tags_index_args_map(
+    tags_index_args_map: TagsIndexArgsMapType,
+) -> TagsIndexArgsMapType:
+    """
+    The part of `tags_index_args_map` that loads children of resumes - which
+    are fetched together, in one query.
+    """
+    return {
+        tag: index_args_list
+        for tag, index_args_list in tags_index_args_map.items()
+        if tag in TAG_TO_RESUME_CHILD_MAP
+    }
+
+
+def resume_child_fields_map(
+    tags: Iterable[TagType], fields_map: Optional[TagsFieldsMapType],
+) -> Mapping[ResumeChildTagType, Set[str]]:
+    """
+    The attributes to fetch (as known to `ResumesLogic`) of the resources of
+    the loader tags `tags`. Tags without an entry in `fields_map` are fetched
+    whole.
+    """
+    fields_map = fields_map or {}
+
+    return {
+        TAG_TO_RESUME_CHILD_MAP[tag][0]: fields_map[tag]
+        for tag in tags
+        if tag in fields_map
+    }
+
+
+def resume_child_owner_ids_map(
+    tags_index_args_map: TagsIndexArgsMapType,
+) -> Mapping[ResumeChildTagType, List[UUIDType]]:
+    return {
+        TAG_TO_RESUME_CHILD_MAP[tag][0]: [
+            from_id for _, from_id in index_args_list
+        ]  # noqa E501
+        for tag, index_args_list in tags_index_args_map.items()
+    }
+
+
+def group_resume_children(
+    tags_index_args_map: TagsIndexArgsMapType,
+    resume_children_map: Mapping[ResumeChildTagType, List[Any]],  # type: ignore # noqa E501
+    results: ResultsType,
+) -> None:
+    for tag, index_args_list in tags_index_args_map.items():
+        group_resources_by_ids(
+            tag,
+            resume_children_map[TAG_TO_RESUME_CHILD_MAP[tag][0]],
+            index_args_list,
+            results,
+        )
+
+
+def group_resources_by_ids(
+    tag: TagType,
+    resources: List[Any],  # type: ignore
+    index_args_list: IndexIdListType,
+    results: ResultsType,
+) -> None:
+    """
+    Split already fetched `resources` of kind `tag` among the ids in
+    `index_args_list`, as the loader of that tag would have.
+    """
+    _, from_id_attr_name = TAG_TO_RESUME_CHILD_MAP[tag]
+
+    group_into_results(
+        resources,
+        index_args_list,
+        results,
+        from_id_attr_name,
+        one=tag == PERSONAL_INFO_FROM_RESUME_ID_LOADER_TAG,
+    )
+
+
+def make_tags_index_args_map(
+    keys: List[BatchKeyType],
+) -> TagsIndexArgsMapType:  # noqa E501
+    tags_index_args_map: MutableMapping[
+        TagType, List[Tuple[int, UUIDType]]
+    ] = {}  # noqa E501
+
+    for index, key in enumerate(keys):
+        tag, args = key
+        tags_index_args_map.setdefault(tag, []).append((index, args))
+
+    return tags_index_args_map
+
+
+def resume_tree_primes(
+    resume_ids: List[UUIDType],
+    tags: List[TagType],
+    children_map: Mapping[ResumeChildTagType, List[Any]],  # type: ignore
+) -> Iterator[Tuple[BatchKeyType, Any]]:  # type: ignore
+    """
+    The loader keys (and their values) of the children (of kinds `tags`) of
+    resumes, as fetched by `ResumesLogic.get_resume_tree`.
+    """
+    for tag in tags:
+        owner_tag = ACHIEVEMENT_TAG_TO_OWNER_TAG_MAP.get(tag)
+
+        if owner_tag is None:
+            owner_ids = resume_ids
+        else:
+            owner_ids = [
+                str(owner.id)
+                for owner in children_map.get(
+                    TAG_TO_RESUME_CHILD_MAP[owner_tag][0], []
                 )
             ]
+
+        results: ResultsType = [None] * len(owner_ids)
+
+        group_resources_by_ids(
+            tag,
+            children_map[TAG_TO_RESUME_CHILD_MAP[tag][0]],
+            list(enumerate(owner_ids)),
+            results,
+        )
+
+        for owner_id, resources in zip(owner_ids, results):
+            yield (tag, owner_id), resources
+
+
+class SelectFieldsMixin(metaclass=ABCMeta):
+    """
+    Lets a loader fetch only the attributes of resources that will be read
+    (see `select_fields`). Resources fetched that way lack the others, so
+    those loaded for a tag are dropped when more of its attributes are
+    selected.
+    """
+
+    fields_map: MutableMapping[TagType, Set[str]]
+    # tags whose resources were fetched with only the selected attributes
+    projected_tags: Set[TagType]
+
+    def init_select_fields(self) -> None:
+        self.fields_map = {}
+        self.projected_tags = set()
+
+    def select_fields(self, tag: TagType, fields: Iterable[str]) -> None:
+        """
+        Fetch (at least) attributes `fields` of the resources of loader tag
+        `tag`, instead of all their attributes.
+        """
+        fields = set(fields)
+        selected = self.fields_map.setdefault(tag, set())
+
+        if selected.issuperset(fields):
+            return
+
+        selected.update(fields)
+
+        if tag in self.projected_tags:
+            self.projected_tags.discard(tag)
+
+            for key in [key for key in self.loaded_keys() if key[0] == tag]:
+                self.clear(key)  # type: ignore
+
+    def projected_fields_map(
+        self, tags: Iterable[TagType]
+    ) -> Mapping[ResumeChildTagType, Set[str]]:
+        """
+        The attributes to fetch of the resources of loader tags `tags`.
+        """
+        tags = list(tags)
+        self.projected_tags.update(
+            tag for tag in tags if tag in self.fields_map
+        )  # noqa E501
+        return resume_child_fields_map(tags, self.fields_map)
+
+    @abstractmethod
+    def loaded_keys(self) -> Iterable[BatchKeyType]:
+        """
+        The keys whose resources the loader holds.
+        """
+
+
+class ResumeTreesMixin(SelectFieldsMixin):
+    """
+    Lets resumes loaded by id (`make_resume_from_id_loader_hash`) be loaded
+    with their children (see `load_resume_with_tree`): the children of all
+    resumes of a batch are then fetched together, in one go, whichever
+    field (alias) asked for them.
+    """
+
+    # resume keys of the batch being collected => the loader tags of the
+    # children to fetch with the resumes
+    resume_tree_tags_map: MutableMapping[BatchKeyType, Set[TagType]]
+
+    def init_resume_trees(self) -> None:
+        self.resume_tree_tags_map = {}
+
+    def add_resume_tree(
+        self, key: BatchKeyType, fields_map: TagsFieldsMapType
+    ) -> bool:  # noqa E501
+        """
+        Fetch the children (of the tags of `fields_map`) of the resume of
+        `key` with the batch loading it - `False` if the resume is loaded
+        already, and the children must be fetched on their own.
+        """
+        for tag, fields in fields_map.items():
+            self.select_fields(tag, fields)
+
+        if key not in self.resume_tree_tags_map and key in self.loaded_keys():
+            return False
+
+        self.resume_tree_tags_map.setdefault(key, set()).update(fields_map)
+        return True
+
+    def pop_resume_trees(
+        self, keys: List[BatchKeyType], results: ResultsType
+    ) -> Tuple[List[UUIDType], List[TagType]]:  # noqa E501
+        """
+        The ids of the resumes of a batch (`keys` and their `results`)
+        loaded with their children, and the tags of the children.
+        """
+        resume_ids: List[UUIDType] = []
+        tags: Set[TagType] = set()
+
+        for key, resume in zip(keys, results):
+            key_tags = self.resume_tree_tags_map.pop(key, None)
+
+            if key_tags and resume is not None:
+                resume_ids.append(str(resume.id))
+                tags.update(key_tags)
+
+        return resume_ids, sorted(tags)
+
+
+class AppDataLoader(ResumeTreesMixin, DataLoader):
+    def __init__(
+        self,
+        dispatch_mode: DispatchMode = DispatchMode.combined,
+        executor: Optional[Executor] = None,
+        **kwargs: Any,  # type: ignore
+    ) -> None:
+        """
+        `executor` runs the queries of the `threaded` dispatch mode. Each of
+        its workers must use its own database connection.
+        """
+        if dispatch_mode == DispatchMode.threaded and executor is None:
+            raise ValueError("threaded dispatch mode requires an executor")
+
+        super().__init__(**kwargs)
+        self.dispatch_mode = dispatch_mode
+        self.executor = executor
+        # Only the combined dispatch mode fetches some of the attributes of
+        # resources: the other modes fetch them whole.
+        self.init_select_fields()
+        self.init_resume_trees()
+
+    def loaded_keys(self) -> Iterable[BatchKeyType]:
+        return list(self._promise_cache)
+
+    def prime_resume_tree(
+        self,
+        resume_ids: List[UUIDType],
+        tags: Iterable[TagType],
+        fields_map: Optional[TagsFieldsMapType] = None,
+    ) -> None:
+        """
+        Fetch the children (of kinds `tags`) of resumes before graphql walks
+        the tree and prime this loader with them. Resolvers at every depth
+        are then served from memory instead of waiting on the level above.
+        `fields_map` holds the attributes to fetch per tag, as for
+        `select_fields`.
+        """
+        tags = list(tags)
+        resume_ids = [str(resume_id) for resume_id in resume_ids]
+
+        for tag, fields in (fields_map or {}).items():
+            self.select_fields(tag, fields)
+
+        children_map = ResumesLogic.get_resume_tree(
+            resume_ids,
+            [TAG_TO_RESUME_CHILD_MAP[tag][0] for tag in tags],
+            self.projected_fields_map(tags),
         )
+
+        prime_resume_tree_children(self, resume_ids, tags, children_map)
+
+    def load_resume_with_tree(
+        self, key: BatchKeyType, fields_map: TagsFieldsMapType
+    ) -> Promise:  # noqa E501
+        """
+        Load the resume of `key` and its children (of the tags of
+        `fields_map`, see `ResumeTreesMixin`).
+        """
+        if self.add_resume_tree(key, fields_map):
+            return self.load(key)
+
+        def prime_tree(resume):
+            if resume is not None and fields_map:
+                self.prime_resume_tree([resume.id], fields_map)
+
+            return resume
+
+        return self.load(key).then(prime_tree)
+
+    def batch_load_fn(self, keys: List[BatchKeyType]) -> None:
+        tags_index_args_map = make_tags_index_args_map(keys)
+        results: ResultsType = [None] * len(keys)
+
+        if self.dispatch_mode == DispatchMode.combined:
+            combined_resources_loader(
+                tags_index_args_map,
+                results,
+                self.projected_fields_map(tags_index_args_map),
+            )
+        elif self.dispatch_mode == DispatchMode.threaded:
+            threaded_resources_loader(
+                tags_index_args_map, results, self.executor  # type: ignore
+            )
+        else:
+            sequential_resources_loader(tags_index_args_map, results)
+
+        resume_ids, tags = self.pop_resume_trees(keys, results)
+
+        if resume_ids:
+            self.prime_resume_tree(resume_ids, tags)
+
+        return Promise.resolve(results)
+
+
+class AsyncAppDataLoader(ResumeTreesMixin):
+    """
+    The asyncio counterpart of `AppDataLoader` (for graphql executed with
+    `AsyncioExecutor`). `load` returns an `asyncio.Future`; keys loaded in
+    the same turn of the event loop are fetched together, in one query.
+    """
+
+    def __init__(self, loop: Optional[AbstractEventLoop] = None) -> None:
+        self.loop = loop or get_event_loop()
+        self._futures: MutableMapping[BatchKeyType, Future] = {}
+        self._queue: List[Tuple[BatchKeyType, Future]] = []
+        self.init_select_fields()
+        self.init_resume_trees()
+
+    def loaded_keys(self) -> Iterable[BatchKeyType]:
+        return list(self._futures)
+
+    def load(self, key: BatchKeyType) -> Future:
+        future = self._futures.get(key)
+
+        if future is not None:
+            return future
+
+        future = self.loop.create_future()
+        self._futures[key] = future
+
+        if not self._queue:
+            self.loop.call_soon(self._dispatch)
+
+        self._queue.append((key, future))
+        return future
+
+    def load_many(self, keys: Iterable[BatchKeyType]) -> Future:
+        return gather(*[self.load(key) for key in keys], loop=self.loop)
+
+    def prime(self, key: BatchKeyType, value: Any) -> None:  # type: ignore
+        if key not in self._futures:
+            future = self.loop.create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def clear(self, key: BatchKeyType) -> None:
+        self._futures.pop(key, None)
+
+    async def prime_resume_tree(
+        self,
+        resume_ids: List[UUIDType],
+        tags: Iterable[TagType],
+        fields_map: Optional[TagsFieldsMapType] = None,
+    ) -> None:
+        tags = list(tags)
+        resume_ids = [str(resume_id) for resume_id in resume_ids]
+
+        for tag, fields in (fields_map or {}).items():
+            self.select_fields(tag, fields)
+
+        children_map = await ResumesLogic.async_get_resume_tree(
+            resume_ids,
+            [TAG_TO_RESUME_CHILD_MAP[tag][0] for tag in tags],
+            self.projected_fields_map(tags),
+        )
+
+        prime_resume_tree_children(self, resume_ids, tags, children_map)
+
+    async def load_resume_with_tree(
+        self, key: BatchKeyType, fields_map: TagsFieldsMapType
+    ) -> Any:  # type: ignore
+        if self.add_resume_tree(key, fields_map):
+            return await self.load(key)
+
+        resume = await self.load(key)
+
+        if resume is not None and fields_map:
+            await self.prime_resume_tree([resume.id], fields_map)
+
+        return resume
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        self.loop.create_task(self._batch_load(queue))
+
+    async def _batch_load(
+        self, queue: List[Tuple[BatchKeyType, Future]]
+    ) -> None:  # noqa E501
+        try:
+            tags_index_args_map = make_tags_index_args_map(
+                [key for key, _ in queue]
+            )  # noqa E501
+
+            results: ResultsType = [None] * len(queue)
+
+            await async_combined_resources_loader(
+                tags_index_args_map,
+                results,
+                self.projected_fields_map(tags_index_args_map),
+            )
+
+            resume_ids, tags = self.pop_resume_trees(
+                [key for key, _ in queue], results
+            )  # noqa E501
+
+            if resume_ids:
+                await self.prime_resume_tree(resume_ids, tags)
+        except Exception as error:
+            for key, future in queue:
+                self.clear(key)
+                self.resume_tree_tags_map.pop(key, None)
+                future.set_exception(error)
+
+            return
+
+        for (_, future), resource in zip(queue, results):
+            future.set_result(resource)
+
+
+AnyAppDataLoader = Union[AppDataLoader, AsyncAppDataLoader]
+
+
+def prime_resume_tree_children(
+    loader: AnyAppDataLoader,
+    resume_ids: List[UUIDType],
+    tags: List[TagType],
+    children_map: Mapping[ResumeChildTagType, List[Any]],  # type: ignore
+) -> None:
+    """
+    Prime `loader` with the children (of kinds `tags`) of resumes, as
+    fetched by `ResumesLogic.get_resume_tree` or `get_full_resume`.
+    """
+    for key, resources in resume_tree_primes(resume_ids, tags, children_map):
+        loader.prime(key, resources)
+
+
+def prime_created_resume(loader: AnyAppDataLoader, resume_id: UUIDType) -> None:
+    """
+    A resume that was just created has no children: prime `loader` with
+    that so that a mutation payload selecting them does not query for them.
+    """
+    for tag in RESUME_LOADER_TAGS:
+        key = (tag, str(resume_id))
+        loader.clear(key)
+        loader.prime(
+            key, None if tag == PERSONAL_INFO_FROM_RESUME_ID_LOADER_TAG else []
+        )
+
+
+def prime_saved_resume(
+    loader: AnyAppDataLoader, full_resume: FullResume
+) -> None:  # noqa E501
+    """
+    Update `loader` after a whole resume was saved: what it holds of the
+    resume and its children is stale and is replaced with the saved tree.
+    """
+    resume, children_map = full_resume
+    resume_id = str(resume.id)
+
+    primes = [
+        (make_resume_from_id_loader_hash(resume_id, resume.user_id), resume),
+        *resume_tree_primes(
+            [resume_id], list(TAG_TO_RESUME_CHILD_MAP), children_map
+        ),
+    ]
+
+    for key, value in primes:
+        loader.clear(key)
+        loader.prime(key, value)
+
+
+def prime_reordered_resume_items(
+    loader: AnyAppDataLoader,
+    child_tag: ResumeChildTagType,
+    resume_id: UUIDType,
+) -> None:
+    """
+    The children (of kind `child_tag`) of the resume loaded before they were
+    reordered are stale.
+    """
+    loader.clear((RESUME_CHILD_TO_LOADER_TAG_MAP[child_tag], str(resume_id)))
+
+
+def prime_created_resume_child(
+    loader: AnyAppDataLoader,
+    child_tag: ResumeChildTagType,
+    child: Any,  # type: ignore
+) -> None:
+    """
+    Update `loader` after `child` (of kind `child_tag`) was created: the list
+    of children of its owner is stale and is cleared (the personal info of
+    the resume is replaced instead) and the new child has no achievements.
+    """
+    tag = RESUME_CHILD_TO_LOADER_TAG_MAP[child_tag]
+    owner_key = (tag, str(getattr(child, TAG_TO_RESUME_CHILD_MAP[tag][1])))
+    loader.clear(owner_key)
+
+    if tag == PERSONAL_INFO_FROM_RESUME_ID_LOADER_TAG:
+        loader.prime(owner_key, child)
+
+    achievements_tag = OWNER_TAG_TO_ACHIEVEMENT_TAG_MAP.get(tag)
+
+    if achievements_tag is not None:
+        key = (achievements_tag, str(child.id))
+        loader.clear(key)
+        loader.prime(key, [])
@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
 
+from asyncio import get_event_loop
 
 from graphene import ObjectType, Schema, Field
+from graphql.execution.executors.asyncio import AsyncioExecutor
 from graphene_django.debug import DjangoDebug
 
 from logics.accounts.accounts_graphql_schema import (
     AccountsCombinedMutation,
 )  # noqa
 from logics.resumes.resumes_graphql_schema import (
+    RESUMES_QUERY_MAX_ITEMS,
     ResumesCombinedMutation,
     ResumesCombinedQuery,
 )
@@ -24,3 +27,21 @@ class AppMutation(
 
 
 graphql_schema = Schema(query=AppQuery, mutation=AppMutation)
+
+# the most items the fields of `graphql_schema` taking `first` return, by
+# field name
+graphql_max_items = {**RESUMES_QUERY_MAX_ITEMS}
+
+
+async def execute_graphql_async(request_string: str, **kwargs):
+    """
+    Execute `request_string` on the running event loop. The context must
+    carry an `AsyncAppDataLoader` (as `app_data_loader`) so that resolvers
+    await the database instead of blocking the loop.
+    """
+    return await graphql_schema.execute(
+        request_string,
+        executor=AsyncioExecutor(loop=get_event_loop()),
+        return_promise=True,
+        **kwargs,
+    )
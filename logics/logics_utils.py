@@ -3,10 +3,11 @@
 import base64
 from datetime import datetime
 from time import time
-from typing import Tuple, Union
+from typing import Iterator, Mapping, Tuple, Union
 from uuid import UUID
 
 import graphene
+from graphql.language import ast
 from typing_extensions import Protocol
 
 UUIDType = Union[UUID, str]
@@ -40,3 +41,27 @@ class TimestampLike(Protocol):
 
 class UUID_IdLike(Protocol):
     id: UUID
+
+
+def iter_selected_fields(
+    selection_set: ast.SelectionSet,
+    fragments: Mapping[str, ast.FragmentDefinition],
+) -> Iterator[ast.Field]:
+    """
+    Yield the fields of a selection set, looking into fragment spreads and
+    inline fragments. `fragments` is usually `info.fragments`.
+    """
+    if selection_set is None:
+        return
+
+    for selection in selection_set.selections:
+        if isinstance(selection, ast.Field):
+            yield selection
+        elif isinstance(selection, ast.FragmentSpread):
+            yield from iter_selected_fields(
+                fragments[selection.name.value].selection_set, fragments
+            )
+        else:
+            yield from iter_selected_fields(
+                selection.selection_set, fragments
+            )  # noqa E501
@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 
-from typing import cast
+from typing import MutableMapping, Set, cast
+from uuid import UUID
 
 import graphene
+from django.conf import settings
+from graphene.relay import Connection, PageInfo
 from graphene.types import Interface, ObjectType
+from graphql import GraphQLError
+from graphene.utils.str_converters import to_snake_case
 
-from logics.logics_utils import TimestampsInterface
+from logics.logics_utils import TimestampsInterface, iter_selected_fields
 from logics.resumes import ResumesLogic
 from logics.resumes.resumes_types import (  # noqa
     PHOTO_ALREADY_UPLOADED,
@@ -18,12 +23,30 @@ from logics.resumes.resumes_types import (  # noqa
     CreateResumeComponentErrors,
     CreateSkillAttrs,
     GetResumeAttrs,
+    IndexableEnumType,
     RatableEnumType,
+    SaveResumeAttrs,
+    ResumeComponentEnumType,
     TextOnlyEnumType,
     CreateTextOnlyErrorsType,
     CreateTextOnlyAttr,
 )
 from logics.data_loader import (  # noqa E501
+    ACHIEVEMENT_FROM_EDUCATION_ID_LOADER_TAG,
+    ACHIEVEMENT_FROM_EXPERIENCE_ID_LOADER_TAG,
+    ACHIEVEMENT_FROM_SKILL_ID_LOADER_TAG,
+    EDUCATION_FROM_RESUME_ID_LOADER_TAG,
+    EXPERIENCE_FROM_RESUME_ID_LOADER_TAG,
+    HOBBY_FROM_RESUME_ID_LOADER_TAG,
+    PERSONAL_INFO_FROM_RESUME_ID_LOADER_TAG,
+    SKILL_FROM_RESUME_ID_LOADER_TAG,
+    SPOKEN_LANGUAGE_FROM_RESUME_ID_LOADER_TAG,
+    SUPPLEMENTARY_SKILL_FROM_RESUME_ID_LOADER_TAG,
+    TAG_TO_RESUME_CHILD_MAP,
+    AsyncAppDataLoader,
+    BatchKeyType,
+    TagType,
+    TagsFieldsMapType,
     make_education_from_resume_id_loader_hash,
     make_personal_info_from_resume_id_loader_hash,
     make_skill_from_resume_id_loader_hash,
@@ -34,6 +57,12 @@ from logics.data_loader import (  # noqa E501
     make_achievement_from_skill_id_loader_hash,
     make_language_from_resume_id_loader_hash,
     make_supplementary_skill_from_resume_id_loader_hash,
+    make_resume_from_id_loader_hash,
+    prime_created_resume,
+    prime_created_resume_child,
+    prime_reordered_resume_items,
+    prime_resume_tree_children,
+    prime_saved_resume,
 )
 
 
@@ -54,15 +83,38 @@ class Resume(ObjectType):
     supplementary_skills = graphene.List(lambda: Ratable)
 
     def resolve_hobbies(self, info, **args):
-        return info.context.app_data_loader.load(
-            make_hobby_from_resume_id_loader_hash(self.id)
+        return load_selected_fields(
+            info, make_hobby_from_resume_id_loader_hash(self.id)
         )
 
 
+def requested_fields(field_asts, fragments) -> Set[str]:
+    """
+    The (python) names of the fields selected on the objects of a field.
+    """
+    return {
+        to_snake_case(field.name.value)
+        for field_ast in field_asts
+        if field_ast.selection_set is not None
+        for field in iter_selected_fields(field_ast.selection_set, fragments)
+    }
+
+
+def load_selected_fields(info, key: BatchKeyType):
+    """
+    Load `key` with the data loader of the request, fetching only the
+    columns for the fields selected on the field being resolved.
+    """
+    loader = info.context.app_data_loader
+    fields = requested_fields(info.field_asts, info.fragments)
+    loader.select_fields(key[0], fields)
+    return loader.load(key)
+
+
 def make_resume_resolver_fn(hash_fn):
     return staticmethod(
-        lambda resume, info, **args: info.context.app_data_loader.load(
-            hash_fn(resume.id)
+        lambda resume, info, **args: load_selected_fields(
+            info, hash_fn(resume.id)
         )
     )
 
@@ -87,6 +139,114 @@ for resolver_name, hash_fn in (
     )
 
 
+# graphql field of `Resume` => loader tag that resolves the field
+RESUME_FIELD_TO_LOADER_TAG_MAP = {
+    "personalInfo": PERSONAL_INFO_FROM_RESUME_ID_LOADER_TAG,
+    "educations": EDUCATION_FROM_RESUME_ID_LOADER_TAG,
+    "experiences": EXPERIENCE_FROM_RESUME_ID_LOADER_TAG,
+    "hobbies": HOBBY_FROM_RESUME_ID_LOADER_TAG,
+    "skills": SKILL_FROM_RESUME_ID_LOADER_TAG,
+    "languages": SPOKEN_LANGUAGE_FROM_RESUME_ID_LOADER_TAG,
+    "supplementarySkills": SUPPLEMENTARY_SKILL_FROM_RESUME_ID_LOADER_TAG,
+}
+
+# graphql field of `Resume` => loader tag that resolves `achievements` of
+# the objects of that field
+RESUME_FIELD_TO_ACHIEVEMENTS_LOADER_TAG_MAP = {
+    "educations": ACHIEVEMENT_FROM_EDUCATION_ID_LOADER_TAG,
+    "experiences": ACHIEVEMENT_FROM_EXPERIENCE_ID_LOADER_TAG,
+    "skills": ACHIEVEMENT_FROM_SKILL_ID_LOADER_TAG,
+}
+
+
+def requested_resume_loader_fields(
+    info, field_asts=None
+) -> TagsFieldsMapType:  # noqa E501
+    """
+    The loader tags needed to resolve the selection set of the field (of
+    type `Resume`) being resolved - or of `field_asts` - and the fields
+    selected on the resources of each tag.
+    """
+    fields_map: MutableMapping[TagType, Set[str]] = {}
+
+    for field_ast in info.field_asts if field_asts is None else field_asts:
+        for field in iter_selected_fields(
+            field_ast.selection_set, info.fragments
+        ):  # noqa E501
+            name = field.name.value
+            tag = RESUME_FIELD_TO_LOADER_TAG_MAP.get(name)
+
+            if tag is None:
+                continue
+
+            fields_map.setdefault(tag, set()).update(
+                requested_fields([field], info.fragments)
+            )
+
+            achievements_tag = RESUME_FIELD_TO_ACHIEVEMENTS_LOADER_TAG_MAP.get(
+                name
+            )  # noqa E501
+
+            if achievements_tag is None:
+                continue
+
+            for child in iter_selected_fields(
+                field.selection_set, info.fragments
+            ):  # noqa E501
+                if child.name.value == "achievements":
+                    fields_map.setdefault(achievements_tag, set()).update(
+                        requested_fields([child], info.fragments)
+                    )
+
+    return fields_map
+
+
+def is_aliased_get_resume(info) -> bool:
+    """
+    Whether the operation holds other `getResume` fields (aliases) than the
+    one being resolved.
+    """
+    fields = iter_selected_fields(info.operation.selection_set, info.fragments)
+    return sum(field.name.value == "getResume" for field in fields) > 1
+
+
+def fetches_full_resume(info, params: GetResumeAttrs, fields_map) -> bool:
+    """
+    Whether to fetch the whole resume in one query - when it is looked up by
+    id (alone) and its selection covers most of the tree anyway. The resumes
+    of aliased fields are rather fetched together, by the data loader.
+    """
+    return (
+        set(params) == {"id", "user_id"}
+        and len(fields_map)
+        >= settings.GET_RESUME_FULL_FETCH_RATIO * len(TAG_TO_RESUME_CHILD_MAP)
+        and not is_aliased_get_resume(info)
+    )
+
+
+def prime_app_data_loader(info, prime_fn, *args) -> None:
+    """
+    Let the data loader of the request (if any) know about what a mutation
+    created, so that resolving the mutation payload does not query for it.
+    """
+    loader = getattr(info.context, "app_data_loader", None)
+
+    if loader is not None:
+        prime_fn(loader, *args)
+
+
+def are_resumes_of_user(info, params_list) -> bool:
+    """
+    Whether the resumes the children (of a bulk creation) are of are of the
+    user of the request - checked once for all the children.
+    """
+    user = info.context.current_user
+
+    return ResumesLogic.are_resumes_of_user(
+        user.id, {params["resume_id"] for params in params_list}
+    )
+
+
 class CreateResumeInput(graphene.InputObjectType):
     title = graphene.String(required=True)
     description = graphene.String()
@@ -115,6 +275,7 @@ class CreateResumeMutation(graphene.Mutation):
         user = info.context.current_user
         params = dict(**inputs["input"], user_id=user.id)
         resume = ResumesLogic.create_resume(cast(CreateResumeAttrs, params))
+        prime_app_data_loader(info, prime_created_resume, resume.id)
         return ResumeSuccess(resume=resume)
 
 
@@ -189,6 +350,13 @@ class CreatePersonalInfoMutation(graphene.Mutation):
             cast(CreatePersonalInfoAttrs, params)
         )
 
+        prime_app_data_loader(
+            info,
+            prime_created_resume_child,
+            ResumeComponentEnumType.personal_info,
+            result,
+        )
+
         return PersonalInfoSuccess(personal_info=result)
 
 
@@ -248,9 +416,58 @@ class CreateTextOnlyMutation(graphene.Mutation):
 
         result = ResumesLogic.create_text_only(cast(CreateTextOnlyAttr, params))
 
+        prime_app_data_loader(
+            info, prime_created_resume_child, TextOnlyEnumType(tag), result
+        )
+
         return TextOnlySuccess(text_only=result)
 
 
+class ManyTextOnlySuccess(ObjectType):
+    text_only_list = graphene.List(TextOnly)
+
+
+class CreateManyTextOnlyPayload(graphene.Union):
+    class Meta:
+        types = (ManyTextOnlySuccess, CreateTextOnlyErrors)
+
+
+class CreateManyTextOnlyMutation(graphene.Mutation):
+    class Arguments:
+        input = graphene.List(
+            graphene.NonNull(CreateTextOnlyInput), required=True
+        )  # noqa E501
+
+    Output = CreateManyTextOnlyPayload
+
+    def mutate(self, info, **args):
+        user = info.context.current_user
+        params_list = args["input"]
+        owner_ids_map: MutableMapping[TextOnlyEnumType, Set[str]] = {}
+
+        for params in params_list:
+            tag = TextOnlyEnumType(params["tag"])
+            owner_ids_map.setdefault(tag, set()).add(params["owner_id"])
+
+        for tag, owner_ids in owner_ids_map.items():
+            if not ResumesLogic.are_text_only_owners_of_user(
+                user.id, owner_ids, tag
+            ):  # noqa E501
+                errors = CreateTextOnlyErrorsType(owner="not found", tag=tag)
+                return CreateTextOnlyErrors(errors=errors)
+
+        result = ResumesLogic.create_many_text_only(
+            [cast(CreateTextOnlyAttr, dict(**params)) for params in params_list]
+        )
+
+        for text_only in result:
+            prime_app_data_loader(
+                info, prime_created_resume_child, text_only.tag, text_only
+            )
+
+        return ManyTextOnlySuccess(text_only_list=result)
+
+
 class Indexable(Interface):
     index = graphene.Int(required=True)
 
@@ -270,8 +487,8 @@ class Experience(ObjectType):
     achievements = graphene.List(lambda: TextOnly)
 
     def resolve_achievements(self, info, **args):
-        return info.context.app_data_loader.load(
-            make_achievement_from_experience_id_loader_hash(self.id)
+        return load_selected_fields(
+            info, make_achievement_from_experience_id_loader_hash(self.id)
         )
 
 
@@ -321,9 +538,58 @@ class CreateExperienceMutation(graphene.Mutation):
         if isinstance(result, CreateResumeComponentErrors):
             return CreateExperienceErrors(errors=result)
 
+        prime_app_data_loader(
+            info,
+            prime_created_resume_child,
+            ResumeComponentEnumType.experience,
+            result,
+        )
+
         return ExperienceSuccess(experience=result)
 
 
+class ExperiencesSuccess(ObjectType):
+    experiences = graphene.List(Experience)
+
+
+class CreateExperiencesPayload(graphene.Union):
+    class Meta:
+        types = (ExperiencesSuccess, CreateExperienceErrors)
+
+
+class CreateExperiencesMutation(graphene.Mutation):
+    class Arguments:
+        input = graphene.List(
+            graphene.NonNull(CreateExperienceInput), required=True
+        )  # noqa E501
+
+    Output = CreateExperiencesPayload
+
+    def mutate(self, info, **inputs):
+        params_list = inputs["input"]
+
+        if not are_resumes_of_user(info, params_list):
+            errors = CreateResumeComponentErrors(resume="not found")
+            return CreateExperienceErrors(errors=errors)
+
+        result = ResumesLogic.create_experiences(
+            [
+                cast(CreateExperienceAttrs, dict(**params))
+                for params in params_list
+            ]
+        )
+
+        for experience in result:
+            prime_app_data_loader(
+                info,
+                prime_created_resume_child,
+                ResumeComponentEnumType.experience,
+                experience,
+            )
+
+        return ExperiencesSuccess(experiences=result)
+
+
 class Education(ObjectType):
     class Meta:
         interfaces = (HasResumeIdInterface, Indexable)
@@ -335,8 +601,8 @@ class Education(ObjectType):
     achievements = graphene.List(lambda: TextOnly)
 
     def resolve_achievements(self, info, **args):
-        return info.context.app_data_loader.load(
-            make_achievement_from_education_id_loader_hash(self.id)
+        return load_selected_fields(
+            info, make_achievement_from_education_id_loader_hash(self.id)
         )
 
 
@@ -383,9 +649,58 @@ class CreateEducationMutation(graphene.Mutation):
             cast(CreateEducationAttrs, params)
         )  # noqa
 
+        prime_app_data_loader(
+            info,
+            prime_created_resume_child,
+            ResumeComponentEnumType.education,
+            result,
+        )
+
         return EducationSuccess(education=result)
 
 
+class EducationsSuccess(ObjectType):
+    educations = graphene.List(Education)
+
+
+class CreateEducationsPayload(graphene.Union):
+    class Meta:
+        types = (EducationsSuccess, CreateEducationErrors)
+
+
+class CreateEducationsMutation(graphene.Mutation):
+    class Arguments:
+        input = graphene.List(
+            graphene.NonNull(CreateEducationInput), required=True
+        )  # noqa E501
+
+    Output = CreateEducationsPayload
+
+    def mutate(self, info, **inputs):
+        params_list = inputs["input"]
+
+        if not are_resumes_of_user(info, params_list):
+            errors = CreateResumeComponentErrors(resume="not found")
+            return CreateEducationErrors(errors=errors)
+
+        result = ResumesLogic.create_educations(
+            [
+                cast(CreateEducationAttrs, dict(**params))
+                for params in params_list
+            ]
+        )
+
+        for education in result:
+            prime_app_data_loader(
+                info,
+                prime_created_resume_child,
+                ResumeComponentEnumType.education,
+                education,
+            )
+
+        return EducationsSuccess(educations=result)
+
+
 class Skill(ObjectType):
     class Meta:
         interfaces = (HasResumeIdInterface, Indexable)
@@ -394,8 +709,8 @@ class Skill(ObjectType):
     achievements = graphene.List(lambda: TextOnly)
 
     def resolve_achievements(self, info, **args):
-        return info.context.app_data_loader.load(
-            make_achievement_from_skill_id_loader_hash(self.id)
+        return load_selected_fields(
+            info, make_achievement_from_skill_id_loader_hash(self.id)
         )
 
 
@@ -437,9 +752,55 @@ class CreateSkillMutation(graphene.Mutation):
 
         result = ResumesLogic.create_skill(cast(CreateSkillAttrs, params))
 
+        prime_app_data_loader(
+            info,
+            prime_created_resume_child,
+            ResumeComponentEnumType.skill,
+            result,
+        )
+
         return SkillSuccess(skill=result)
 
 
+class SkillsSuccess(ObjectType):
+    skills = graphene.List(Skill)
+
+
+class CreateSkillsPayload(graphene.Union):
+    class Meta:
+        types = (SkillsSuccess, CreateSkillErrors)
+
+
+class CreateSkillsMutation(graphene.Mutation):
+    class Arguments:
+        input = graphene.List(
+            graphene.NonNull(CreateSkillInput), required=True
+        )  # noqa E501
+
+    Output = CreateSkillsPayload
+
+    def mutate(self, info, **inputs):
+        params_list = inputs["input"]
+
+        if not are_resumes_of_user(info, params_list):
+            errors = CreateResumeComponentErrors(resume="not found")
+            return CreateSkillErrors(errors=errors)
+
+        result = ResumesLogic.create_skills(
+            [cast(CreateSkillAttrs, dict(**params)) for params in params_list]
+        )
+
+        for skill in result:
+            prime_app_data_loader(
+                info,
+                prime_created_resume_child,
+                ResumeComponentEnumType.skill,
+                skill,
+            )
+
+        return SkillsSuccess(skills=result)
+
+
 RatableEnum = graphene.Enum.from_enum(RatableEnumType)
 
 
@@ -498,9 +859,172 @@ class CreateRatableMutation(graphene.Mutation):
 
         result = ResumesLogic.create_ratable(cast(CreateRatableAttrs, params))
 
+        prime_app_data_loader(
+            info, prime_created_resume_child, result.tag, result
+        )  # noqa E501
+
         return RatableSuccess(ratable=result)
 
 
+IndexableEnum = graphene.Enum.from_enum(IndexableEnumType)
+
+
+class ReorderResumeItemsSuccess(ObjectType):
+    resume = graphene.Field(Resume)
+
+
+class ReorderResumeItemsErrors(ObjectType):
+    errors = graphene.Field(ResumeChildErrors)
+
+
+class ReorderResumeItemsPayload(graphene.Union):
+    class Meta:
+        types = (ReorderResumeItemsSuccess, ReorderResumeItemsErrors)
+
+
+class ReorderResumeItemsMutation(graphene.Mutation):
+    class Arguments:
+        resume_id = graphene.ID(required=True)
+        kind = IndexableEnum(required=True)
+        # of all the children of that kind, in their new order
+        ids = graphene.List(graphene.NonNull(graphene.ID), required=True)
+
+    Output = ReorderResumeItemsPayload
+
+    def mutate(self, info, resume_id, kind, ids):
+        user = info.context.current_user
+
+        resume = ResumesLogic.get_resume(
+            GetResumeAttrs(user_id=user.id, id=resume_id)
+        )
+
+        if resume is None:
+            errors = CreateResumeComponentErrors(resume="not found")
+            return ReorderResumeItemsErrors(errors=errors)
+
+        tag = IndexableEnumType(kind)
+
+        if not ResumesLogic.reorder_resume_items(resume.id, tag, ids):
+            errors = CreateResumeComponentErrors(
+                error="ids must be those of all the items of the kind"
+            )  # noqa E501
+            return ReorderResumeItemsErrors(errors=errors)
+
+        prime_app_data_loader(
+            info,
+            prime_reordered_resume_items,
+            ResumeComponentEnumType(tag.value),
+            resume.id,
+        )
+
+        return ReorderResumeItemsSuccess(resume=resume)
+
+
+class TextOnlyDocumentInput(graphene.InputObjectType):
+    id = graphene.ID()
+    text = graphene.String(required=True)
+
+
+class RatableDocumentInput(graphene.InputObjectType):
+    id = graphene.ID()
+    description = graphene.String(required=True)
+    level = graphene.String()
+
+
+class PersonalInfoDocumentInput(graphene.InputObjectType):
+    first_name = graphene.String()
+    last_name = graphene.String()
+    profession = graphene.String()
+    address = graphene.String()
+    email = graphene.String()
+    phone = graphene.String()
+    date_of_birth = graphene.String()
+    photo = graphene.String()
+
+
+class EducationDocumentInput(graphene.InputObjectType):
+    id = graphene.ID()
+    school = graphene.String()
+    course = graphene.String()
+    from_date = graphene.String()
+    to_date = graphene.String()
+    achievements = graphene.List(graphene.NonNull(TextOnlyDocumentInput))
+
+
+class ExperienceDocumentInput(graphene.InputObjectType):
+    id = graphene.ID()
+    position = graphene.String()
+    company_name = graphene.String()
+    from_date = graphene.String()
+    to_date = graphene.String()
+    achievements = graphene.List(graphene.NonNull(TextOnlyDocumentInput))
+
+
+class SkillDocumentInput(graphene.InputObjectType):
+    id = graphene.ID()
+    description = graphene.String()
+    achievements = graphene.List(graphene.NonNull(TextOnlyDocumentInput))
+
+
+class SaveResumeInput(graphene.InputObjectType):
+    """
+    A whole resume: children are indexed in the order of their list and
+    children with the `id` of a stored one are saved over it. Lists left
+    out (or `null`) are not written. Hobbies, languages, supplementary
+    skills and achievements have no index: when their order changes, those
+    from the first one moved are saved under new ids.
+    """
+
+    id = graphene.ID()
+    title = graphene.String(required=True)
+    description = graphene.String()
+    personal_info = graphene.Field(PersonalInfoDocumentInput)
+    educations = graphene.List(graphene.NonNull(EducationDocumentInput))
+    experiences = graphene.List(graphene.NonNull(ExperienceDocumentInput))
+    skills = graphene.List(graphene.NonNull(SkillDocumentInput))
+    hobbies = graphene.List(graphene.NonNull(TextOnlyDocumentInput))
+    languages = graphene.List(graphene.NonNull(RatableDocumentInput))
+    supplementary_skills = graphene.List(
+        graphene.NonNull(RatableDocumentInput)
+    )  # noqa E501
+
+
+class SavedResumeSuccess(ObjectType):
+    resume = graphene.Field(Resume)
+    # of the resume once saved - as in its ETag
+    version = graphene.Int(required=True)
+
+
+class SaveResumeErrors(ObjectType):
+    errors = graphene.Field(ResumeChildErrors)
+
+
+class SaveResumePayload(graphene.Union):
+    class Meta:
+        types = (SavedResumeSuccess, SaveResumeErrors)
+
+
+class SaveResumeMutation(graphene.Mutation):
+    class Arguments:
+        input = SaveResumeInput(required=True)
+
+    Output = SaveResumePayload
+
+    def mutate(self, info, **inputs):
+        user = info.context.current_user
+        params = dict(**inputs["input"], user_id=user.id)
+        result = ResumesLogic.save_resume(cast(SaveResumeAttrs, params))
+
+        if isinstance(result, CreateResumeComponentErrors):
+            return SaveResumeErrors(errors=result)
+
+        prime_app_data_loader(info, prime_saved_resume, result.full_resume)
+
+        return SavedResumeSuccess(
+            resume=result.full_resume.resume, version=result.version
+        )
+
+
 class GetResumeInput(graphene.InputObjectType):
     id = graphene.String()
     title = graphene.String()
@@ -514,14 +1038,330 @@ class ResumesCombinedMutation(ObjectType):
     create_skill = CreateSkillMutation.Field()
     create_ratable = CreateRatableMutation.Field()
     create_text_only = CreateTextOnlyMutation.Field()
+    create_experiences = CreateExperiencesMutation.Field()
+    create_educations = CreateEducationsMutation.Field()
+    create_skills = CreateSkillsMutation.Field()
+    create_many_text_only = CreateManyTextOnlyMutation.Field()
+    save_resume = SaveResumeMutation.Field()
+    reorder_resume_items = ReorderResumeItemsMutation.Field()
+
+
+class ResumeConnection(Connection):
+    class Meta:
+        node = Resume
+
+
+# page size of `listResumes` when `first` is not given, and its maximum
+LIST_RESUMES_DEFAULT_PAGE_SIZE = 20
+LIST_RESUMES_MAX_PAGE_SIZE = 100
+
+
+def resume_connection_node_field_asts(info):
+    """
+    The `node` fields (of type `Resume`) selected in the `edges` of the
+    connection field being resolved.
+    """
+    return [
+        node
+        for field_ast in info.field_asts
+        for edges in iter_selected_fields(
+            field_ast.selection_set, info.fragments
+        )  # noqa E501
+        if edges.name.value == "edges"
+        for node in iter_selected_fields(edges.selection_set, info.fragments)
+        if node.name.value == "node"
+    ]
+
+
+def list_resumes_page_args(first, after):
+    if first < 0:
+        raise GraphQLError("first must not be negative")
+
+    if after is not None:
+        try:
+            after = UUID(after)
+        except ValueError:
+            raise GraphQLError("invalid cursor")
+
+    return min(first, LIST_RESUMES_MAX_PAGE_SIZE), after
+
+
+def make_resume_connection(resumes, page_size, after):
+    """
+    `resumes` holds the page - and one more resume if there is a next page.
+    """
+    edges = [
+        ResumeConnection.Edge(node=resume, cursor=str(resume.id))
+        for resume in resumes[:page_size]
+    ]
+
+    return ResumeConnection(
+        edges=edges,
+        page_info=PageInfo(
+            has_next_page=len(resumes) > page_size,
+            has_previous_page=after is not None,
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+    )
+
+
+# number of resumes `searchResumes` returns when `first` is not given, and
+# its maximum
+SEARCH_RESUMES_DEFAULT_SIZE = 20
+SEARCH_RESUMES_MAX_SIZE = 100
+
+# number of titles `suggestResumeTitles` returns when `first` is not given,
+# and its maximum
+SUGGEST_RESUME_TITLES_DEFAULT_SIZE = 10
+SUGGEST_RESUME_TITLES_MAX_SIZE = 50
+
+# the most items the fields taking `first` return, by field name (see
+# `server/graphql_cost.py`)
+RESUMES_QUERY_MAX_ITEMS = {
+    "listResumes": LIST_RESUMES_MAX_PAGE_SIZE,
+    "searchResumes": SEARCH_RESUMES_MAX_SIZE,
+    "suggestResumeTitles": SUGGEST_RESUME_TITLES_MAX_SIZE,
+}
 
 
 class ResumesCombinedQuery(object):
     get_resume = graphene.Field(Resume, input=GetResumeInput(required=True))
 
+    get_resumes = graphene.List(
+        Resume, ids=graphene.List(graphene.NonNull(graphene.ID), required=True)
+    )
+
+    list_resumes = graphene.Field(
+        ResumeConnection,
+        first=graphene.Int(default_value=LIST_RESUMES_DEFAULT_PAGE_SIZE),
+        after=graphene.String(),
+    )
+
+    search_resumes = graphene.List(
+        Resume,
+        query=graphene.String(required=True),
+        first=graphene.Int(default_value=SEARCH_RESUMES_DEFAULT_SIZE),
+    )
+
+    suggest_resume_titles = graphene.List(
+        Resume,
+        query=graphene.String(required=True),
+        first=graphene.Int(default_value=SUGGEST_RESUME_TITLES_DEFAULT_SIZE),
+    )
+
+    def resolve_suggest_resume_titles(self, info, query, first):
+        user = info.context.current_user
+
+        if first < 0:
+            raise GraphQLError("first must not be negative")
+
+        first = min(first, SUGGEST_RESUME_TITLES_MAX_SIZE)
+
+        if isinstance(info.context.app_data_loader, AsyncAppDataLoader):
+            return ResumesLogic.async_suggest_resume_titles(
+                user.id, query, first
+            )  # noqa E501
+
+        return ResumesLogic.suggest_resume_titles(user.id, query, first)
+
+    def resolve_search_resumes(self, info, query, first):
+        user = info.context.current_user
+
+        if first < 0:
+            raise GraphQLError("first must not be negative")
+
+        first = min(first, SEARCH_RESUMES_MAX_SIZE)
+        fields_map = requested_resume_loader_fields(info)
+
+        if isinstance(info.context.app_data_loader, AsyncAppDataLoader):
+            return async_resolve_search_resumes(
+                info, user.id, query, first, fields_map
+            )  # noqa E501
+
+        resumes = ResumesLogic.search_resumes(user.id, query, first)
+
+        return prime_resume_trees(info, resumes, fields_map)
+
+    def resolve_list_resumes(self, info, first, after=None):
+        user = info.context.current_user
+        page_size, after = list_resumes_page_args(first, after)
+
+        if isinstance(info.context.app_data_loader, AsyncAppDataLoader):
+            return async_resolve_list_resumes(info, user.id, page_size, after)
+
+        # one more resume tells whether there is a next page
+        resumes = ResumesLogic.list_resumes(user.id, page_size + 1, after)
+        fields_map = requested_resume_loader_fields(
+            info, resume_connection_node_field_asts(info)
+        )
+
+        if fields_map and resumes:
+            # the children of the whole page, in one go
+            info.context.app_data_loader.prime_resume_tree(
+                [resume.id for resume in resumes[:page_size]],
+                fields_map,
+                fields_map,
+            )
+
+        return make_resume_connection(resumes, page_size, after)
+
     def resolve_get_resume(self, info, **args):
         user = info.context.current_user
         _params = args["input"]
         _params["user_id"] = user.id
+
+        if isinstance(info.context.app_data_loader, AsyncAppDataLoader):
+            return async_resolve_get_resume(info, cast(GetResumeAttrs, _params))
+
+        fields_map = requested_resume_loader_fields(info)
+
+        if fetches_full_resume(info, cast(GetResumeAttrs, _params), fields_map):
+            get_full_resume = (
+                ResumesLogic.get_resume_snapshot
+                if settings.GET_RESUME_FROM_SNAPSHOT
+                else ResumesLogic.get_full_resume
+            )
+
+            full_resume = get_full_resume(_params["id"], user.id)
+
+            return prime_full_resume(info, full_resume)
+
+        if set(_params) == {"id", "user_id"}:
+            # batched with the resumes of other fields (aliases) - and so are
+            # their children
+            return info.context.app_data_loader.load_resume_with_tree(
+                make_resume_from_id_loader_hash(_params["id"], user.id),
+                fields_map,
+            )
+
         resume = ResumesLogic.get_resume(cast(GetResumeAttrs, _params))
+
+        if resume is None:
+            return None
+
+        if fields_map:
+            info.context.app_data_loader.prime_resume_tree(
+                [resume.id], fields_map, fields_map
+            )
+
         return resume
+
+    def resolve_get_resumes(self, info, ids):
+        user = info.context.current_user
+        loader = info.context.app_data_loader
+        keys = [make_resume_from_id_loader_hash(id, user.id) for id in ids]
+        fields_map = requested_resume_loader_fields(info)
+
+        if isinstance(loader, AsyncAppDataLoader):
+            return async_resolve_get_resumes(info, keys, fields_map)
+
+        return loader.load_many(keys).then(
+            lambda resumes: prime_resume_trees(info, resumes, fields_map)
+        )
+
+
+def prime_resume_trees(info, resumes, fields_map):
+    """
+    Fetch the children of all `resumes` in one go, then return `resumes`.
+    """
+    resume_ids = [resume.id for resume in resumes if resume is not None]
+
+    if fields_map and resume_ids:
+        info.context.app_data_loader.prime_resume_tree(
+            resume_ids, fields_map, fields_map
+        )
+
+    return resumes
+
+
+async def async_resolve_search_resumes(info, user_id, query, first, fields_map):
+    resumes = await ResumesLogic.async_search_resumes(user_id, query, first)
+
+    if fields_map and resumes:
+        await info.context.app_data_loader.prime_resume_tree(
+            [resume.id for resume in resumes], fields_map, fields_map
+        )
+
+    return resumes
+
+
+async def async_resolve_get_resumes(info, keys, fields_map):
+    loader = info.context.app_data_loader
+    resumes = await loader.load_many(keys)
+    resume_ids = [resume.id for resume in resumes if resume is not None]
+
+    if fields_map and resume_ids:
+        await loader.prime_resume_tree(resume_ids, fields_map, fields_map)
+
+    return resumes
+
+
+def prime_full_resume(info, full_resume):
+    if full_resume is None:
+        return None
+
+    resume, children_map = full_resume
+
+    prime_resume_tree_children(
+        info.context.app_data_loader,
+        [str(resume.id)],
+        list(TAG_TO_RESUME_CHILD_MAP),
+        children_map,
+    )
+
+    return resume
+
+
+async def async_resolve_list_resumes(info, user_id, page_size, after):
+    resumes = await ResumesLogic.async_list_resumes(
+        user_id, page_size + 1, after
+    )  # noqa E501
+
+    fields_map = requested_resume_loader_fields(
+        info, resume_connection_node_field_asts(info)
+    )
+
+    if fields_map and resumes:
+        await info.context.app_data_loader.prime_resume_tree(
+            [resume.id for resume in resumes[:page_size]],
+            fields_map,
+            fields_map,
+        )
+
+    return make_resume_connection(resumes, page_size, after)
+
+
+async def async_resolve_get_resume(info, params: GetResumeAttrs):
+    fields_map = requested_resume_loader_fields(info)
+
+    if fetches_full_resume(info, params, fields_map):
+        async_get_full_resume = (
+            ResumesLogic.async_get_resume_snapshot
+            if settings.GET_RESUME_FROM_SNAPSHOT
+            else ResumesLogic.async_get_full_resume
+        )
+
+        full_resume = await async_get_full_resume(
+            params["id"], params["user_id"]
+        )  # noqa E501
+
+        return prime_full_resume(info, full_resume)
+
+    if set(params) == {"id", "user_id"}:
+        return await info.context.app_data_loader.load_resume_with_tree(
+            make_resume_from_id_loader_hash(params["id"], params["user_id"]),
+            fields_map,
+        )
+
+    resume = await ResumesLogic.async_get_resume(params)
+
+    if resume is None:
+        return None
+
+    if fields_map:
+        await info.context.app_data_loader.prime_resume_tree(
+            [resume.id], fields_map, fields_map
+        )
+
+    return resume
@@ -6,7 +6,16 @@ import re
 from abc import ABCMeta, abstractstaticmethod
 from enum import Enum
 from time import time
-from typing import List, NamedTuple, Optional, Tuple, Union
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from mypy_extensions import TypedDict
 from typing_extensions import Protocol
@@ -30,6 +39,24 @@ class TextOnlyEnumType(Enum):
     skill_achievement = "skill_achievement"
 
 
+class IndexableEnumType(Enum):
+    education = "education"
+    experience = "experience"
+    skill = "skill"
+
+
+class ResumeComponentEnumType(Enum):
+    personal_info = "personal_info"
+    education = "education"
+    experience = "experience"
+    skill = "skill"
+
+
+ResumeChildTagType = Union[
+    ResumeComponentEnumType, RatableEnumType, TextOnlyEnumType
+]  # noqa E501
+
+
 class ResumesLogicInterface(metaclass=ABCMeta):
     __slots__ = ()
 
@@ -57,6 +84,63 @@ class ResumesLogicInterface(metaclass=ABCMeta):
     def get_resume(params: GetResumeAttrs) -> MaybeResume:
         pass
 
+    @staticmethod
+    @abstractstaticmethod
+    def get_resumes(
+        ids: List[UUIDType], user_id: UUIDType
+    ) -> List[ResumeLike]:  # noqa E501
+        """
+        The resumes of user `user_id` with ids `ids`, in one query. Ids that
+        are not UUIDs match no resume.
+        """
+
+    @staticmethod
+    @abstractstaticmethod
+    def list_resumes(
+        user_id: UUIDType, first: int, after: Optional[UUIDType] = None
+    ) -> List[ResumeLike]:
+        """
+        At most `first` resumes of the user, newest first, starting after
+        the resume with id `after`. Ids are ULIDs - they sort in the order
+        resumes were created - so the page is read off the index of the
+        user's resume ids, however deep it is.
+        """
+
+    @staticmethod
+    @abstractstaticmethod
+    def search_resumes(
+        user_id: UUIDType, query: str, first: int
+    ) -> List[ResumeLike]:  # noqa E501
+        """
+        At most `first` resumes of the user whose title, description or
+        children match `query` - a web search style query: words, "quoted
+        phrases", `or` and `-word` - best matches first.
+        """
+
+    @staticmethod
+    @abstractstaticmethod
+    def suggest_resume_titles(
+        user_id: UUIDType, query: str, first: int
+    ) -> List[ResumeLike]:  # noqa E501
+        """
+        At most `first` resumes of the user whose title starts with `query`
+        (whatever the case) - for completing titles as they are typed. Where
+        the database supports it, titles with a word like `query` (typos
+        included) come after those.
+        """
+
+    @staticmethod
+    @abstractstaticmethod
+    def get_resume_versions(
+        ids: List[UUIDType], user_id: UUIDType
+    ) -> Mapping[str, int]:  # noqa E501
+        """
+        The version of each resume (by id) of the user with its id in `ids`,
+        in one query. A version is bumped on every write to the resume or
+        its children. Resumes not found, not of the user or not versioned
+        yet are left out.
+        """
+
     @staticmethod
     @abstractstaticmethod
     def create_experience(
@@ -81,6 +165,42 @@ class ResumesLogicInterface(metaclass=ABCMeta):
     def create_ratable(params: CreateRatableAttrs) -> CreateRatableReturnType:
         pass
 
+    # The bulk creators insert all their children in one statement, in one
+    # transaction, and return them in the order of `params_list`. As with
+    # the single creators, callers check the owners are of the user first.
+
+    @staticmethod
+    @abstractstaticmethod
+    def create_experiences(
+        params_list: List[CreateExperienceAttrs],
+    ) -> List[ExperienceLike]:  # noqa E501
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    def create_educations(
+        params_list: List[CreateEducationAttrs],
+    ) -> List[EducationLike]:  # noqa E501
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    def create_skills(params_list: List[CreateSkillAttrs]) -> List[SkillLike]:
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    def are_resumes_of_user(
+        user_id: UUIDType, resume_ids: Iterable[UUIDType]
+    ) -> bool:  # noqa E501
+        """
+        Whether all the resumes exist and are of the user - in one query.
+        """
+
+    # The getters of children return the children of an owner together, in
+    # the order of their `index` (or of creation for kinds without one). The
+    # data loader relies on this to split them among owners in one pass.
+
     @staticmethod
     @abstractstaticmethod
     def get_personal_infos(
@@ -108,6 +228,25 @@ class ResumesLogicInterface(metaclass=ABCMeta):
     def create_text_only(attrs: CreateTextOnlyAttr) -> CreateTextOnlyReturnType:
         pass
 
+    @staticmethod
+    @abstractstaticmethod
+    def create_many_text_only(
+        params_list: List[CreateTextOnlyAttr],
+    ) -> List[TextOnlyLike]:  # noqa E501
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    def are_text_only_owners_of_user(
+        user_id: UUIDType,
+        owner_ids: Iterable[UUIDType],
+        tag: TextOnlyEnumType,
+    ) -> bool:
+        """
+        Whether all the owners (of text only children of kind `tag`) exist
+        and are of the user - in one query.
+        """
+
     @staticmethod
     @abstractstaticmethod
     def get_many_text_only(
@@ -129,6 +268,201 @@ class ResumesLogicInterface(metaclass=ABCMeta):
     ) -> List[Ratable]:  # noqa E501
         pass
 
+    @staticmethod
+    @abstractstaticmethod
+    def get_resume_children(
+        owner_ids_map: Mapping[ResumeChildTagType, List[UUIDType]],
+        fields_map: Optional[Mapping[ResumeChildTagType, Iterable[str]]] = None,
+    ) -> Mapping[ResumeChildTagType, List[ResumeChildLike]]:
+        """
+        Fetch the children of several kinds in one round trip. Keys of
+        `owner_ids_map` are the kinds to fetch and values are the ids of the
+        owners (resume, education, experience or skill) of those children.
+        `fields_map` holds, per kind, the only attributes that will be read
+        - so the other columns need not be fetched.
+        """
+
+    @staticmethod
+    @abstractstaticmethod
+    def get_resume_tree(
+        resume_ids: List[UUIDType],
+        tags: Iterable[ResumeChildTagType],
+        fields_map: Optional[Mapping[ResumeChildTagType, Iterable[str]]] = None,
+    ) -> Mapping[ResumeChildTagType, List[ResumeChildLike]]:
+        """
+        Fetch the children of kinds `tags` of the resumes - including the
+        achievements of their educations, experiences and skills - without
+        waiting for the parent rows first. `fields_map` is as for
+        `get_resume_children`.
+        """
+
+    @staticmethod
+    @abstractstaticmethod
+    def get_full_resume(
+        id: UUIDType, user_id: UUIDType
+    ) -> Optional[FullResume]:  # noqa E501
+        """
+        Fetch the resume of the user and all its children (of every kind),
+        whole, in a single query.
+        """
+
+    @staticmethod
+    @abstractstaticmethod
+    def reorder_resume_items(
+        resume_id: UUIDType, tag: IndexableEnumType, ids: List[UUIDType]
+    ) -> bool:  # noqa E501
+        """
+        Index the children (of kind `tag`) of the resume in the order of
+        `ids`, in one statement. Nothing is written, and `False` returned,
+        unless `ids` are those of all the children of that kind of the
+        resume.
+        """
+
+    @staticmethod
+    @abstractstaticmethod
+    def save_resume(params: SaveResumeAttrs) -> SaveResumeReturnType:
+        """
+        Write the resume of the user and its children in one transaction,
+        as a whole document. Only what differs from the stored rows is
+        written: for each table, new children are inserted, changed ones
+        updated and those left out deleted - in at most one statement each.
+        Children are indexed in the order of their list - those without an
+        index are ordered by id, and get new ids when moved. Lists of
+        children not in `params` (or `None`) are left as they are; so are
+        the achievements of children without `achievements`.
+        """
+
+    @staticmethod
+    @abstractstaticmethod
+    def get_resume_snapshot(
+        id: UUIDType, user_id: UUIDType
+    ) -> Optional[FullResume]:  # noqa E501
+        """
+        As `get_full_resume`, but read from the snapshot of the resume - a
+        single document kept up to date by the write methods above.
+        """
+
+    # Async versions of the getters above, for the asyncio execution path.
+    # They must not block the event loop.
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_resume(params: GetResumeAttrs) -> MaybeResume:
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_resumes(
+        ids: List[UUIDType], user_id: UUIDType
+    ) -> List[ResumeLike]:  # noqa E501
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_list_resumes(
+        user_id: UUIDType, first: int, after: Optional[UUIDType] = None
+    ) -> List[ResumeLike]:
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_search_resumes(
+        user_id: UUIDType, query: str, first: int
+    ) -> List[ResumeLike]:  # noqa E501
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_suggest_resume_titles(
+        user_id: UUIDType, query: str, first: int
+    ) -> List[ResumeLike]:  # noqa E501
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_resume_versions(
+        ids: List[UUIDType], user_id: UUIDType
+    ) -> Mapping[str, int]:  # noqa E501
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_personal_infos(
+        resume_ids: List[UUIDType],
+    ) -> List[PersonalInfoLike]:  # noqa E501
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_educations(
+        resume_ids: List[UUIDType],
+    ) -> List[EducationLike]:  # noqa E501
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_skills(resume_ids: List[UUIDType]) -> List[SkillLike]:
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_experiences(
+        resume_ids: List[UUIDType],
+    ) -> List[ExperienceLike]:  # noqa E501
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_many_text_only(
+        owner_ids: List[UUIDType], tag: TextOnlyEnumType,
+    ) -> List[TextOnlyLike]:
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_text_only_owner(
+        owner_id: UUIDType, tag: TextOnlyEnumType,
+    ) -> Optional[TextOnlyOwnersUnion]:
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_ratables(
+        owner_ids: List[UUIDType], tag: RatableEnumType,
+    ) -> List[Ratable]:  # noqa E501
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_resume_children(
+        owner_ids_map: Mapping[ResumeChildTagType, List[UUIDType]],
+        fields_map: Optional[Mapping[ResumeChildTagType, Iterable[str]]] = None,
+    ) -> Mapping[ResumeChildTagType, List[ResumeChildLike]]:
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_resume_tree(
+        resume_ids: List[UUIDType],
+        tags: Iterable[ResumeChildTagType],
+        fields_map: Optional[Mapping[ResumeChildTagType, Iterable[str]]] = None,
+    ) -> Mapping[ResumeChildTagType, List[ResumeChildLike]]:
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_full_resume(
+        id: UUIDType, user_id: UUIDType
+    ) -> Optional[FullResume]:  # noqa E501
+        pass
+
+    @staticmethod
+    @abstractstaticmethod
+    async def async_get_resume_snapshot(
+        id: UUIDType, user_id: UUIDType
+    ) -> Optional[FullResume]:  # noqa E501
+        pass
+
 
 def uniquify_resume_title(title: str) -> str:
     matched = RESUME_TITLE_WITH_TIME.match(title)
@@ -353,4 +687,54 @@ TextOnlyOwnersUnion = Union[
     ResumeLike, EducationLike, ExperienceLike, SkillLike
 ]  # noqa E501
 
+ResumeChildLike = Union[
+    PersonalInfoLike,
+    EducationLike,
+    ExperienceLike,
+    SkillLike,
+    Ratable,
+    TextOnlyLike,
+]  # noqa E501
+
+
+class FullResume(NamedTuple):
+    resume: ResumeLike
+    # kind of child => the children of that kind, as `get_resume_tree`
+    children_map: Mapping[ResumeChildTagType, List[ResumeChildLike]]
+
+
+############################ SAVE RESUME ############################## noqa
+
+# A child in the document of a saved resume: the values of its columns, with
+# the `id` of a stored child to write over it. Educations, experiences and
+# skills may hold the documents of their `achievements`.
+ResumeChildDocument = Mapping[str, Any]  # type: ignore
+
+
+class SaveResumeRequiredAttrs(TypedDict):
+    user_id: UUIDType
+    title: str
+
+
+class SaveResumeAttrs(SaveResumeRequiredAttrs, total=False):
+    # of the resume to save over - a resume is created without
+    id: UUIDType
+    description: str
+    personal_info: ResumeChildDocument
+    educations: List[ResumeChildDocument]
+    experiences: List[ResumeChildDocument]
+    skills: List[ResumeChildDocument]
+    hobbies: List[ResumeChildDocument]
+    languages: List[ResumeChildDocument]
+    supplementary_skills: List[ResumeChildDocument]
+
+
+class SavedResume(NamedTuple):
+    full_resume: FullResume
+    # of the snapshot of the resume, once saved
+    version: int
+
+
+SaveResumeReturnType = Union[SavedResume, CreateResumeComponentErrors]
+
 ############################ END TEST ONLY LIKE ####################### noqa
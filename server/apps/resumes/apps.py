@@ -1,5 +1,12 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class ResumesConfig(AppConfig):
     name = "server.apps.resumes"
+
+    def ready(self):
+        # writes to resumes invalidate the cached graphql responses
+        from server.response_cache import check_responses_cache
+
+        checks.register(check_responses_cache, checks.Tags.caches)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import django.contrib.postgres.fields.jsonb
+import django.db.models.deletion
+from django.db import migrations, models
+
+from server.migration_utils import add_fkey, insert_missing_resume_snapshots
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("accounts", "0001_initial"), ("resumes", "0001_initial")]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResumeSnapshot",
+            fields=[
+                (
+                    "resume",
+                    models.OneToOneField(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="snapshot",
+                        serialize=False,
+                        to="resumes.Resumes",
+                    ),
+                ),
+                (
+                    "document",
+                    django.contrib.postgres.fields.jsonb.JSONField(),
+                ),  # noqa
+                ("version", models.IntegerField(default=1)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        db_index=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        to="accounts.User",
+                    ),
+                ),
+            ],
+            options={"db_table": "resume_snapshots"},
+        ),
+        migrations.RunSQL(
+            f"""
+                {add_fkey("resume_snapshots", "resume_id", "resumes", "id")}
+
+                {add_fkey("resume_snapshots", "user_id", "users", "id")}
+            """
+        ),
+        migrations.RunSQL(
+            insert_missing_resume_snapshots(), migrations.RunSQL.noop
+        ),
+    ]
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("resumes", "0002_resume_snapshots")]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="resumes",
+            index=models.Index(
+                fields=["user", "id"], name="resumes_user_id_id_index"
+            ),  # noqa
+        ),
+        migrations.RemoveIndex(
+            model_name="resumes", name="resumes_user_id_index"
+        ),
+    ]
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+from server.apps.resumes.resumes_search import resume_search_vector_sql
+from server.migration_utils import insert_missing_resume_snapshots
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("resumes", "0003_resumes_user_id_id_index")]
+
+    operations = [
+        migrations.AddField(
+            model_name="resumesnapshot",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(null=True),
+        ),
+        migrations.AddIndex(
+            model_name="resumesnapshot",
+            index=models.Index(
+                fields=["user"], name="resume_snapshots_user_id_index"
+            ),  # noqa
+        ),
+        migrations.AddIndex(
+            model_name="resumesnapshot",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"],
+                name="resume_snapshots_search_index",
+            ),
+        ),
+        # resumes without snapshots would not be found by searches
+        migrations.RunSQL(
+            insert_missing_resume_snapshots(), migrations.RunSQL.noop
+        ),
+        migrations.RunSQL(
+            f"""
+                UPDATE resume_snapshots
+                SET search_vector = {resume_search_vector_sql("document")};
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
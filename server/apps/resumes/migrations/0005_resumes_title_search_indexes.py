@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("resumes", "0004_resume_snapshots_search_vector")]
+
+    operations = [
+        # Prefix lookup of the titles of a user - always available.
+        migrations.RunSQL(
+            """
+                CREATE INDEX resumes_user_id_title_prefix_index
+                ON resumes(user_id, lower(title::text) text_pattern_ops);
+            """,
+            "DROP INDEX resumes_user_id_title_prefix_index;",
+        ),
+        # Fuzzy lookup of titles, where the server ships with `pg_trgm`.
+        migrations.RunSQL(
+            """
+                DO $$
+                BEGIN
+                    IF EXISTS (
+                        SELECT 1 FROM pg_available_extensions
+                        WHERE name = 'pg_trgm'
+                    ) THEN
+                        CREATE EXTENSION IF NOT EXISTS pg_trgm
+                        WITH SCHEMA public;
+
+                        CREATE INDEX resumes_title_trgm_index
+                        ON resumes USING gin ((title::text) gin_trgm_ops);
+                    END IF;
+                END $$;
+            """,
+            "DROP INDEX IF EXISTS resumes_title_trgm_index;",
+        ),
+    ]
@@ -2,7 +2,9 @@
 
 from django.db import models
 from ulid2 import generate_ulid_as_uuid
-from django.contrib.postgres.fields import CITextField
+from django.contrib.postgres.fields import CITextField, JSONField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 
 from server.apps.accounts.models import User
 
@@ -19,7 +21,10 @@ class Resume(models.Model):  # type: ignore[disallow_any_explicit] # noqa F821
     class Meta:
         db_table = "resumes"
 
-        indexes = [models.Index(fields=("user",), name="resumes_user_id_index")]
+        # also orders the resumes of a user by id, for paginating them
+        indexes = [
+            models.Index(fields=("user", "id"), name="resumes_user_id_id_index")
+        ]  # noqa
 
     id = models.UUIDField(default=generate_ulid_as_uuid, primary_key=True)
     title = CITextField()
@@ -189,3 +194,44 @@ class SupplementarySkill(Ratable):  # type: ignore[disallow_any_explicit] # noqa
 
     class Meta:
         db_table = "supplementary_skills"
+
+
+class ResumeSnapshot(models.Model):
+    """
+    A resume and all its children in one document, rebuilt whenever any of
+    them is written (see `ResumesDjangoLogic`), so a whole resume is read
+    from a single row.
+    """
+
+    resume = models.OneToOneField(
+        Resume,
+        models.DO_NOTHING,
+        primary_key=True,
+        db_constraint=False,
+        related_name="snapshot",
+    )
+
+    user = models.ForeignKey(
+        User, models.DO_NOTHING, db_constraint=False, db_index=False
+    )
+
+    # {"resume": row, "children": {child tag: [rows]}} - rows as JSON
+    document = JSONField()
+    # bumped on every rebuild
+    version = models.IntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+    # the words of the document, for searching resumes (see `resumes_search`)
+    search_vector = SearchVectorField(null=True)
+
+    class Meta:
+        db_table = "resume_snapshots"
+
+        indexes = [
+            models.Index(
+                fields=("user",), name="resume_snapshots_user_id_index"
+            ),  # noqa
+            GinIndex(
+                fields=("search_vector",),
+                name="resume_snapshots_search_index",
+            ),
+        ]
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+Set-based writes of many rows of a table at once: one statement whatever
+the number of rows, where saving model instances costs one each.
+"""
+
+from typing import Any, List, Mapping, Optional, Sequence, Type
+from uuid import UUID
+
+from django.db import connection, models
+from ulid2 import generate_ulid_as_uuid
+
+
+def update_from_values(
+    model: Type[models.Model],
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],  # type: ignore
+    where: Optional[Mapping[str, Any]] = None,  # type: ignore
+) -> int:
+    """
+    Set the columns of the rows of `model` to `rows` - each the values of
+    `columns` (attribute names), primary key first - in one
+    `UPDATE ... FROM (VALUES ...)` statement. Only rows whose columns have
+    the values of `where` are updated. Columns updated automatically
+    (`auto_now`) are set to the current time. Returns the number of rows
+    updated.
+    """
+    if not rows:
+        return 0
+
+    quote_name = connection.ops.quote_name
+    fields_map = {field.attname: field for field in model._meta.concrete_fields}
+    fields = [fields_map[column] for column in columns]
+    pk_column = quote_name(fields[0].column)
+
+    placeholder = "({})".format(
+        ", ".join(f"%s::{field.db_type(connection)}" for field in fields)
+    )
+
+    assignments: List[str] = [
+        f"{quote_name(field.column)} = v.{quote_name(field.column)}"
+        for field in fields[1:]
+    ] + [
+        f"{quote_name(field.column)} = now()"
+        for field in fields_map.values()
+        if getattr(field, "auto_now", False) and field not in fields
+    ]
+
+    conditions = "".join(
+        f" AND t.{quote_name(fields_map[column].column)} = %s"
+        for column in (where or {})
+    )
+
+    sql = f"""
+        UPDATE {quote_name(model._meta.db_table)} AS t
+        SET {", ".join(assignments)}
+        FROM (VALUES {", ".join([placeholder] * len(rows))})
+            AS v({", ".join(quote_name(field.column) for field in fields)})
+        WHERE t.{pk_column} = v.{pk_column} {conditions}
+    """
+
+    params = [
+        field.get_db_prep_save(value, connection)
+        for row in rows
+        for field, value in zip(fields, row)
+    ] + [
+        fields_map[column].get_db_prep_value(value, connection)
+        for column, value in (where or {}).items()
+    ]
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+def rows_of(
+    values_list: Sequence[Mapping[str, Any]],  # type: ignore
+    columns: Sequence[str],
+) -> List[Sequence[Any]]:  # type: ignore
+    """
+    The values of `columns` of each mapping, as rows for
+    `update_from_values`.
+    """
+    return [[values[column] for column in columns] for values in values_list]
+
+
+def ordered_ulids(count: int) -> List[UUID]:
+    """
+    `count` new ULIDs in increasing order - those made within the same
+    millisecond are not otherwise - for rows inserted together to keep (by
+    id) the order they were given in.
+    """
+    return sorted(generate_ulid_as_uuid() for _ in range(count))
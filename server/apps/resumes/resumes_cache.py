@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+"""
+Read-through cache of resume children shared by all requests (and, depending
+on the backend configured for the `resumes` cache alias, by all workers).
+
+Entries are keyed by (child tag, owner id) - the same pair the data loader
+batches on - and hold the list of children of that owner. The write methods
+of `ResumesDjangoLogic` invalidate (or write through) the keys they touch.
+
+Children may be fetched with only some of their columns. So an entry maps
+the columns its children were fetched with (`None` for all the columns) to
+the children. Any entry with at least the requested columns will do.
+"""
+
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+from django.core.cache import caches
+from django.db import transaction
+
+from logics.logics_utils import UUIDType
+from logics.resumes.resumes_types import ResumeChildTagType
+
+RESUMES_CACHE_ALIAS = "resumes"
+
+OwnerIdsMapType = Mapping[ResumeChildTagType, List[UUIDType]]
+ChildrenMapType = Mapping[ResumeChildTagType, List[Any]]  # type: ignore
+TagOwnerIdType = Tuple[ResumeChildTagType, UUIDType]
+# the columns children were fetched with - `None` means all the columns
+ColumnsType = Optional[FrozenSet[str]]
+ColumnsMapType = Mapping[ResumeChildTagType, ColumnsType]
+CacheEntryType = MutableMapping[ColumnsType, List[Any]]  # type: ignore
+
+
+def children_from_cache_entry(
+    entry: Optional[CacheEntryType], columns: ColumnsType
+) -> Optional[List[Any]]:  # type: ignore
+    if entry is None:
+        return None
+
+    for entry_columns, children in entry.items():
+        if entry_columns is None or (
+            columns is not None and entry_columns >= columns
+        ):  # noqa E501
+            return children
+
+    return None
+
+
+def make_resume_children_cache_key(
+    tag: ResumeChildTagType, owner_id: UUIDType
+) -> str:  # noqa E501
+    return f"resume-children:{tag.value}:{owner_id}"
+
+
+def get_cached_resume_children(
+    owner_ids_map: OwnerIdsMapType,
+    columns_map: Optional[ColumnsMapType] = None,
+) -> Tuple[ChildrenMapType, OwnerIdsMapType]:
+    """
+    Return the cached children of every (tag, owner id) in `owner_ids_map`
+    together with the owner ids, per tag, that were not found in the cache.
+    `columns_map` holds the columns needed per tag (all by default).
+    """
+    columns_map = columns_map or {}
+
+    key_to_tag_owner_map = {
+        make_resume_children_cache_key(tag, owner_id): (tag, str(owner_id))
+        for tag, owner_ids in owner_ids_map.items()
+        for owner_id in owner_ids
+    }
+
+    cached_map = caches[RESUMES_CACHE_ALIAS].get_many(
+        list(key_to_tag_owner_map)
+    )  # noqa E501
+
+    children_map: MutableMapping[ResumeChildTagType, List[Any]] = {  # type: ignore # noqa E501
+        tag: [] for tag in owner_ids_map
+    }
+
+    missing_ids_map: MutableMapping[ResumeChildTagType, List[UUIDType]] = {}
+
+    for key, (tag, owner_id) in key_to_tag_owner_map.items():
+        cached = children_from_cache_entry(
+            cached_map.get(key), columns_map.get(tag)
+        )  # noqa E501
+
+        if cached is None:
+            missing_ids_map.setdefault(tag, []).append(owner_id)
+        else:
+            children_map[tag].extend(cached)
+
+    return children_map, missing_ids_map
+
+
+def cache_resume_children(
+    owner_ids_map: OwnerIdsMapType,
+    children_map: ChildrenMapType,
+    owner_attr_names: Mapping[ResumeChildTagType, str],
+    columns_map: Optional[ColumnsMapType] = None,
+) -> None:
+    """
+    Cache `children_map` (as fetched from the database, with the columns in
+    `columns_map`) per owner. Every owner in `owner_ids_map` gets an entry -
+    an empty list when it has no children.
+    """
+    columns_map = columns_map or {}
+
+    key_to_tag_map = {
+        make_resume_children_cache_key(tag, owner_id): tag
+        for tag, owner_ids in owner_ids_map.items()
+        for owner_id in owner_ids
+    }
+
+    children_of_keys: MutableMapping[str, List[Any]] = {  # type: ignore
+        key: [] for key in key_to_tag_map
+    }
+
+    for tag, children in children_map.items():
+        attr_name = owner_attr_names[tag]
+
+        for child in children:
+            owner_id = getattr(child, attr_name)
+            key = make_resume_children_cache_key(tag, owner_id)
+            children_of_keys.setdefault(key, []).append(child)
+            key_to_tag_map[key] = tag
+
+    cache = caches[RESUMES_CACHE_ALIAS]
+
+    # Children fetched with some of their columns are added next to those
+    # cached with other columns. With all the columns, they replace them.
+    projected_keys = [
+        key for key, tag in key_to_tag_map.items() if columns_map.get(tag)
+    ]
+
+    entries = cache.get_many(projected_keys) if projected_keys else {}
+
+    for key, children in children_of_keys.items():
+        entry = entries.setdefault(key, {})
+        entry[columns_map.get(key_to_tag_map[key])] = children
+
+    cache.set_many(entries)
+
+
+def read_through_resume_children(
+    owner_ids_map: OwnerIdsMapType,
+    owner_attr_names: Mapping[ResumeChildTagType, str],
+    fetch_fn: Callable[[OwnerIdsMapType], ChildrenMapType],
+    columns_map: Optional[ColumnsMapType] = None,
+) -> ChildrenMapType:
+    """
+    Return the children of every (tag, owner id) in `owner_ids_map`, reading
+    from the cache first and calling `fetch_fn` (once) with whatever was not
+    cached. Owners without children are cached as empty lists so that they
+    do not hit the database either. `fetch_fn` must fetch (at least) the
+    columns in `columns_map`.
+    """
+    children_map, missing_ids_map = get_cached_resume_children(
+        owner_ids_map, columns_map
+    )  # noqa E501
+
+    if not missing_ids_map:
+        return children_map
+
+    fetched_map = fetch_fn(missing_ids_map)
+
+    cache_resume_children(
+        missing_ids_map, fetched_map, owner_attr_names, columns_map
+    )  # noqa E501
+
+    for tag, children in fetched_map.items():
+        children_map[tag].extend(children)
+
+    return children_map
+
+
+def invalidate_resume_children(
+    tag_owner_ids: Iterable[TagOwnerIdType],
+) -> None:
+    """
+    Drop the cached children of each (tag, owner id) pair. The keys are
+    dropped right away and again once the current transaction commits, so a
+    read racing the write can not leave the pre-commit rows in the cache.
+    """
+    keys = [
+        make_resume_children_cache_key(tag, owner_id)
+        for tag, owner_id in tag_owner_ids
+    ]
+
+    delete_many = partial(caches[RESUMES_CACHE_ALIAS].delete_many, keys)
+    delete_many()
+    transaction.on_commit(delete_many)
+
+
+def write_through_no_resume_children(
+    tag_owner_ids: Iterable[TagOwnerIdType],
+) -> None:
+    """
+    Cache the fact that freshly created owners do not have children yet.
+    """
+    caches[RESUMES_CACHE_ALIAS].set_many(
+        {
+            make_resume_children_cache_key(tag, owner_id): {None: []}
+            for tag, owner_id in tag_owner_ids
+        }
+    )
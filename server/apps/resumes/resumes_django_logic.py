@@ -1,15 +1,59 @@
 # -*- coding: utf-8 -*-
 
 
-from typing import List, Mapping, Tuple, Type, cast, Optional
+from functools import lru_cache, partial
+from uuid import UUID
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 from django.conf import settings
-from django.db import IntegrityError, models, transaction
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    IntegrityError,
+    connection,
+    models,
+    transaction,
+)
+from django.utils import timezone
 
 from logics.logics_utils import (
     UUIDType,
     bytes_and_file_name_from_data_url_encoded_string,
+    data_url_encoded_string_delimiter,
+)
+from server.apps.resumes.resumes_bulk import (
+    ordered_ulids,
+    rows_of,
+    update_from_values,
+)
+from server.apps.resumes.resumes_cache import (
+    ColumnsMapType,
+    ColumnsType,
+    cache_resume_children,
+    get_cached_resume_children,
+    invalidate_resume_children,
+    read_through_resume_children,
+    write_through_no_resume_children,
 )
+from server.apps.resumes.resumes_search import (
+    SEARCH_CONFIG,
+    resume_search_vector_sql,
+)
+from server.apps.resumes.resumes_records import (
+    ResumeChildRecord,
+    make_record_class,
+)
+from server.response_cache import invalidate_user_responses
+from server.thread_pool import run_in_db_thread
 from server.apps.resumes.models import (  # noqa
     Education,
     EducationAchievement,
@@ -17,6 +61,7 @@ from server.apps.resumes.models import (  # noqa
     PersonalInfo,
     Resume,
     ResumeHobby,
+    ResumeSnapshot,
     Skill,
     SpokenLanguage,
     SupplementarySkill,
@@ -40,13 +85,22 @@ from logics.resumes.resumes_types import (
     CreateTextOnlyReturnType,
     EducationLike,
     ExperienceLike,
+    FullResume,
     GetResumeAttrs,
+    IndexableEnumType,
     MaybeResume,
     PersonalInfoLike,
     Ratable,
     RatableEnumType,
+    ResumeChildDocument,
+    ResumeChildLike,
+    ResumeChildTagType,
+    ResumeComponentEnumType,
     ResumeLike,
     ResumesLogicInterface,
+    SavedResume,
+    SaveResumeAttrs,
+    SaveResumeReturnType,
     SkillLike,
     TextOnlyEnumType,
     TextOnlyLike,
@@ -76,6 +130,549 @@ TEXT_ONLY_OWNER_CLASSES_MAP: Mapping[TextOnlyEnumType, Type[models.Model]] = {
 }
 
 
+# child tag => (model class, name of column pointing to the owner)
+RESUME_CHILD_CLASSES_MAP: Mapping[
+    ResumeChildTagType, Tuple[Type[models.Model], str]
+] = {  # noqa E501
+    ResumeComponentEnumType.personal_info: (PersonalInfo, "resume_id"),
+    ResumeComponentEnumType.education: (Education, "resume_id"),
+    ResumeComponentEnumType.experience: (Experience, "resume_id"),
+    ResumeComponentEnumType.skill: (Skill, "resume_id"),
+    **{tag: (klass, "owner_id") for tag, klass in RATABLE_CLASSES_MAP.items()},
+    **{
+        tag: (klass, "owner_id") for tag, klass in TEXT_ONLY_CLASSES_MAP.items()
+    },  # noqa E501
+}
+
+# child tag => the fields of its columns
+RESUME_CHILD_FIELDS_MAP: Mapping[ResumeChildTagType, List[models.Field]] = {
+    tag: list(klass._meta.concrete_fields)
+    for tag, (klass, _) in RESUME_CHILD_CLASSES_MAP.items()
+}
+
+# child tag => the columns its children are ordered by: owner first, so the
+# children of an owner come together, then their position in the resume.
+# Children without an `index` keep the order they were created in - ids are
+# ULIDs.
+RESUME_CHILD_ORDERING_MAP: Mapping[ResumeChildTagType, List[str]] = {
+    tag: [
+        column
+        for column in (owner_column, "index", klass._meta.pk.attname)
+        if column in {field.attname for field in RESUME_CHILD_FIELDS_MAP[tag]}
+    ]
+    for tag, (klass, owner_column) in RESUME_CHILD_CLASSES_MAP.items()
+}
+
+RESUME_CHILD_RECORD_CLASSES_MAP: Mapping[
+    ResumeChildTagType, Type[ResumeChildRecord]
+] = {  # noqa E501
+    tag: make_record_class(
+        klass, None if isinstance(tag, ResumeComponentEnumType) else tag
+    )
+    for tag, (klass, _) in RESUME_CHILD_CLASSES_MAP.items()
+}
+
+RESUME_CHILD_TAGS_MAP: Mapping[str, ResumeChildTagType] = {
+    tag.value: tag for tag in RESUME_CHILD_CLASSES_MAP
+}
+
+RESUME_CHILD_OWNER_ATTR_NAMES: Mapping[ResumeChildTagType, str] = {
+    tag: owner_column
+    for tag, (_, owner_column) in RESUME_CHILD_CLASSES_MAP.items()
+}
+
+# Children of each resume component (besides personal info) - so we can tell
+# the cache that a freshly created component has no achievements yet.
+RESUME_COMPONENT_CHILD_TAGS_MAP: Mapping[
+    ResumeComponentEnumType, List[ResumeChildTagType]
+] = {  # noqa E501
+    ResumeComponentEnumType.education: [
+        TextOnlyEnumType.education_achievement
+    ],
+    ResumeComponentEnumType.experience: [
+        TextOnlyEnumType.experience_achievement
+    ],
+    ResumeComponentEnumType.skill: [TextOnlyEnumType.skill_achievement],
+}
+
+COMPONENT_CHILD_TAG_TO_COMPONENT_TAG_MAP: Mapping[
+    ResumeChildTagType, ResumeComponentEnumType
+] = {  # noqa E501
+    child_tag: tag
+    for tag, child_tags in RESUME_COMPONENT_CHILD_TAGS_MAP.items()
+    for child_tag in child_tags
+}
+
+RESUME_CHILD_TAGS: List[ResumeChildTagType] = [
+    ResumeComponentEnumType.personal_info,
+    ResumeComponentEnumType.education,
+    ResumeComponentEnumType.experience,
+    ResumeComponentEnumType.skill,
+    TextOnlyEnumType.resume_hobby,
+    RatableEnumType.spoken_language,
+    RatableEnumType.supplementary_skill,
+]
+
+
+def projected_columns(
+    tag: ResumeChildTagType, fields: Optional[Iterable[str]]
+) -> ColumnsType:
+    """
+    The columns to fetch for children of kind `tag` when only the attributes
+    `fields` will be read: those of `fields` which are columns, plus the
+    ones the children are looked up, grouped and ordered by. `None` means
+    all the columns.
+    """
+    if fields is None:
+        return None
+
+    klass, owner_column = RESUME_CHILD_CLASSES_MAP[tag]
+    all_columns = {field.attname for field in klass._meta.concrete_fields}
+    columns = all_columns & {klass._meta.pk.attname, owner_column, *fields}
+
+    if "index" in all_columns:
+        columns.add("index")
+
+    return None if columns == all_columns else frozenset(columns)
+
+
+def make_columns_map(
+    fields_map: Optional[Mapping[ResumeChildTagType, Iterable[str]]],
+) -> ColumnsMapType:
+    return {
+        tag: projected_columns(tag, fields)
+        for tag, fields in (fields_map or {}).items()
+    }
+
+
+def resume_child_from_json_row(
+    tag: ResumeChildTagType, row: Mapping[str, Any]  # type: ignore
+) -> ResumeChildLike:
+    """
+    Build a record from a row serialized with postgres `to_jsonb` (or
+    `jsonb_build_object` when only some columns were fetched - the record
+    then only has those). JSON only knows strings and numbers, so each value
+    goes through the field's `to_python` to get back UUIDs and datetimes.
+    """
+    fields = [
+        field for field in RESUME_CHILD_FIELDS_MAP[tag] if field.column in row
+    ]
+
+    record = RESUME_CHILD_RECORD_CLASSES_MAP[tag](
+        [field.attname for field in fields],
+        [field.to_python(row[field.column]) for field in fields],
+    )
+
+    return cast(ResumeChildLike, record)
+
+
+def fetch_resume_children(
+    owner_ids_map: Mapping[ResumeChildTagType, List[UUIDType]],
+    columns_map: Optional[ColumnsMapType] = None,
+) -> Mapping[ResumeChildTagType, List[ResumeChildLike]]:
+    selects: List[Tuple[ResumeChildTagType, str, List[str]]] = []
+
+    for tag, owner_ids in owner_ids_map.items():
+        _, owner_column = RESUME_CHILD_CLASSES_MAP[tag]
+
+        selects.append(
+            (
+                tag,
+                f"t.{owner_column} = ANY(%s::uuid[])",
+                [str(owner_id) for owner_id in owner_ids],
+            )
+        )
+
+    return fetch_union_of_resume_children(selects, columns_map)
+
+
+def fetch_resume_tree(
+    resume_ids: List[UUIDType],
+    tags: Iterable[ResumeChildTagType],
+    columns_map: Optional[ColumnsMapType] = None,
+) -> Mapping[ResumeChildTagType, List[ResumeChildLike]]:
+    """
+    Like `fetch_resume_children` but children are always looked up by the
+    resume they (eventually) belong to, so achievements can be read in the
+    same query as the educations/experiences/skills that own them.
+    """
+    str_resume_ids = [str(resume_id) for resume_id in resume_ids]
+    selects: List[Tuple[ResumeChildTagType, str, List[str]]] = []
+
+    for tag in tags:
+        _, owner_column = RESUME_CHILD_CLASSES_MAP[tag]
+        owner_class = TEXT_ONLY_OWNER_CLASSES_MAP.get(tag)  # type: ignore
+
+        if owner_class is None or owner_class is Resume:
+            where = f"t.{owner_column} = ANY(%s::uuid[])"
+        else:
+            where = f"""
+                t.{owner_column} IN (
+                    SELECT id FROM {owner_class._meta.db_table}
+                    WHERE resume_id = ANY(%s::uuid[])
+                )
+            """
+
+        selects.append((tag, where, str_resume_ids))
+
+    return fetch_union_of_resume_children(selects, columns_map)
+
+
+def fetch_union_of_resume_children(
+    selects: List[Tuple[ResumeChildTagType, str, List[str]]],
+    columns_map: Optional[ColumnsMapType] = None,
+) -> Mapping[ResumeChildTagType, List[ResumeChildLike]]:
+    # One `SELECT` per (tag, where clause, ids), glued together with
+    # `UNION ALL` so that all the tables are read in a single round trip.
+    # Every row is serialized with `to_jsonb` (or `jsonb_build_object` of
+    # the columns in `columns_map`) since the tables do not share columns.
+    # The rows are ordered by owner, index and id (see
+    # `RESUME_CHILD_ORDERING_MAP`) - a `0` index for tables without one.
+    sqls: List[str] = []
+    params: List[Any] = []  # type: ignore
+    columns_map = columns_map or {}
+    quote_name = connection.ops.quote_name
+
+    for tag, where, ids in selects:
+        klass, owner_column = RESUME_CHILD_CLASSES_MAP[tag]
+        columns = columns_map.get(tag)
+
+        index_sql = (
+            f"t.{quote_name('index')}"
+            if "index" in RESUME_CHILD_ORDERING_MAP[tag]
+            else "0"
+        )
+
+        if columns is None:
+            row_sql = "to_jsonb(t)"
+        else:
+            row_sql = "jsonb_build_object({})".format(
+                ", ".join(
+                    f"'{field.column}', t.{quote_name(field.column)}"
+                    for field in klass._meta.concrete_fields
+                    if field.attname in columns
+                )
+            )
+
+        sqls.append(
+            f"""
+            SELECT
+                %s,
+                {row_sql},
+                t.{owner_column},
+                {index_sql},
+                t.{klass._meta.pk.column}
+            FROM {klass._meta.db_table} t
+            WHERE {where}
+            """
+        )
+
+        params.append(tag.value)
+        params.append(ids)
+
+    children_map: MutableMapping[ResumeChildTagType, List[ResumeChildLike]] = {
+        tag: [] for tag, _, _ in selects
+    }
+
+    if not sqls:
+        return children_map
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            " UNION ALL ".join(sqls) + " ORDER BY 3, 4, 5", params
+        )  # noqa E501
+
+        for tag_value, row, *_ in cursor.fetchall():
+            tag = RESUME_CHILD_TAGS_MAP[tag_value]
+            children_map[tag].append(resume_child_from_json_row(tag, row))
+
+    return children_map
+
+
+def make_full_resume_sql_parts() -> Tuple[str, str]:
+    """
+    The parts of a query for resumes (`r`) and all their children -
+    including the achievements of their educations, experiences and skills:
+    a JSON object of the children per kind and the `FROM` clause. The
+    children of each kind are aggregated into a JSON array, in the order of
+    `RESUME_CHILD_ORDERING_MAP`, by a lateral subquery of their own.
+    """
+    quote_name = connection.ops.quote_name
+    arrays: List[str] = []
+    laterals: List[str] = []
+
+    for number, (tag, (klass, owner_column)) in enumerate(
+        RESUME_CHILD_CLASSES_MAP.items()
+    ):  # noqa E501
+        alias = f"c{number}"
+        owner_class = TEXT_ONLY_OWNER_CLASSES_MAP.get(tag)  # type: ignore
+
+        if owner_class is None or owner_class is Resume:
+            where = f"t.{owner_column} = r.id"
+        else:
+            where = f"""
+                t.{owner_column} IN (
+                    SELECT id FROM {owner_class._meta.db_table}
+                    WHERE resume_id = r.id
+                )
+            """
+
+        ordering = ", ".join(
+            f"t.{quote_name(column)}"
+            for column in RESUME_CHILD_ORDERING_MAP[tag]
+        )
+
+        arrays.append(f"'{tag.value}', {alias}.children")
+
+        laterals.append(
+            f"""
+            LEFT JOIN LATERAL (
+                SELECT json_agg(t ORDER BY {ordering}) AS children
+                FROM {klass._meta.db_table} t
+                WHERE {where}
+            ) {alias} ON true
+            """
+        )
+
+    return (
+        f"json_build_object({', '.join(arrays)})",
+        f"FROM {Resume._meta.db_table} r {''.join(laterals)}",
+    )
+
+
+FULL_RESUME_CHILDREN_SQL, FULL_RESUME_FROM_SQL = make_full_resume_sql_parts()
+
+FULL_RESUME_SQL = f"""
+    SELECT row_to_json(r), {FULL_RESUME_CHILDREN_SQL}
+    {FULL_RESUME_FROM_SQL}
+    WHERE r.id = %s AND r.user_id = %s
+"""
+
+# The resume being saved and all its children, locked until the save
+# commits so that saves of a resume do not interleave.
+SAVE_RESUME_SQL = f"{FULL_RESUME_SQL} FOR UPDATE OF r"
+
+# Rebuild the snapshot of a resume (and its search vector) - and return its
+# owner, document and version.
+REFRESH_RESUME_SNAPSHOT_SQL = f"""
+    WITH snapshot AS (
+        SELECT
+            r.id AS resume_id,
+            r.user_id,
+            json_build_object(
+                'resume', row_to_json(r), 'children', {FULL_RESUME_CHILDREN_SQL}
+            )::jsonb AS document
+        {FULL_RESUME_FROM_SQL}
+        WHERE r.id = %s
+    )
+    INSERT INTO {ResumeSnapshot._meta.db_table} AS s
+        (resume_id, user_id, document, search_vector, version, updated_at)
+    SELECT
+        resume_id,
+        user_id,
+        document,
+        {resume_search_vector_sql("document")},
+        1,
+        now()
+    FROM snapshot
+    ON CONFLICT (resume_id) DO UPDATE SET
+        document = EXCLUDED.document,
+        search_vector = EXCLUDED.search_vector,
+        version = s.version + 1,
+        updated_at = EXCLUDED.updated_at
+    RETURNING user_id, document, version
+"""
+
+# The resumes of a user matching a web search style query (quoted phrases,
+# `or`, `-word`), best matches first.
+SEARCH_RESUMES_SQL = f"""
+    SELECT s.document->'resume'
+    FROM
+        {ResumeSnapshot._meta.db_table} s,
+        websearch_to_tsquery('{SEARCH_CONFIG}', %s) q
+    WHERE s.user_id = %s AND s.search_vector @@ q
+    ORDER BY ts_rank(s.search_vector, q) DESC, s.resume_id DESC
+    LIMIT %s
+"""
+
+# Titles of the resumes of a user starting with a prefix - matched off the
+# `(user_id, lower(title))` index.
+SUGGEST_RESUME_TITLES_PREFIX_SQL = f"""
+    SELECT * FROM {Resume._meta.db_table}
+    WHERE user_id = %(user_id)s AND lower(title::text) LIKE %(prefix)s
+    ORDER BY lower(title::text), id DESC
+    LIMIT %(first)s
+"""
+
+# The same, plus titles with a word similar to the query (typos included),
+# off the trigram index of the titles. Titles starting with the query come
+# first, in the same order.
+SUGGEST_RESUME_TITLES_TRIGRAM_SQL = f"""
+    SELECT * FROM {Resume._meta.db_table}
+    WHERE
+        user_id = %(user_id)s
+        AND (
+            lower(title::text) LIKE %(prefix)s
+            OR %(query)s <%% title::text
+        )
+    ORDER BY
+        lower(title::text) LIKE %(prefix)s DESC,
+        CASE
+            WHEN lower(title::text) LIKE %(prefix)s THEN lower(title::text)
+        END,
+        word_similarity(%(query)s, title::text) DESC,
+        id DESC
+    LIMIT %(first)s
+"""
+
+
+@lru_cache(maxsize=None)
+def has_trigram_extension() -> bool:
+    """
+    Whether `pg_trgm` is installed in the database - the migrations only
+    install it where the server ships with it.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def like_prefix_pattern(text: str) -> str:
+    escaped = (
+        text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )  # noqa E501
+
+    return f"{escaped}%"
+
+
+def resume_from_json_row(
+    resume_row: Mapping[str, Any],  # type: ignore
+) -> ResumeLike:  # noqa E501
+    fields = Resume._meta.concrete_fields
+
+    resume = Resume.from_db(
+        DEFAULT_DB_ALIAS,
+        [field.attname for field in fields],
+        [field.to_python(resume_row[field.column]) for field in fields],
+    )
+
+    return cast(ResumeLike, resume)
+
+
+def full_resume_from_json_rows(
+    resume_row: Mapping[str, Any],  # type: ignore
+    children_rows: Mapping[str, Optional[List[Any]]],  # type: ignore
+) -> FullResume:
+    children_map = {
+        tag: [
+            resume_child_from_json_row(tag, child_row)
+            for child_row in children_rows[tag.value] or []
+        ]
+        for tag in RESUME_CHILD_CLASSES_MAP
+    }
+
+    return FullResume(
+        resume=resume_from_json_row(resume_row), children_map=children_map
+    )  # noqa E501
+
+
+def refresh_resume_snapshot(
+    resume_id: UUIDType,
+) -> Optional[Tuple[UUIDType, Mapping[str, Any], int]]:  # type: ignore
+    """
+    Rebuild the snapshot of the resume from its rows (as visible to the
+    current transaction). Refreshes of a resume wait for each other (and
+    for the transaction of the previous one to commit), so the last one
+    always sees the rows written by the others. The cached graphql
+    responses of the owner of the resume are invalidated.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(hashtext(%s))",
+            [f"resume-snapshot:{resume_id}"],
+        )
+
+        cursor.execute(REFRESH_RESUME_SNAPSHOT_SQL, [str(resume_id)])
+        snapshot = cursor.fetchone()
+
+    if snapshot is not None:
+        invalidate_user_responses(snapshot[0])
+
+    return snapshot
+
+
+def resume_ids_of_owners(
+    tag: ResumeChildTagType, owner_ids: List[UUIDType]
+) -> List[UUIDType]:  # noqa E501
+    """
+    The ids of the resumes the owners (of children of kind `tag`) are of.
+    """
+    component_tag = COMPONENT_CHILD_TAG_TO_COMPONENT_TAG_MAP.get(tag)
+
+    if component_tag is None:
+        return owner_ids
+
+    klass, _ = RESUME_CHILD_CLASSES_MAP[component_tag]
+
+    return list(
+        klass.objects.filter(pk__in=owner_ids)
+        .values_list("resume_id", flat=True)
+        .distinct()
+    )
+
+
+def are_owners_of_user(
+    klass: Type[models.Model],
+    user_column: str,
+    user_id: UUIDType,
+    owner_ids: Iterable[UUIDType],
+) -> bool:
+    """
+    Whether all the rows of `klass` with their ids in `owner_ids` exist and
+    are of the user (through `user_column`) - in one query.
+    """
+    try:
+        uuids = {UUID(str(owner_id)) for owner_id in owner_ids}
+    except ValueError:
+        return False
+
+    count = klass.objects.filter(
+        **{user_column: user_id, "pk__in": uuids}
+    ).count()  # noqa E501
+
+    return count == len(uuids)
+
+
+def fetch_records_of_tag(
+    tag: ResumeChildTagType, owner_ids: List[UUIDType]
+) -> List[ResumeChildLike]:
+    klass, owner_column = RESUME_CHILD_CLASSES_MAP[tag]
+    record_class = RESUME_CHILD_RECORD_CLASSES_MAP[tag]
+    names = [field.attname for field in RESUME_CHILD_FIELDS_MAP[tag]]
+
+    rows = klass.objects.filter(
+        **{f"{owner_column}__in": owner_ids}
+    ).order_by(*RESUME_CHILD_ORDERING_MAP[tag])
+
+    return [
+        cast(ResumeChildLike, record_class(names, values))
+        for values in rows.values_list(*names)
+    ]
+
+
+def read_through_children_of_tag(
+    tag: ResumeChildTagType, owner_ids: List[UUIDType],
+) -> List[ResumeChildLike]:
+    def fetch_fn(
+        owner_ids_map: Mapping[ResumeChildTagType, List[UUIDType]]
+    ) -> Mapping[ResumeChildTagType, List[ResumeChildLike]]:
+        return {tag: fetch_records_of_tag(tag, owner_ids_map[tag])}
+
+    return read_through_resume_children(
+        {tag: owner_ids}, RESUME_CHILD_OWNER_ATTR_NAMES, fetch_fn
+    )[tag]
+
+
 class ResumesDjangoLogic(ResumesLogicInterface):
     __slots__ = ()
 
@@ -95,16 +692,14 @@ class ResumesDjangoLogic(ResumesLogicInterface):
 
     @staticmethod
     def create_resume(params: CreateResumeAttrs) -> ResumeLike:
-        try:
-            with transaction.atomic():
-                resume = Resume(**params)
-                resume.save()
-                return cast(ResumeLike, resume)
-        except IntegrityError:
-            params["title"] = uniquify_resume_title(params["title"])
-            resume = Resume(**params)
-            resume.save()
-            return cast(ResumeLike, resume)
+        resume = insert_resume(params)
+
+        write_through_no_resume_children(
+            (tag, resume.id) for tag in RESUME_CHILD_TAGS
+        )
+
+        refresh_resume_snapshot(resume.id)
+        return cast(ResumeLike, resume)
 
     @staticmethod
     def get_resume(params: GetResumeAttrs) -> MaybeResume:
@@ -113,6 +708,75 @@ class ResumesDjangoLogic(ResumesLogicInterface):
         except Resume.DoesNotExist:
             return None
 
+    @staticmethod
+    def get_resumes(
+        ids: List[UUIDType], user_id: UUIDType
+    ) -> List[ResumeLike]:  # noqa E501
+        uuids: List[str] = []
+
+        for id in ids:
+            try:
+                uuids.append(str(UUID(str(id))))
+            except ValueError:
+                pass
+
+        resumes = Resume.objects.raw(
+            f"""
+                SELECT * FROM {Resume._meta.db_table}
+                WHERE id = ANY(%s::uuid[]) AND user_id = %s
+            """,
+            [uuids, str(user_id)],
+        )
+
+        return cast(List[ResumeLike], list(resumes))
+
+    @staticmethod
+    def list_resumes(
+        user_id: UUIDType, first: int, after: Optional[UUIDType] = None
+    ) -> List[ResumeLike]:
+        resumes = Resume.objects.filter(user_id=user_id)
+
+        if after is not None:
+            resumes = resumes.filter(id__lt=after)
+
+        return cast(List[ResumeLike], list(resumes.order_by("-id")[:first]))
+
+    @staticmethod
+    def search_resumes(
+        user_id: UUIDType, query: str, first: int
+    ) -> List[ResumeLike]:  # noqa E501
+        with connection.cursor() as cursor:
+            cursor.execute(SEARCH_RESUMES_SQL, [query, str(user_id), first])
+
+            return [resume_from_json_row(row) for row, in cursor.fetchall()]
+
+    @staticmethod
+    def suggest_resume_titles(
+        user_id: UUIDType, query: str, first: int
+    ) -> List[ResumeLike]:  # noqa E501
+        query = query.strip()
+
+        if not query:
+            return []
+
+        sql = (
+            SUGGEST_RESUME_TITLES_TRIGRAM_SQL
+            if has_trigram_extension()
+            else SUGGEST_RESUME_TITLES_PREFIX_SQL
+        )
+
+        resumes = Resume.objects.raw(
+            sql,
+            {
+                "user_id": str(user_id),
+                "query": query,
+                "prefix": like_prefix_pattern(query.lower()),
+                "first": first,
+            },
+        )
+
+        return cast(List[ResumeLike], list(resumes))
+
     @staticmethod
     def create_personal_info(
         params: CreatePersonalInfoAttrs,
@@ -126,6 +790,18 @@ class ResumesDjangoLogic(ResumesLogicInterface):
 
             personal_info = PersonalInfo(**params)
             personal_info.save()
+
+            invalidate_resume_children(
+                [
+                    (
+                        ResumeComponentEnumType.personal_info,
+                        personal_info.resume_id,
+                    )
+                ]
+            )
+
+            refresh_resume_snapshot(personal_info.resume_id)
+
             return cast(PersonalInfoLike, personal_info)
         except KeyError:
             return CreateResumeComponentErrors(error="something went wrong")
@@ -136,6 +812,7 @@ class ResumesDjangoLogic(ResumesLogicInterface):
     ) -> CreateExperienceReturnType:  # noqa E501
         experience = Experience(**params)
         experience.save()
+        resume_component_created(ResumeComponentEnumType.experience, experience)
         return cast(ExperienceLike, experience)
 
     @staticmethod
@@ -144,12 +821,14 @@ class ResumesDjangoLogic(ResumesLogicInterface):
     ) -> CreateEducationReturnType:  # noqa E501
         education = Education(**params)
         education.save()
+        resume_component_created(ResumeComponentEnumType.education, education)
         return cast(EducationLike, education)
 
     @staticmethod
     def create_skill(params: CreateSkillAttrs) -> CreateSkillReturnType:
         skill = Skill(**params)
         skill.save()
+        resume_component_created(ResumeComponentEnumType.skill, skill)
         return cast(SkillLike, skill)
 
     @staticmethod
@@ -160,28 +839,75 @@ class ResumesDjangoLogic(ResumesLogicInterface):
         _ratable.save()
         ratable = cast(Ratable, _ratable)
         ratable.tag = tag
+        resume_child_created(tag, ratable.owner_id)
         return ratable
 
+    @staticmethod
+    def create_experiences(
+        params_list: List[CreateExperienceAttrs],
+    ) -> List[ExperienceLike]:  # noqa E501
+        experiences = bulk_create_resume_components(
+            ResumeComponentEnumType.experience, params_list
+        )
+
+        return cast(List[ExperienceLike], experiences)
+
+    @staticmethod
+    def create_educations(
+        params_list: List[CreateEducationAttrs],
+    ) -> List[EducationLike]:  # noqa E501
+        educations = bulk_create_resume_components(
+            ResumeComponentEnumType.education, params_list
+        )
+
+        return cast(List[EducationLike], educations)
+
+    @staticmethod
+    def create_skills(params_list: List[CreateSkillAttrs]) -> List[SkillLike]:
+        skills = bulk_create_resume_components(
+            ResumeComponentEnumType.skill, params_list
+        )
+
+        return cast(List[SkillLike], skills)
+
+    @staticmethod
+    def are_resumes_of_user(
+        user_id: UUIDType, resume_ids: Iterable[UUIDType]
+    ) -> bool:  # noqa E501
+        return are_owners_of_user(Resume, "user_id", user_id, resume_ids)
+
     @staticmethod
     def get_personal_infos(
         resume_ids: List[UUIDType],
     ) -> List[PersonalInfoLike]:  # noqa E501
-        personal_infos = PersonalInfo.objects.filter(resume_id__in=resume_ids)
+        personal_infos = read_through_children_of_tag(
+            ResumeComponentEnumType.personal_info, resume_ids
+        )
+
         return cast(List[PersonalInfoLike], personal_infos)
 
     @staticmethod
     def get_educations(resume_ids: List[UUIDType]) -> List[EducationLike]:
-        educations = Education.objects.filter(resume_id__in=resume_ids)
+        educations = read_through_children_of_tag(
+            ResumeComponentEnumType.education, resume_ids
+        )
+
         return cast(List[EducationLike], educations)
 
     @staticmethod
     def get_skills(resume_ids: List[UUIDType]) -> List[SkillLike]:
-        skills = Skill.objects.filter(resume_id__in=resume_ids)
+        skills = read_through_children_of_tag(
+            ResumeComponentEnumType.skill, resume_ids
+        )
+
         return cast(List[SkillLike], skills)
 
     @staticmethod
     def get_experiences(resume_ids: List[UUIDType]) -> List[ExperienceLike]:
-        experiences = Experience.objects.filter(resume_id__in=resume_ids)
+        experiences = read_through_children_of_tag(
+            ResumeComponentEnumType.experience, resume_ids
+        )
+
         return cast(List[ExperienceLike], experiences)
 
     @staticmethod
@@ -193,15 +919,70 @@ class ResumesDjangoLogic(ResumesLogicInterface):
         _text_only.save()
         text_only = cast(TextOnlyLike, _text_only)
         text_only.tag = tag
+        resume_child_created(tag, text_only.owner_id)
         return text_only
 
+    @staticmethod
+    def create_many_text_only(
+        params_list: List[CreateTextOnlyAttr],
+    ) -> List[TextOnlyLike]:  # noqa E501
+        text_only_list: List[Any] = [None] * len(params_list)  # type: ignore
+        positions_map: MutableMapping[TextOnlyEnumType, List[int]] = {}
+
+        for position, params in enumerate(params_list):
+            tag = TextOnlyEnumType(params["tag"])
+            positions_map.setdefault(tag, []).append(position)
+
+        with transaction.atomic():
+            for tag, positions in positions_map.items():
+                klass = TEXT_ONLY_CLASSES_MAP[tag]
+
+                # text only children are ordered by id
+                created = klass.objects.bulk_create(
+                    [
+                        klass(
+                            id=id,
+                            text=params_list[position]["text"],
+                            owner_id=params_list[position]["owner_id"],
+                        )
+                        for position, id in zip(
+                            positions, ordered_ulids(len(positions))
+                        )
+                    ]
+                )
+
+                for position, text_only in zip(positions, created):
+                    text_only.tag = tag
+                    text_only_list[position] = text_only
+
+            resume_children_created(
+                (text_only.tag, text_only.owner_id)
+                for text_only in text_only_list
+            )
+
+        return cast(List[TextOnlyLike], text_only_list)
+
+    @staticmethod
+    def are_text_only_owners_of_user(
+        user_id: UUIDType,
+        owner_ids: Iterable[UUIDType],
+        tag: TextOnlyEnumType,
+    ) -> bool:
+        related_class = TEXT_ONLY_OWNER_CLASSES_MAP[tag]
+
+        user_column = (
+            "user_id" if related_class is Resume else "resume__user_id"
+        )  # noqa E501
+
+        return are_owners_of_user(
+            related_class, user_column, user_id, owner_ids
+        )  # noqa E501
+
     @staticmethod
     def get_many_text_only(
         owner_ids: List[UUIDType], tag: TextOnlyEnumType,
     ) -> List[TextOnlyLike]:
-        text_only_list = TEXT_ONLY_CLASSES_MAP[tag].objects.filter(
-            owner_id__in=owner_ids
-        )
+        text_only_list = read_through_children_of_tag(tag, owner_ids)
 
         return cast(List[TextOnlyLike], text_only_list)
 
@@ -209,18 +990,9 @@ class ResumesDjangoLogic(ResumesLogicInterface):
     def get_ratables(
         owner_ids: List[UUIDType], tag: RatableEnumType,
     ) -> List[Ratable]:  # noqa E501
-        _ratables = RATABLE_CLASSES_MAP[tag].objects.filter(
-            owner_id__in=owner_ids
-        )  # noqa E501
+        ratables = read_through_children_of_tag(tag, owner_ids)
 
-        ratables: List[Ratable] = []
-
-        for _ratable in _ratables:
-            ratable = cast(Ratable, _ratable)
-            ratable.tag = tag
-            ratables.append(ratable)
-
-        return ratables
+        return cast(List[Ratable], ratables)
 
     @staticmethod
     def get_text_only_owner(
@@ -233,3 +1005,677 @@ class ResumesDjangoLogic(ResumesLogicInterface):
             return _related
         except related_class.DoesNotExist:
             return None
+
+    @staticmethod
+    def get_resume_children(
+        owner_ids_map: Mapping[ResumeChildTagType, List[UUIDType]],
+        fields_map: Optional[Mapping[ResumeChildTagType, Iterable[str]]] = None,
+    ) -> Mapping[ResumeChildTagType, List[ResumeChildLike]]:
+        columns_map = make_columns_map(fields_map)
+
+        return read_through_resume_children(
+            owner_ids_map,
+            RESUME_CHILD_OWNER_ATTR_NAMES,
+            partial(fetch_resume_children, columns_map=columns_map),
+            columns_map,
+        )
+
+    @staticmethod
+    def get_resume_tree(
+        resume_ids: List[UUIDType],
+        tags: Iterable[ResumeChildTagType],
+        fields_map: Optional[Mapping[ResumeChildTagType, Iterable[str]]] = None,
+    ) -> Mapping[ResumeChildTagType, List[ResumeChildLike]]:
+        tags = list(tags)
+        resume_tags = [tag for tag in tags if not is_component_child_tag(tag)]
+        columns_map = make_columns_map(fields_map)
+
+        children_map, missing_ids_map = get_cached_resume_children(
+            {tag: resume_ids for tag in resume_tags}, columns_map
+        )
+
+        if missing_ids_map:
+            # Cold cache: read everything in one go, then cache it per owner.
+            children_map = fetch_resume_tree(resume_ids, tags, columns_map)
+            owner_ids_map = tree_owner_ids_map(resume_ids, tags, children_map)
+
+            cache_resume_children(
+                owner_ids_map,
+                children_map,
+                RESUME_CHILD_OWNER_ATTR_NAMES,
+                columns_map,
+            )
+
+            return children_map
+
+        # The children of the resumes are cached. So we know the owners of
+        # the achievements and can read those through the cache as well.
+        owner_ids_map = tree_owner_ids_map(resume_ids, tags, children_map)
+
+        component_children_map = read_through_resume_children(
+            {
+                tag: owner_ids
+                for tag, owner_ids in owner_ids_map.items()
+                if is_component_child_tag(tag)
+            },
+            RESUME_CHILD_OWNER_ATTR_NAMES,
+            partial(fetch_resume_children, columns_map=columns_map),
+            columns_map,
+        )
+
+        return {**children_map, **component_children_map}
+
+    @staticmethod
+    def get_full_resume(
+        id: UUIDType, user_id: UUIDType
+    ) -> Optional[FullResume]:  # noqa E501
+        try:
+            id = UUID(str(id))
+        except ValueError:
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(FULL_RESUME_SQL, [str(id), str(user_id)])
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+
+        full_resume = full_resume_from_json_rows(*row)
+        children_map = full_resume.children_map
+
+        # the children are at hand: spare the next readers the database
+        cache_resume_children(
+            tree_owner_ids_map([id], RESUME_CHILD_CLASSES_MAP, children_map),
+            children_map,
+            RESUME_CHILD_OWNER_ATTR_NAMES,
+        )
+
+        return full_resume
+
+    @staticmethod
+    def reorder_resume_items(
+        resume_id: UUIDType, tag: IndexableEnumType, ids: List[UUIDType]
+    ) -> bool:  # noqa E501
+        component_tag = ResumeComponentEnumType(tag.value)
+        klass, owner_column = RESUME_CHILD_CLASSES_MAP[component_tag]
+
+        try:
+            uuids = [UUID(str(id)) for id in ids]
+        except ValueError:
+            return False
+
+        if len(set(uuids)) != len(uuids):
+            return False
+
+        with transaction.atomic():
+            # locked, so that none is deleted before they are indexed
+            stored_ids = (
+                klass.objects.select_for_update()
+                .filter(**{owner_column: resume_id})
+                .values_list("id", flat=True)
+            )
+
+            if set(stored_ids) != set(uuids):
+                return False
+
+            if not uuids:
+                return True
+
+            update_from_values(
+                klass,
+                ["id", "index"],
+                [[id, index] for index, id in enumerate(uuids)],
+                {owner_column: resume_id},
+            )
+
+            invalidate_resume_children([(component_tag, resume_id)])
+            refresh_resume_snapshot(resume_id)
+
+        return True
+
+    @staticmethod
+    def save_resume(params: SaveResumeAttrs) -> SaveResumeReturnType:
+        with transaction.atomic():
+            if params.get("id") is None:
+                resume = insert_resume(
+                    CreateResumeAttrs(
+                        user_id=params["user_id"],
+                        title=params["title"],
+                        description=params.get("description"),
+                    )
+                )
+
+                stored_map: Mapping[ResumeChildTagType, List[Any]] = {}
+            else:
+                try:
+                    id = UUID(str(params["id"]))
+                except ValueError:
+                    return CreateResumeComponentErrors(resume="not found")
+
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        SAVE_RESUME_SQL, [str(id), str(params["user_id"])]
+                    )  # noqa E501
+                    row = cursor.fetchone()
+
+                if row is None:
+                    return CreateResumeComponentErrors(resume="not found")
+
+                stored_resume, stored_map = full_resume_from_json_rows(*row)
+                resume = update_resume(stored_resume, params)
+
+            save_resume_children_of_documents(resume.id, params, stored_map)
+            _, document, version = refresh_resume_snapshot(resume.id)
+
+            full_resume = full_resume_from_json_rows(
+                document["resume"], document["children"]
+            )  # noqa E501
+
+            # the children of the resume and of its educations, experiences
+            # and skills - those deleted and created included
+            invalidate_resume_children(
+                (tag, owner_id)
+                for children_map in (stored_map, full_resume.children_map)
+                for tag, owner_ids in tree_owner_ids_map(
+                    [resume.id], RESUME_CHILD_CLASSES_MAP, children_map
+                ).items()
+                for owner_id in owner_ids
+            )
+
+        return SavedResume(full_resume=full_resume, version=version)
+
+    @staticmethod
+    def get_resume_snapshot(
+        id: UUIDType, user_id: UUIDType
+    ) -> Optional[FullResume]:  # noqa E501
+        try:
+            id = UUID(str(id))
+        except ValueError:
+            return None
+
+        snapshot = (
+            ResumeSnapshot.objects.filter(resume_id=id)
+            .values_list("user_id", "document")
+            .first()
+        )
+
+        if snapshot is None:
+            # not found - or written without its snapshot: read, not write
+            return ResumesDjangoLogic.get_full_resume(id, user_id)
+
+        owner_id, document = snapshot
+
+        if str(owner_id) != str(user_id):
+            return None
+
+        return full_resume_from_json_rows(
+            document["resume"], document["children"]
+        )  # noqa E501
+
+    @staticmethod
+    def get_resume_versions(
+        ids: List[UUIDType], user_id: UUIDType
+    ) -> Mapping[str, int]:  # noqa E501
+        uuids: List[str] = []
+
+        for id in ids:
+            try:
+                uuids.append(str(UUID(str(id))))
+            except ValueError:
+                pass
+
+        versions = ResumeSnapshot.objects.filter(
+            resume_id__in=uuids, user_id=user_id
+        ).values_list("resume_id", "version")
+
+        return {str(resume_id): version for resume_id, version in versions}
+
+    @staticmethod
+    async def async_get_resume(params: GetResumeAttrs) -> MaybeResume:
+        return await run_in_db_thread(ResumesDjangoLogic.get_resume, params)
+
+    @staticmethod
+    async def async_get_resumes(
+        ids: List[UUIDType], user_id: UUIDType
+    ) -> List[ResumeLike]:  # noqa E501
+        return await run_in_db_thread(
+            ResumesDjangoLogic.get_resumes, ids, user_id
+        )  # noqa E501
+
+    @staticmethod
+    async def async_list_resumes(
+        user_id: UUIDType, first: int, after: Optional[UUIDType] = None
+    ) -> List[ResumeLike]:
+        return await run_in_db_thread(
+            ResumesDjangoLogic.list_resumes, user_id, first, after
+        )
+
+    @staticmethod
+    async def async_search_resumes(
+        user_id: UUIDType, query: str, first: int
+    ) -> List[ResumeLike]:  # noqa E501
+        return await run_in_db_thread(
+            ResumesDjangoLogic.search_resumes, user_id, query, first
+        )
+
+    @staticmethod
+    async def async_suggest_resume_titles(
+        user_id: UUIDType, query: str, first: int
+    ) -> List[ResumeLike]:  # noqa E501
+        return await run_in_db_thread(
+            ResumesDjangoLogic.suggest_resume_titles, user_id, query, first
+        )
+
+    @staticmethod
+    async def async_get_resume_versions(
+        ids: List[UUIDType], user_id: UUIDType
+    ) -> Mapping[str, int]:  # noqa E501
+        return await run_in_db_thread(
+            ResumesDjangoLogic.get_resume_versions, ids, user_id
+        )
+
+    @staticmethod
+    async def async_get_personal_infos(
+        resume_ids: List[UUIDType],
+    ) -> List[PersonalInfoLike]:  # noqa E501
+        return await run_in_db_thread(
+            ResumesDjangoLogic.get_personal_infos, resume_ids
+        )
+
+    @staticmethod
+    async def async_get_educations(
+        resume_ids: List[UUIDType],
+    ) -> List[EducationLike]:  # noqa E501
+        return await run_in_db_thread(
+            ResumesDjangoLogic.get_educations, resume_ids
+        )
+
+    @staticmethod
+    async def async_get_skills(resume_ids: List[UUIDType]) -> List[SkillLike]:
+        return await run_in_db_thread(ResumesDjangoLogic.get_skills, resume_ids)
+
+    @staticmethod
+    async def async_get_experiences(
+        resume_ids: List[UUIDType],
+    ) -> List[ExperienceLike]:  # noqa E501
+        return await run_in_db_thread(
+            ResumesDjangoLogic.get_experiences, resume_ids
+        )
+
+    @staticmethod
+    async def async_get_many_text_only(
+        owner_ids: List[UUIDType], tag: TextOnlyEnumType,
+    ) -> List[TextOnlyLike]:
+        return await run_in_db_thread(
+            ResumesDjangoLogic.get_many_text_only, owner_ids, tag
+        )
+
+    @staticmethod
+    async def async_get_text_only_owner(
+        owner_id: UUIDType, tag: TextOnlyEnumType,
+    ) -> Optional[TextOnlyOwnersUnion]:
+        return await run_in_db_thread(
+            ResumesDjangoLogic.get_text_only_owner, owner_id, tag
+        )
+
+    @staticmethod
+    async def async_get_ratables(
+        owner_ids: List[UUIDType], tag: RatableEnumType,
+    ) -> List[Ratable]:  # noqa E501
+        return await run_in_db_thread(
+            ResumesDjangoLogic.get_ratables, owner_ids, tag
+        )
+
+    @staticmethod
+    async def async_get_resume_children(
+        owner_ids_map: Mapping[ResumeChildTagType, List[UUIDType]],
+        fields_map: Optional[Mapping[ResumeChildTagType, Iterable[str]]] = None,
+    ) -> Mapping[ResumeChildTagType, List[ResumeChildLike]]:
+        return await run_in_db_thread(
+            ResumesDjangoLogic.get_resume_children, owner_ids_map, fields_map
+        )
+
+    @staticmethod
+    async def async_get_resume_tree(
+        resume_ids: List[UUIDType],
+        tags: Iterable[ResumeChildTagType],
+        fields_map: Optional[Mapping[ResumeChildTagType, Iterable[str]]] = None,
+    ) -> Mapping[ResumeChildTagType, List[ResumeChildLike]]:
+        return await run_in_db_thread(
+            ResumesDjangoLogic.get_resume_tree,
+            resume_ids,
+            list(tags),
+            fields_map,
+        )
+
+    @staticmethod
+    async def async_get_full_resume(
+        id: UUIDType, user_id: UUIDType
+    ) -> Optional[FullResume]:  # noqa E501
+        return await run_in_db_thread(
+            ResumesDjangoLogic.get_full_resume, id, user_id
+        )
+
+    @staticmethod
+    async def async_get_resume_snapshot(
+        id: UUIDType, user_id: UUIDType
+    ) -> Optional[FullResume]:  # noqa E501
+        return await run_in_db_thread(
+            ResumesDjangoLogic.get_resume_snapshot, id, user_id
+        )
+
+
+def is_component_child_tag(tag: ResumeChildTagType) -> bool:
+    return tag in COMPONENT_CHILD_TAG_TO_COMPONENT_TAG_MAP
+
+
+def tree_owner_ids_map(
+    resume_ids: List[UUIDType],
+    tags: Iterable[ResumeChildTagType],
+    children_map: Mapping[ResumeChildTagType, List[ResumeChildLike]],
+) -> Mapping[ResumeChildTagType, List[UUIDType]]:
+    """
+    The owner ids of every tag in a resume tree: resume ids for children of
+    resumes and education/experience/skill ids for their achievements.
+    """
+    owner_ids_map: MutableMapping[ResumeChildTagType, List[UUIDType]] = {}
+
+    for tag in tags:
+        component_tag = COMPONENT_CHILD_TAG_TO_COMPONENT_TAG_MAP.get(tag)
+
+        if component_tag is None:
+            owner_ids_map[tag] = resume_ids
+        else:
+            owner_ids_map[tag] = [
+                component.id  # type: ignore
+                for component in children_map.get(component_tag, [])
+            ]
+
+    return owner_ids_map
+
+
+def insert_resume(params: CreateResumeAttrs) -> Resume:
+    """
+    Insert the resume - with a unique title: another resume of the user
+    may have it already.
+    """
+    try:
+        with transaction.atomic():
+            resume = Resume(**params)
+            resume.save()
+    except IntegrityError:
+        params["title"] = uniquify_resume_title(params["title"])
+        resume = Resume(**params)
+        resume.save()
+
+    return resume
+
+
+def update_resume(resume: ResumeLike, params: SaveResumeAttrs) -> ResumeLike:
+    title = params["title"]
+    description = params.get("description")
+
+    if (title, description) == (resume.title, resume.description):
+        return resume
+
+    resumes = Resume.objects.filter(pk=resume.id)
+    # `QuerySet.update` does not set `auto_now` fields
+    updated_at = timezone.now()
+
+    try:
+        with transaction.atomic():
+            resumes.update(
+                title=title, description=description, updated_at=updated_at
+            )  # noqa E501
+    except IntegrityError:
+        title = uniquify_resume_title(title)
+        resumes.update(
+            title=title, description=description, updated_at=updated_at
+        )  # noqa E501
+
+    resume.title = title
+    resume.description = description
+    resume.updated_at = updated_at
+    return resume
+
+
+# key of the list of each kind of child in the document of a saved resume
+# (and that of the achievements of educations, experiences and skills)
+SAVE_RESUME_CHILDREN_KEYS_MAP: Mapping[str, ResumeChildTagType] = {
+    "educations": ResumeComponentEnumType.education,
+    "experiences": ResumeComponentEnumType.experience,
+    "skills": ResumeComponentEnumType.skill,
+    "hobbies": TextOnlyEnumType.resume_hobby,
+    "languages": RatableEnumType.spoken_language,
+    "supplementary_skills": RatableEnumType.supplementary_skill,
+}
+
+ACHIEVEMENTS_KEY = "achievements"
+
+# child tag => the columns of its children written from their documents
+SAVE_RESUME_CHILD_COLUMNS_MAP: Mapping[ResumeChildTagType, List[str]] = {
+    tag: [
+        field.attname
+        for field in RESUME_CHILD_FIELDS_MAP[tag]
+        if not field.primary_key
+        and field.attname not in (owner_column, "index")
+        and not getattr(field, "auto_now", False)
+        and not getattr(field, "auto_now_add", False)
+    ]
+    for tag, (_, owner_column) in RESUME_CHILD_CLASSES_MAP.items()
+}
+
+# (owner id, index among the children of the owner, document) of a child
+ChildDocumentType = Tuple[UUIDType, int, ResumeChildDocument]
+
+
+def save_resume_children(
+    tag: ResumeChildTagType,
+    stored_children: Iterable[ResumeChildLike],
+    documents: List[ChildDocumentType],
+) -> List[UUIDType]:
+    """
+    Write the children of kind `tag` so that `stored_children` become
+    `documents`: a document with the id of a stored child of the same owner
+    is written over it if they differ, the others are inserted and the
+    stored children left out are deleted - in one statement each (at most).
+    Returns the ids of the children of `documents`, in order.
+
+    Children without an index are ordered by id, and new ids follow those
+    of stored children: from the first child of an owner out of that order
+    (moved, or following a new child), the children of the owner are
+    inserted anew - under new ids - in the order of `documents`.
+    """
+    klass, owner_column = RESUME_CHILD_CLASSES_MAP[tag]
+    columns = SAVE_RESUME_CHILD_COLUMNS_MAP[tag]
+    indexed = "index" in RESUME_CHILD_ORDERING_MAP[tag]
+    update_columns = ["id", *(["index"] if indexed else []), *columns]
+    stored_map = {str(child.id): child for child in stored_children}
+    inserts: List[Tuple[int, models.Model]] = []
+    updates: List[Mapping[str, Any]] = []  # type: ignore
+    ids: List[UUIDType] = []
+    # owner id => id of its last child kept in place (`None` once its
+    # children are inserted anew)
+    last_ids_map: MutableMapping[str, Optional[UUID]] = {}
+
+    for owner_id, index, document in documents:
+        values = {column: document.get(column) for column in columns}
+
+        if indexed:
+            values["index"] = index
+
+        stored = stored_map.get(str(document.get("id")))
+        last_id = last_ids_map.get(str(owner_id), UUID(int=0))
+
+        if (
+            stored is None
+            or str(getattr(stored, owner_column)) != str(owner_id)
+            or not (indexed or (last_id is not None and last_id < stored.id))
+        ):  # noqa E501
+            child = klass(**values, **{owner_column: owner_id})
+            inserts.append((len(ids), child))
+            ids.append(child.pk)
+            last_ids_map[str(owner_id)] = None
+            continue
+
+        last_ids_map[str(owner_id)] = stored.id
+        del stored_map[str(stored.id)]
+        ids.append(stored.id)
+
+        if any(getattr(stored, c) != value for c, value in values.items()):
+            updates.append({"id": stored.id, **values})
+
+    # children without an index are ordered by id
+    for (position, child), id in zip(inserts, ordered_ulids(len(inserts))):
+        child.pk = ids[position] = id
+
+    if stored_map:
+        klass.objects.filter(pk__in=list(stored_map)).delete()
+
+    update_from_values(klass, update_columns, rows_of(updates, update_columns))
+    klass.objects.bulk_create([child for _, child in inserts])
+    return ids
+
+
+def save_resume_children_of_documents(
+    resume_id: UUIDType,
+    params: SaveResumeAttrs,
+    stored_map: Mapping[ResumeChildTagType, List[ResumeChildLike]],
+) -> None:
+    """
+    Write each kind of child of the saved resume whose documents are in
+    `params` (`stored_map` holds the stored children, by kind).
+    """
+    personal_info = params.get("personal_info")
+
+    if personal_info is not None:
+        stored = stored_map.get(ResumeComponentEnumType.personal_info, [])
+        personal_info = dict(personal_info, id=stored[0].id if stored else None)
+        photo = personal_info.get("photo")
+
+        if (
+            photo
+            and data_url_encoded_string_delimiter in photo
+            and not (stored and stored[0].photo == photo)
+        ):  # noqa E501
+            url, _ = ResumesDjangoLogic.save_data_url_encoded_file(photo)
+            personal_info["photo"] = url
+
+        save_resume_children(
+            ResumeComponentEnumType.personal_info,
+            stored,
+            [(resume_id, 0, personal_info)],
+        )
+
+    for key, tag in SAVE_RESUME_CHILDREN_KEYS_MAP.items():
+        documents = params.get(key)  # type: ignore
+
+        if documents is None:
+            continue
+
+        ids = save_resume_children(
+            tag,
+            stored_map.get(tag, []),
+            [
+                (resume_id, index, document)
+                for index, document in enumerate(documents)
+            ],
+        )
+
+        if tag not in RESUME_COMPONENT_CHILD_TAGS_MAP:
+            continue
+
+        # achievements of the children kept without `achievements` are kept
+        kept_owner_ids = {
+            str(id)
+            for id, document in zip(ids, documents)
+            if document.get(ACHIEVEMENTS_KEY) is None
+        }
+
+        [achievement_tag] = RESUME_COMPONENT_CHILD_TAGS_MAP[tag]
+
+        save_resume_children(
+            achievement_tag,
+            [
+                achievement
+                for achievement in stored_map.get(achievement_tag, [])
+                if str(achievement.owner_id) not in kept_owner_ids
+            ],
+            [
+                (id, index, achievement)
+                for id, document in zip(ids, documents)
+                for index, achievement in enumerate(
+                    document.get(ACHIEVEMENTS_KEY) or []
+                )
+            ],
+        )
+
+
+def resume_components_created(
+    tag: ResumeComponentEnumType, components: List[models.Model]
+) -> None:
+    resume_ids = list(dict.fromkeys(c.resume_id for c in components))
+    invalidate_resume_children([(tag, resume_id) for resume_id in resume_ids])
+
+    write_through_no_resume_children(
+        (child_tag, component.pk)
+        for component in components
+        for child_tag in RESUME_COMPONENT_CHILD_TAGS_MAP[tag]
+    )
+
+    for resume_id in resume_ids:
+        refresh_resume_snapshot(resume_id)
+
+
+def resume_component_created(
+    tag: ResumeComponentEnumType, component: models.Model
+) -> None:
+    resume_components_created(tag, [component])
+
+
+def resume_children_created(
+    tag_owner_ids: Iterable[Tuple[ResumeChildTagType, UUIDType]],
+) -> None:
+    """
+    Invalidate the cached children of the owners, then refresh the snapshot
+    of each resume they are of, once.
+    """
+    tag_owner_ids = list(dict.fromkeys(tag_owner_ids))
+    invalidate_resume_children(tag_owner_ids)
+    owner_ids_map: MutableMapping[ResumeChildTagType, List[UUIDType]] = {}
+
+    for tag, owner_id in tag_owner_ids:
+        owner_ids_map.setdefault(tag, []).append(owner_id)
+
+    resume_ids = dict.fromkeys(
+        resume_id
+        for tag, owner_ids in owner_ids_map.items()
+        for resume_id in resume_ids_of_owners(tag, owner_ids)
+    )
+
+    for resume_id in resume_ids:
+        refresh_resume_snapshot(resume_id)
+
+
+def resume_child_created(tag: ResumeChildTagType, owner_id: UUIDType) -> None:
+    resume_children_created([(tag, owner_id)])
+
+
+def bulk_create_resume_components(
+    tag: ResumeComponentEnumType, params_list: Iterable[Mapping[str, Any]]
+) -> List[models.Model]:  # noqa E501
+    """
+    Insert the components (of kind `tag`) in one statement, in a
+    transaction with the refresh of the snapshots of their resumes.
+    """
+    klass, _ = RESUME_CHILD_CLASSES_MAP[tag]
+
+    with transaction.atomic():
+        components = klass.objects.bulk_create(
+            [klass(**params) for params in params_list]
+        )  # noqa E501
+
+        resume_components_created(tag, components)
+
+    return components
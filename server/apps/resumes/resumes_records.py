@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+"""
+Records returned by the read getters of `ResumesDjangoLogic` in place of
+model instances. A record only holds the values of the columns of its row -
+as `__slots__`, so it has no `__dict__` - which makes it cheap to build and
+small to cache.
+"""
+
+from typing import Any, Iterable, MutableMapping, Optional, Sequence, Type
+
+from django.db import models
+
+from logics.resumes.resumes_types import ResumeChildTagType
+
+
+class ResumeChildRecord(object):
+    __slots__ = ()
+
+    # kind of the child (ratables and text-only only) - the same for all the
+    # rows of a table, so it is set on the record class
+    tag: Optional[ResumeChildTagType] = None
+
+    def __init__(
+        self, names: Iterable[str], values: Iterable[Any]  # type: ignore
+    ) -> None:
+        for name, value in zip(names, values):
+            setattr(self, name, value)
+
+    # Like model instances, records of the same row are equal.
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and other.id == self.id  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash(self.id)  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self.id}>"  # type: ignore
+
+
+_record_classes: MutableMapping[str, Type[ResumeChildRecord]] = {}
+
+
+def make_record_class(
+    model: Type[models.Model], tag: Optional[ResumeChildTagType] = None
+) -> Type[ResumeChildRecord]:
+    """
+    The record class for the rows of `model`, with a slot per column. The
+    class is a global of this module so that records can be pickled.
+    """
+    name = f"{model.__name__}Record"
+
+    if name not in _record_classes:
+        slots: Sequence[str] = tuple(
+            field.attname for field in model._meta.concrete_fields
+        )
+
+        record_class = type(
+            name,
+            (ResumeChildRecord,),
+            {"__slots__": slots, "__module__": __name__, "tag": tag},
+        )
+
+        _record_classes[name] = record_class
+        globals()[name] = record_class
+
+    return _record_classes[name]
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+Full-text search over resumes. The words of a resume and of all its children
+are kept in the `search_vector` column of its snapshot, computed from the
+snapshot document whenever the snapshot is rebuilt, and matched through a
+GIN index.
+
+This module does not depend on the models so that migrations can use it.
+"""
+
+from typing import Mapping, Sequence
+
+SEARCH_CONFIG = "english"
+
+# The text columns of the children (as named in the snapshot document) that
+# are searched, per kind of child.
+RESUME_CHILD_SEARCH_COLUMNS_MAP: Mapping[str, Sequence[str]] = {
+    "personal_info": ("first_name", "last_name", "profession"),
+    "education": ("school", "course"),
+    "experience": ("position", "company_name"),
+    "skill": ("description",),
+    "spoken_language": ("description",),
+    "supplementary_skill": ("description",),
+    "resume_hobby": ("text",),
+    "education_achievement": ("text",),
+    "experience_achievement": ("text",),
+    "skill_achievement": ("text",),
+}
+
+
+def resume_search_vector_sql(document: str) -> str:
+    """
+    SQL for the `tsvector` of the snapshot document `document` (an SQL
+    expression). Words of the title and description of the resume weigh
+    more than those of its children, so they rank higher.
+    """
+    children_texts = []
+
+    for tag, columns in RESUME_CHILD_SEARCH_COLUMNS_MAP.items():
+        values = ", ".join(f"c->>'{column}'" for column in columns)
+        children = f"{document}->'children'->'{tag}'"
+
+        # kinds without children are JSON nulls
+        children_texts.append(
+            f"""(
+                SELECT string_agg(concat_ws(' ', {values}), ' ')
+                FROM jsonb_array_elements(
+                    CASE jsonb_typeof({children})
+                        WHEN 'array' THEN {children}
+                        ELSE '[]'::jsonb
+                    END
+                ) c
+            )"""
+        )
+
+    return f"""
+        setweight(
+            to_tsvector(
+                '{SEARCH_CONFIG}',
+                concat_ws(
+                    ' ',
+                    {document}->'resume'->>'title',
+                    {document}->'resume'->>'description'
+                )
+            ),
+            'A'
+        ) || setweight(
+            to_tsvector(
+                '{SEARCH_CONFIG}', concat_ws(' ', {', '.join(children_texts)})
+            ),
+            'B'
+        )
+    """
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+
+"""
+ASGI config for server project.
+
+It exposes the ASGI callable as a module-level variable named ``application``
+and is served by uvicorn workers (see `docker/django/gunicorn.sh`).
+
+Django 2.2 has no ASGI support of its own: `/graphql` is served by the async
+`AsyncGraphQLView` on the event loop and every other path by the WSGI
+application, on a thread (through uvicorn's `WSGIMiddleware`, which sends the
+chunks of responses as they are produced). Request bodies are read on the
+event loop for both, so slow clients (and large photo uploads) do not hold a
+thread or process - and as they are held in memory, bodies larger than
+`settings.DATA_UPLOAD_MAX_MEMORY_SIZE` are refused (413).
+
+`/graphql` requests and responses go through the hooks of the middleware of
+`settings.MIDDLEWARE` (`MiddlewareHooks`) as under WSGI - security headers,
+sessions, authentication and all.
+"""
+
+import os
+import sys
+from io import BytesIO
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.handlers.wsgi import WSGIRequest
+from django.core.wsgi import get_wsgi_application
+from django.http import HttpRequest, HttpResponse
+from django.utils import translation
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.module_loading import import_string
+from uvicorn.middleware.wsgi import WSGIMiddleware
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings")
+
+wsgi_application = get_wsgi_application()
+
+# django must be set up before the view (and the schema) can be imported
+from server.async_graphql_view import AsyncGraphQLView  # noqa E402
+from server.thread_pool import run_in_db_thread  # noqa E402
+
+GRAPHQL_PATH = "/graphql"
+
+graphql_view = AsyncGraphQLView()
+
+HeadersType = List[Tuple[bytes, bytes]]
+
+
+class RequestBodyTooLarge(Exception):
+    pass
+
+
+class MiddlewareHooks(object):
+    """
+    The request and response hooks of the middleware of
+    `settings.MIDDLEWARE`, to run around `AsyncGraphQLView` in the order
+    django runs them around views. Middleware without these hooks
+    (`set_graphql_context_middleware`) is left out: the view sets up the
+    graphql context itself. View hooks are not run either, as `/graphql`
+    does not check CSRF tokens under ASGI - its mutations are authorized by
+    the `Authorization` header.
+    """
+
+    def __init__(self) -> None:
+        self.middleware: List[MiddlewareMixin] = []
+
+        for middleware_path in settings.MIDDLEWARE:
+            middleware_class = import_string(middleware_path)
+
+            if not (
+                isinstance(middleware_class, type)
+                and issubclass(middleware_class, MiddlewareMixin)
+            ):  # noqa E501
+                continue
+
+            try:
+                self.middleware.append(middleware_class())
+            except MiddlewareNotUsed:
+                continue
+
+    def process_request(self, request: HttpRequest) -> Optional[HttpResponse]:
+        """
+        Run the request hooks in order - returning the response of the
+        first one answering the request, through the response hooks of the
+        middleware run so far.
+        """
+        for index, middleware in enumerate(self.middleware):
+            hook = getattr(middleware, "process_request", None)
+            response = hook(request) if hook is not None else None
+
+            if response is not None:
+                return self.process_response(request, response, index + 1)
+
+        return None
+
+    def process_response(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        count: Optional[int] = None,
+    ) -> HttpResponse:  # noqa E501
+        """
+        Run the response hooks of the first `count` middleware (all by
+        default) in reverse order. They may run on another thread than the
+        request hooks did, so the language these activated (`LocaleMiddleware`)
+        is activated again.
+        """
+        language = getattr(request, "LANGUAGE_CODE", settings.LANGUAGE_CODE)
+
+        with translation.override(language):
+            for middleware in reversed(self.middleware[:count]):
+                hook = getattr(middleware, "process_response", None)
+
+                if hook is not None:
+                    response = hook(request, response)
+
+        return response
+
+
+middleware_hooks = MiddlewareHooks()
+
+
+def closing_wsgi_application(environ, start_response) -> Iterator[bytes]:
+    """
+    The WSGI application, closing its responses once they are sent - which
+    django relies on to finish the request (and release its database
+    connection): `WSGIMiddleware` does not.
+    """
+    result = wsgi_application(environ, start_response)
+
+    try:
+        yield from result
+    finally:
+        if hasattr(result, "close"):
+            result.close()
+
+
+wsgi_middleware = WSGIMiddleware(closing_wsgi_application)
+
+
+async def application(scope, receive, send) -> None:
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+        return
+
+    if scope["type"] != "http":
+        raise ValueError(f"unsupported ASGI scope type: {scope['type']}")
+
+    try:
+        body = await read_body(
+            scope, receive, settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        )  # noqa E501
+    except RequestBodyTooLarge:
+        await send_response(
+            send,
+            413,
+            [(b"content-type", b"text/plain; charset=utf-8")],
+            [b"Request body too large."],
+        )
+
+        return
+
+    if scope["path"] == GRAPHQL_PATH:
+        environ = make_wsgi_environ(scope, body)
+        response = await dispatch_graphql(WSGIRequest(environ))
+
+        headers = [
+            (name.encode("latin1"), value.encode("latin1"))
+            for name, value in response.items()
+        ]
+
+        for cookie in response.cookies.values():
+            headers.append(
+                (b"set-cookie", cookie.output(header="").strip().encode())
+            )
+
+        await send_response(
+            send, response.status_code, headers, [response.content]
+        )
+
+        return
+
+    async def receive_body():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    # the body has been read in full (it may have been sent chunked)
+    headers = [
+        (name, value)
+        for name, value in scope["headers"]
+        if name != b"content-length"
+    ]
+    headers.append((b"content-length", str(len(body)).encode()))
+
+    await wsgi_middleware(dict(scope, headers=headers), receive_body, send)
+
+
+async def dispatch_graphql(request: HttpRequest) -> HttpResponse:
+    # the hooks may query the database (sessions, users)
+    response = await run_in_db_thread(middleware_hooks.process_request, request)
+
+    if response is not None:
+        return response
+
+    response = await graphql_view.async_dispatch(request)
+
+    return await run_in_db_thread(
+        middleware_hooks.process_response, request, response
+    )  # noqa E501
+
+
+async def lifespan(receive, send) -> None:
+    while True:
+        message = await receive()
+
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def read_body(scope, receive, max_size: Optional[int]) -> bytes:
+    """
+    The body of the request - unless it is larger than `max_size` bytes
+    (`None` for no limit), as declared (`Content-Length`) or as read so far:
+    `RequestBodyTooLarge` is raised as soon as it is known.
+    """
+    content_length = dict(scope["headers"]).get(b"content-length", b"")
+
+    if (
+        max_size is not None
+        and content_length.isdigit()
+        and int(content_length) > max_size
+    ):  # noqa E501
+        raise RequestBodyTooLarge()
+
+    body = BytesIO()
+    size = 0
+    more_body = True
+
+    while more_body:
+        message = await receive()
+
+        if message["type"] == "http.disconnect":
+            break
+
+        chunk = message.get("body", b"")
+        size += len(chunk)
+
+        if max_size is not None and size > max_size:
+            raise RequestBodyTooLarge()
+
+        body.write(chunk)
+        more_body = message.get("more_body", False)
+
+    return body.getvalue()
+
+
+async def send_response(
+    send, status: int, headers: HeadersType, chunks: Iterable[bytes]
+) -> None:
+    await send(
+        {"type": "http.response.start", "status": status, "headers": headers}
+    )
+
+    for chunk in chunks:
+        await send(
+            {"type": "http.response.body", "body": chunk, "more_body": True}
+        )
+
+    await send({"type": "http.response.body", "body": b""})
+
+
+def make_wsgi_environ(
+    scope, body: bytes
+) -> MutableMapping[str, Any]:  # type: ignore
+    server_name, server_port = scope.get("server") or ("localhost", 80)
+
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", ""),
+        "PATH_INFO": scope["path"],
+        "QUERY_STRING": scope["query_string"].decode("latin1"),
+        "SERVER_NAME": server_name,
+        "SERVER_PORT": str(server_port),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+
+    if scope.get("client"):
+        environ["REMOTE_ADDR"] = scope["client"][0]
+
+    for raw_name, raw_value in scope["headers"]:
+        name = raw_name.decode("latin1").upper().replace("-", "_")
+        value = raw_value.decode("latin1")
+
+        if name not in ("CONTENT_LENGTH", "CONTENT_TYPE"):
+            name = f"HTTP_{name}"
+
+        if name in environ:
+            value = f"{environ[name]},{value}"
+
+        environ[name] = value
+
+    # the body has been read in full (it may have been sent chunked)
+    environ["CONTENT_LENGTH"] = str(len(body))
+
+    return environ
+
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+"""
+The `/graphql` endpoint of the ASGI application (`server/asgi.py`).
+
+Queries run on the event loop with `AsyncAppDataLoader` so that one worker
+process overlaps many of them while they wait on postgres. Mutations keep
+using the synchronous ORM and are run on the database thread pool.
+
+Requests reach this view through the hooks of django's middleware (see
+`server/asgi.py`) but not `set_graphql_context_middleware`, so it sets up the
+graphql context (`current_user`, `app_data_loader`) itself. `getResume`
+queries are answered conditionally and batches of operations are accepted,
+as by `AppGraphQLView`.
+"""
+
+from asyncio import gather, get_event_loop
+from typing import Any, List, Optional, Tuple
+
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBadRequest,
+    HttpResponseNotAllowed,
+    HttpResponseNotModified,
+)
+from django.middleware.csrf import get_token
+from graphene_django.views import HttpError
+from graphql.execution import ExecutionResult
+from graphql.execution.executors.asyncio import AsyncioExecutor
+
+from logics.accounts import user_from_jwt
+from logics.data_loader import AsyncAppDataLoader
+from logics.resumes import ResumesLogic
+from server.graphql_view import (
+    AppGraphQLView,
+    etag_matches,
+    make_resume_etag,
+    set_etag,
+)
+from server.middlewares import (
+    jwt_from_authorization_header,
+    make_app_data_loader,
+)
+from server.response_cache import cache_response, get_cached_response
+from server.thread_pool import run_in_db_thread
+
+
+class AsyncGraphQLView(AppGraphQLView):
+    async def async_dispatch(self, request: HttpRequest) -> HttpResponse:
+        try:
+            if request.method.lower() not in ("get", "post"):
+                raise HttpError(
+                    HttpResponseNotAllowed(
+                        ["GET", "POST"],
+                        "GraphQL only supports GET and POST requests.",
+                    )
+                )
+
+            data = self.parse_body(request)
+            await self.set_current_user(request)
+
+            if isinstance(data, list) and request.method.lower() == "post":
+                return await self.async_dispatch_batch(request, data)
+
+            etag = await self.async_get_resume_etag(request, data)
+
+            if etag is not None and etag_matches(request, etag):
+                return set_etag(HttpResponseNotModified(), etag)
+
+            # as `GraphQLView.dispatch` (`ensure_csrf_cookie`)
+            get_token(request)
+
+            result, status_code = await self.async_get_response(request, data)
+
+            response = HttpResponse(
+                status=status_code,
+                content=result,
+                content_type="application/json",
+            )
+
+            if etag is not None and status_code == 200:
+                set_etag(response, etag)
+
+            return response
+
+        except HttpError as e:
+            response = e.response
+            response["Content-Type"] = "application/json"
+            response.content = self.json_encode(
+                request, {"errors": [self.format_error(e)]}
+            )
+            return response
+
+    async def async_dispatch_batch(
+        self, request: HttpRequest, data
+    ) -> HttpResponse:  # noqa E501
+        """
+        Execute the operations of the batch in order - except that queries
+        following each other run together, with one data loader, which
+        batches what they fetch.
+        """
+        over_budget_response = self.get_batch_over_budget_response(
+            request, data
+        )  # noqa E501
+
+        if over_budget_response is not None:
+            return over_budget_response
+
+        responses: List[Tuple[str, int]] = []
+        queries: List[Any] = []  # type: ignore
+
+        for entry in data:
+            if self.get_batch_entry_operation_type(request, entry) == "query":
+                queries.append(entry)
+                continue
+
+            responses.extend(
+                await self.async_get_batch_entries_responses(request, queries)
+            )  # noqa E501
+
+            queries = []
+
+            responses.append(
+                await self.async_get_batch_entry_response(request, entry)
+            )  # noqa E501
+
+        responses.extend(
+            await self.async_get_batch_entries_responses(request, queries)
+        )  # noqa E501
+
+        return self.encode_batch_responses(responses)
+
+    async def async_get_batch_entries_responses(
+        self, request: HttpRequest, entries
+    ) -> List[Tuple[str, int]]:  # noqa E501
+        return await gather(
+            *(
+                self.async_get_batch_entry_response(request, entry)
+                for entry in entries
+            )
+        )
+
+    async def async_get_batch_entry_response(
+        self, request: HttpRequest, data
+    ) -> Tuple[str, int]:  # noqa E501
+        try:
+            return await self.async_get_response(request, data)
+        except HttpError as e:
+            return (
+                self.json_encode(request, {"errors": [self.format_error(e)]}),
+                e.response.status_code,
+            )
+
+    async def async_get_response(self, request: HttpRequest, data):
+        query, variables, operation_name, _ = self.get_graphql_params(
+            request, data
+        )  # noqa E501
+
+        cache_user_id = self.get_response_cache_user_id(
+            request, query, operation_name
+        )  # noqa E501
+
+        if cache_user_id is not None:
+            result, cache_key = await run_in_db_thread(
+                get_cached_response,
+                cache_user_id,
+                query,
+                variables,
+                operation_name,
+            )
+
+            if result is not None:
+                return result, 200
+
+        execution_result = await self.async_execute_graphql_request(
+            request, query, variables, operation_name
+        )
+
+        result, status_code = self.encode_execution_result(
+            request, execution_result
+        )  # noqa E501
+
+        if (
+            cache_user_id is not None
+            and status_code == 200
+            and not execution_result.errors
+        ):  # noqa E501
+            await run_in_db_thread(cache_response, cache_key, result)
+
+        return result, status_code
+
+    async def async_execute_graphql_request(
+        self, request: HttpRequest, query, variables, operation_name
+    ) -> ExecutionResult:
+        if not query:
+            raise HttpError(
+                HttpResponseBadRequest("Must provide query string.")
+            )  # noqa E501
+
+        try:
+            backend = self.get_backend(request)
+            document = backend.document_from_string(self.schema, query)
+        except Exception as e:
+            return ExecutionResult(errors=[e], invalid=True)
+
+        operation_type = document.get_operation_type(operation_name)
+
+        if request.method.lower() == "get" and operation_type != "query":
+            raise HttpError(
+                HttpResponseNotAllowed(
+                    ["POST"],
+                    "Can only perform a {} operation from a POST request.".format(  # noqa E501
+                        operation_type
+                    ),
+                )
+            )
+
+        try:
+            await self.set_context(request, operation_type)
+
+            options = dict(
+                root_value=self.get_root_value(request),
+                variable_values=variables,
+                operation_name=operation_name,
+                context_value=self.get_context(request),
+                middleware=self.get_middleware(request),
+            )
+
+            if operation_type == "query":
+                return await document.execute(
+                    executor=AsyncioExecutor(loop=get_event_loop()),
+                    return_promise=True,
+                    **options,
+                )
+
+            return await run_in_db_thread(document.execute, **options)
+        except Exception as e:
+            return ExecutionResult(errors=[e], invalid=True)
+
+    async def async_get_resume_etag(
+        self, request: HttpRequest, data
+    ) -> Optional[str]:  # noqa E501
+        params = self.get_resume_etag_params(request, data)
+
+        if params is None:
+            return None
+
+        versions = await ResumesLogic.async_get_resume_versions(
+            params.resume_ids, params.user_id
+        )  # noqa E501
+
+        return make_resume_etag(params, versions)
+
+    async def set_context(self, request: HttpRequest, operation_type) -> None:
+        if operation_type == "query":
+            # queries of a batch run together share theirs
+            if not isinstance(
+                getattr(request, "app_data_loader", None), AsyncAppDataLoader
+            ):  # noqa E501
+                setattr(request, "app_data_loader", AsyncAppDataLoader())
+        else:
+            setattr(request, "app_data_loader", make_app_data_loader())
+
+    async def set_current_user(self, request: HttpRequest) -> None:
+        jwt = jwt_from_authorization_header(
+            request.headers.get("Authorization")
+        )  # noqa E501
+
+        if jwt is not None:
+            user = await run_in_db_thread(user_from_jwt, jwt)
+            setattr(request, "current_user", user)
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+"""
+The graphql backend of the `/graphql` views. Documents are parsed and
+validated once per worker and kept, by their text, in a least recently used
+cache - invalid documents too, with their validation errors - so the small
+documents clients send over and over are only executed. Operations costing
+more than the budget are rejected before they are executed - as are batches
+whose operations together cost more than the budget.
+
+The texts of persisted queries (see `server/persisted_queries.py`) are kept
+by hash in the same way, so that requests sending only the hash of a known
+document do not even look it up in the shared cache.
+"""
+
+from collections import OrderedDict
+from functools import partial
+from threading import Lock
+from typing import Any, Generic, List, NamedTuple, Optional, TypeVar
+
+from django.conf import settings
+from graphql.backend.base import GraphQLDocument
+from graphql.backend.core import GraphQLCoreBackend
+from graphql.error import GraphQLError
+from graphql.execution import ExecutionResult, execute
+from graphql.language.base import parse
+from graphql.validation import validate
+from promise import Promise
+
+from server.graphql_cost import MaxItemsType, OperationCost, operation_cost
+
+KeyType = TypeVar("KeyType")
+ValueType = TypeVar("ValueType")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+
+
+class LRUCache(Generic[KeyType, ValueType]):
+    """
+    At most `max_size` values - the least recently used ones are dropped
+    first. Safe to share between threads.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.values: "OrderedDict[KeyType, ValueType]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+    def get(self, key: KeyType) -> Optional[ValueType]:
+        with self.lock:
+            value = self.values.get(key)
+
+            if value is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.values.move_to_end(key)
+            return value
+
+    def set(self, key: KeyType, value: ValueType) -> None:
+        with self.lock:
+            self.values[key] = value
+            self.values.move_to_end(key)
+
+            while len(self.values) > self.max_size:
+                self.values.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.values.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self.lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                max_size=self.max_size,
+                size=len(self.values),
+            )
+
+
+class ValidatedDocument(GraphQLDocument):
+    def __init__(
+        self, schema, document_string, document_ast, errors, execute
+    ) -> None:  # noqa E501
+        super().__init__(schema, document_string, document_ast, execute)
+        self.errors: List[Any] = errors  # type: ignore
+
+
+def invalid_result(errors, *args, **kwargs):
+    result = ExecutionResult(errors=errors, invalid=True)
+
+    # as `execute` does, for callers awaiting the result
+    return Promise.resolve(result) if kwargs.get("return_promise") else result
+
+
+def cost_over_budget_error(cost: int, what: str) -> Optional[GraphQLError]:
+    if cost <= settings.GRAPHQL_MAX_QUERY_COST:
+        return None
+
+    return GraphQLError(
+        f"{what} cost {cost} exceeds the budget of "
+        f"{settings.GRAPHQL_MAX_QUERY_COST}"
+    )
+
+
+def execute_within_budget(
+    max_items: MaxItemsType, schema, document_ast, *args, **kwargs
+):  # noqa E501
+    """
+    Execute the validated document - unless its operation goes over the
+    budget of `settings.GRAPHQL_MAX_QUERY_COST` or
+    `settings.GRAPHQL_MAX_QUERY_DEPTH` (see `server/graphql_cost.py`).
+    """
+    cost = operation_cost(
+        schema,
+        document_ast,
+        kwargs.get("operation_name"),
+        kwargs.get("variable_values"),
+        settings.GRAPHQL_COST_LIST_SIZE,
+        max_items,
+    )
+
+    if cost is not None:
+        if cost.depth > settings.GRAPHQL_MAX_QUERY_DEPTH:
+            return invalid_result(
+                [
+                    GraphQLError(
+                        f"query depth {cost.depth} exceeds the maximum of "
+                        f"{settings.GRAPHQL_MAX_QUERY_DEPTH}"
+                    )
+                ],
+                **kwargs,
+            )
+
+        error = cost_over_budget_error(cost.cost, "query")
+
+        if error is not None:
+            return invalid_result([error], **kwargs)
+
+    return execute(schema, document_ast, *args, **kwargs)
+
+
+class AppGraphQLBackend(GraphQLCoreBackend):
+    def __init__(
+        self,
+        max_documents: int,
+        executor=None,
+        max_items: MaxItemsType = None,
+    ) -> None:
+        super().__init__(executor)
+        # the most items fields taking `first` return, by field name
+        self.max_items = max_items
+        self.documents: LRUCache[str, ValidatedDocument] = LRUCache(
+            max_documents
+        )  # noqa E501
+        # texts of persisted queries, by hash
+        self.persisted_queries: LRUCache[str, str] = LRUCache(max_documents)
+
+    def document_from_string(self, schema, document_string):
+        if not isinstance(document_string, str):
+            return super().document_from_string(schema, document_string)
+
+        document = self.documents.get(document_string)
+
+        if document is not None and document.schema is schema:
+            return document
+
+        # syntax errors are raised (and reported) as by the default backend
+        document_ast = parse(document_string)
+        errors = validate(schema, document_ast)
+
+        document = ValidatedDocument(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            errors=errors,
+            execute=partial(invalid_result, errors)
+            if errors
+            else partial(
+                execute_within_budget,
+                self.max_items,
+                schema,
+                document_ast,
+                **self.execute_params,
+            ),
+        )
+
+        self.documents.set(document_string, document)
+        return document
+
+    def get_operation_cost(
+        self, schema, query, operation_name, variables
+    ) -> Optional[OperationCost]:  # noqa E501
+        """
+        The cost of the operation (see `execute_within_budget`) - `None` if
+        the document is invalid, its errors are left to be reported when it
+        is executed.
+        """
+        try:
+            document = self.document_from_string(schema, query)
+        except Exception:
+            return None
+
+        if not isinstance(document, ValidatedDocument) or document.errors:
+            return None
+
+        return operation_cost(
+            schema,
+            document.document_ast,
+            operation_name,
+            variables,
+            settings.GRAPHQL_COST_LIST_SIZE,
+            self.max_items,
+        )
+
+    def get_persisted_query(self, sha256_hash: str) -> Optional[str]:
+        return self.persisted_queries.get(sha256_hash)
+
+    def persist_query(self, schema, sha256_hash: str, query: str) -> bool:
+        """
+        Keep `query` (parsed and validated) as the persisted query
+        `sha256_hash` - unless it is invalid, in which case `False` is
+        returned and the errors are left to be reported when it is executed.
+        """
+        try:
+            document = self.document_from_string(schema, query)
+        except Exception:
+            return False
+
+        if document.errors:
+            return False
+
+        self.persisted_queries.set(sha256_hash, query)
+        return True
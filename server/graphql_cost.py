@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+"""
+Static cost of graphql operations, worked out from the validated document
+(and the variables) before the operation is executed, so that operations
+over budget are rejected without costing a resolver.
+
+Every field returning an object costs 1 (scalars are free) plus the cost
+of its selection. A list field costs that once per item it is expected to
+return: `first` items when it, or the connection it is the edges of, takes
+`first`; as many items as a list argument holds (`getResumes(ids)`);
+`list_size` items otherwise. When `first` is not given, it is the default
+value of the argument, and it is never more than the most items the field
+returns (`max_items`, by field name) - as its resolver sees it.
+"""
+
+from typing import Any, Mapping, NamedTuple, Optional, Tuple
+
+from graphql.language import ast
+from graphql.type import (
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+)
+
+VariablesType = Optional[Mapping[str, Any]]  # type: ignore
+MaxItemsType = Optional[Mapping[str, int]]
+
+
+class OperationCost(NamedTuple):
+    cost: int
+    depth: int
+
+
+def unwrap_type(type_) -> Tuple[Any, bool]:  # type: ignore
+    """
+    The named type of `type_` and whether it is a list.
+    """
+    is_list = False
+
+    while isinstance(type_, (GraphQLList, GraphQLNonNull)):
+        is_list = is_list or isinstance(type_, GraphQLList)
+        type_ = type_.of_type
+
+    return type_, is_list
+
+
+class CostAnalyzer(object):
+    def __init__(
+        self,
+        schema,
+        document_ast: ast.Document,
+        variables: VariablesType,
+        list_size: int,
+        max_items: MaxItemsType = None,
+    ) -> None:
+        self.schema = schema
+        self.variables = variables or {}
+        self.list_size = list_size
+        self.max_items = max_items or {}
+
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document_ast.definitions
+            if isinstance(definition, ast.FragmentDefinition)
+        }
+
+    def value_of(self, value_ast: ast.Value) -> Any:  # type: ignore
+        if isinstance(value_ast, ast.Variable):
+            return self.variables.get(value_ast.name.value)
+
+        if isinstance(value_ast, ast.IntValue):
+            return int(value_ast.value)
+
+        if isinstance(value_ast, ast.ListValue):
+            return value_ast.values
+
+        return None
+
+    def items_of(self, field: ast.Field, field_def) -> Optional[int]:
+        """
+        The number of items the arguments of `field` ask for, if they say.
+        """
+        values = {
+            argument.name.value: self.value_of(argument.value)
+            for argument in field.arguments
+        }
+
+        first = values.get("first")
+        first_def = field_def.args.get("first")
+
+        if first is None and first_def is not None:
+            first = first_def.default_value
+
+        if isinstance(first, int):
+            first = max(first, 0)
+            max_items = self.max_items.get(field.name.value)
+            return first if max_items is None else min(first, max_items)
+
+        for value in values.values():
+            if isinstance(value, list):
+                return len(value)
+
+        return None
+
+    def cost_of_selection_set(
+        self,
+        selection_set: Optional[ast.SelectionSet],
+        parent_type,
+        items: Optional[int],
+    ) -> OperationCost:  # noqa E501
+        """
+        `items` is the number of items asked for by the field owning the
+        selection set, for its edges.
+        """
+        cost = 0
+        depth = 0
+
+        if selection_set is None:
+            return OperationCost(cost=0, depth=0)
+
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                selection_cost = self.cost_of_field(
+                    selection, parent_type, items
+                )  # noqa E501
+            else:
+                if isinstance(selection, ast.FragmentSpread):
+                    fragment = self.fragments.get(selection.name.value)
+
+                    if fragment is None:
+                        continue
+                else:
+                    fragment = selection
+
+                fragment_type = (
+                    self.schema.get_type(fragment.type_condition.name.value)
+                    if fragment.type_condition
+                    else parent_type
+                )
+
+                selection_cost = self.cost_of_selection_set(
+                    fragment.selection_set, fragment_type, items
+                )
+
+            cost += selection_cost.cost
+            depth = max(depth, selection_cost.depth)
+
+        return OperationCost(cost=cost, depth=depth)
+
+    def cost_of_field(
+        self, field: ast.Field, parent_type, items: Optional[int]
+    ) -> OperationCost:  # noqa E501
+        if not isinstance(
+            parent_type, (GraphQLObjectType, GraphQLInterfaceType)
+        ):  # noqa E501
+            return OperationCost(cost=0, depth=0)
+
+        field_def = parent_type.fields.get(field.name.value)
+
+        if field_def is None:
+            # `__typename` and the like
+            return OperationCost(cost=0, depth=0)
+
+        field_type, is_list = unwrap_type(field_def.type)
+
+        if field.selection_set is None:
+            return OperationCost(cost=0, depth=0)
+
+        field_items = self.items_of(field, field_def)
+
+        selection_cost = self.cost_of_selection_set(
+            field.selection_set,
+            field_type,
+            # a connection passes the number of items on to its edges
+            None if is_list else field_items,
+        )
+
+        cost = 1 + selection_cost.cost
+
+        if is_list:
+            multiplier = field_items if field_items is not None else items
+            cost *= self.list_size if multiplier is None else multiplier
+
+        return OperationCost(cost=cost, depth=1 + selection_cost.depth)
+
+    def cost_of_operation(
+        self, operation: ast.OperationDefinition
+    ) -> OperationCost:  # noqa E501
+        if operation.operation == "mutation":
+            root_type = self.schema.get_mutation_type()
+        elif operation.operation == "subscription":
+            root_type = self.schema.get_subscription_type()
+        else:
+            root_type = self.schema.get_query_type()
+
+        return self.cost_of_selection_set(
+            operation.selection_set, root_type, None
+        )  # noqa E501
+
+
+def operation_cost(
+    schema,
+    document_ast: ast.Document,
+    operation_name: Optional[str],
+    variables: VariablesType,
+    list_size: int,
+    max_items: MaxItemsType = None,
+) -> Optional[OperationCost]:
+    """
+    The cost of the operation `operation_name` (or of the only operation)
+    of `document_ast` - `None` if there is no such operation.
+    """
+    operations = [
+        definition
+        for definition in document_ast.definitions
+        if isinstance(definition, ast.OperationDefinition)
+        and (
+            operation_name is None
+            or (definition.name and definition.name.value == operation_name)
+        )
+    ]
+
+    if len(operations) != 1:
+        return None
+
+    analyzer = CostAnalyzer(
+        schema, document_ast, variables, list_size, max_items
+    )  # noqa E501
+
+    return analyzer.cost_of_operation(operations[0])
@@ -0,0 +1,595 @@
+# -*- coding: utf-8 -*-
+
+"""
+The `/graphql` endpoint of the WSGI application (the ASGI application
+serves it with `AsyncGraphQLView`, which extends this view).
+
+The responses to the queries of each user may be cached until the user
+writes to a resume (see `server/response_cache.py`).
+
+A request may hold a JSON array of operations (a batch), executed in order
+with the data loader and user of the request, and answered with the array
+of their responses. A batch whose operations together cost more than the
+budget (see `server/graphql_backend.py`) is rejected as a whole.
+
+Clients may send persisted queries - the hash of a query document instead
+of the document (see `server/persisted_queries.py`).
+
+Queries made only of `getResume` fields are answered conditionally: the
+response carries an `ETag` derived from the versions of the resumes (bumped
+on every write to a resume or its children) and a request whose
+`If-None-Match` holds that tag gets a `304` - after one indexed lookup of
+the versions and without running any resolver.
+"""
+
+import json
+from hashlib import sha256
+from typing import Any, List, Mapping, NamedTuple, Optional
+
+from django.conf import settings
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBadRequest,
+    HttpResponseNotModified,
+)
+from django.utils.http import parse_etags
+from graphene_django.views import GraphQLView, HttpError
+from graphql.language import ast
+
+from logics.graphql_schema import graphql_max_items
+from logics.logics_utils import UUIDType
+from logics.resumes import ResumesLogic
+from server.graphql_backend import AppGraphQLBackend, cost_over_budget_error
+from server.response_cache import cache_response, get_cached_response
+from server.persisted_queries import (
+    PERSISTED_QUERY_VERSION,
+    get_persisted_query,
+    persist_query,
+    query_hash,
+)
+
+graphql_backend = AppGraphQLBackend(
+    max_documents=settings.GRAPHQL_DOCUMENTS_CACHE_SIZE,
+    max_items=graphql_max_items,
+)
+
+
+class ResumeETagParams(NamedTuple):
+    user_id: UUIDType
+    resume_ids: List[str]
+    # what, besides the versions of the resumes, the response depends on
+    request_key: List[Any]  # type: ignore
+
+
+def resume_id_of_get_resume_field(
+    field: ast.Field, variables: Optional[Mapping[str, Any]]  # type: ignore
+) -> Optional[str]:
+    variables = variables or {}
+    arguments = {
+        argument.name.value: argument.value for argument in field.arguments
+    }
+    input_value = arguments.get("input")
+
+    if isinstance(input_value, ast.Variable):
+        input_value = variables.get(input_value.name.value)
+        id = input_value.get("id") if isinstance(input_value, dict) else None
+    elif isinstance(input_value, ast.ObjectValue):
+        id_values = [
+            input_field.value
+            for input_field in input_value.fields
+            if input_field.name.value == "id"
+        ]
+
+        id = id_values[0] if id_values else None
+
+        if isinstance(id, ast.Variable):
+            id = variables.get(id.name.value)
+        elif isinstance(id, (ast.StringValue, ast.IntValue)):
+            id = id.value
+        else:
+            id = None
+    else:
+        id = None
+
+    return None if id is None else str(id)
+
+
+def resume_ids_of_get_resume_query(
+    document_ast: ast.Document,
+    operation_name: Optional[str],
+    variables: Optional[Mapping[str, Any]],  # type: ignore
+) -> Optional[List[str]]:
+    """
+    The ids of the resumes fetched by the operation if it is a query made
+    only of `getResume` fields (by id) - `None` otherwise.
+    """
+    operations = [
+        definition
+        for definition in document_ast.definitions
+        if isinstance(definition, ast.OperationDefinition)
+        and (
+            operation_name is None
+            or (definition.name and definition.name.value == operation_name)
+        )
+    ]
+
+    if len(operations) != 1 or operations[0].operation != "query":
+        return None
+
+    resume_ids = []
+
+    for selection in operations[0].selection_set.selections:
+        if not (
+            isinstance(selection, ast.Field)
+            and selection.name.value == "getResume"
+        ):  # noqa E501
+            return None
+
+        resume_id = resume_id_of_get_resume_field(selection, variables)
+
+        if resume_id is None:
+            return None
+
+        resume_ids.append(resume_id)
+
+    return resume_ids
+
+
+def make_resume_etag(
+    params: ResumeETagParams, versions: Mapping[str, int]
+) -> Optional[str]:  # noqa E501
+    """
+    `None` unless every resume has a version - a resume not found (or not of
+    the user) may yet be created.
+    """
+    if any(resume_id not in versions for resume_id in params.resume_ids):
+        return None
+
+    key = json.dumps(
+        [
+            str(params.user_id),
+            params.request_key,
+            [versions[resume_id] for resume_id in params.resume_ids],
+        ],
+        sort_keys=True,
+        default=str,
+    )
+
+    return f'"{sha256(key.encode()).hexdigest()}"'
+
+
+def etag_matches(request: HttpRequest, etag: str) -> bool:
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+
+    if not if_none_match:
+        return False
+
+    # weak comparison, as for GET requests
+    return etag in (
+        tag[2:] if tag.startswith("W/") else tag
+        for tag in parse_etags(if_none_match)
+    )
+
+
+def set_etag(response: HttpResponse, etag: str) -> HttpResponse:
+    response["ETag"] = etag
+    # the response is of one user and must be revalidated before reuse
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def persisted_query_hash(request: HttpRequest, data) -> Optional[str]:
+    """
+    The hash of the persisted query of the request - `None` if the request
+    does not use persisted queries.
+    """
+    extensions = request.GET.get("extensions") or data.get("extensions")
+
+    if not extensions:
+        return None
+
+    if isinstance(extensions, str):
+        try:
+            extensions = json.loads(extensions)
+        except ValueError:
+            raise HttpError(
+                HttpResponseBadRequest("Extensions are invalid JSON.")
+            )  # noqa E501
+
+    persisted_query = (
+        extensions.get("persistedQuery")
+        if isinstance(extensions, dict)
+        else None
+    )
+
+    if persisted_query is None:
+        return None
+
+    sha256_hash = persisted_query.get("sha256Hash")
+
+    if (
+        persisted_query.get("version") != PERSISTED_QUERY_VERSION
+        or not isinstance(sha256_hash, str)
+    ):  # noqa E501
+        raise HttpError(HttpResponseBadRequest("Unsupported persisted query."))
+
+    return sha256_hash
+
+
+class AppGraphQLView(GraphQLView):
+    def __init__(self, **kwargs):
+        kwargs.setdefault("backend", graphql_backend)
+        super().__init__(**kwargs)
+
+    def get_graphql_params(self, request, data):
+        query, variables, operation_name, id = super().get_graphql_params(
+            request, data
+        )  # noqa E501
+
+        sha256_hash = persisted_query_hash(request, data)
+
+        if sha256_hash is not None:
+            query = self.resolve_persisted_query(sha256_hash, query)
+
+        return query, variables, operation_name, id
+
+    def resolve_persisted_query(
+        self, sha256_hash: str, query: Optional[str]
+    ) -> str:  # noqa E501
+        """
+        The document of the persisted query `sha256_hash` - registering
+        `query` (if valid) as that document when it is given.
+        """
+        backend = self.backend
+
+        if query is None:
+            query = backend.get_persisted_query(sha256_hash)
+
+            if query is not None:
+                return query
+
+            query = get_persisted_query(sha256_hash)
+
+            if query is None:
+                # the client sends the document next
+                raise HttpError(HttpResponse(), "PersistedQueryNotFound")
+
+            backend.persist_query(self.schema, sha256_hash, query)
+            return query
+
+        if query_hash(query) != sha256_hash:
+            raise HttpError(
+                HttpResponseBadRequest("provided sha does not match query")
+            )  # noqa E501
+
+        if backend.get_persisted_query(sha256_hash) is None:
+            if backend.persist_query(self.schema, sha256_hash, query):
+                persist_query(sha256_hash, query)
+
+        return query
+
+    def get_response(self, request, data, show_graphiql=False):
+        query, variables, operation_name, id = self.get_graphql_params(
+            request, data
+        )  # noqa E501
+
+        cache_user_id = self.get_response_cache_user_id(
+            request, query, operation_name
+        )  # noqa E501
+
+        if cache_user_id is not None:
+            result, cache_key = get_cached_response(
+                cache_user_id, query, variables, operation_name
+            )  # noqa E501
+
+            if result is not None:
+                return result, 200
+
+        execution_result = self.execute_graphql_request(
+            request, data, query, variables, operation_name, show_graphiql
+        )
+
+        result, status_code = self.encode_execution_result(
+            request, execution_result, id, show_graphiql
+        )  # noqa E501
+
+        if (
+            cache_user_id is not None
+            and status_code == 200
+            and not execution_result.errors
+        ):  # noqa E501
+            cache_response(cache_key, result)
+
+        return result, status_code
+
+    def encode_execution_result(
+        self, request, execution_result, id=None, show_graphiql=False
+    ):  # noqa E501
+        status_code = 200
+
+        if not execution_result:
+            return None, status_code
+
+        response = {}
+
+        if execution_result.errors:
+            response["errors"] = [
+                self.format_error(e) for e in execution_result.errors
+            ]
+
+        if execution_result.invalid:
+            status_code = 400
+        else:
+            response["data"] = execution_result.data
+
+        if self.batch:
+            response["id"] = id
+            response["status"] = status_code
+
+        result = self.json_encode(request, response, pretty=show_graphiql)
+
+        return result, status_code
+
+    def get_response_cache_user_id(
+        self, request: HttpRequest, query, operation_name
+    ) -> Optional[UUIDType]:  # noqa E501
+        """
+        The user whose cached responses the response to the request is
+        read from (and cached with) - `None` if it is not to be cached:
+        only queries of authenticated users are.
+        """
+        user = getattr(request, "current_user", None)
+
+        if not settings.GRAPHQL_RESPONSE_CACHE or user is None:
+            return None
+
+        if self.get_operation_type(request, query, operation_name) != "query":
+            return None
+
+        return user.id
+
+    def parse_body(self, request):
+        """
+        As `GraphQLView.parse_body`, but a JSON array of operations (a
+        batch) is accepted as well. The body is parsed once per request:
+        `GraphQLView.dispatch` parses it again after `dispatch` did.
+        """
+        data = getattr(request, "graphql_data", None)
+
+        if data is None:
+            data = self.parse_request_body(request)
+            setattr(request, "graphql_data", data)
+
+        return data
+
+    def parse_request_body(self, request):
+        if self.get_content_type(request) == "application/json":
+            try:
+                data = json.loads(request.body.decode("utf-8"))
+            except ValueError:
+                data = None
+
+            if isinstance(data, list):
+                if not data:
+                    raise HttpError(
+                        HttpResponseBadRequest(
+                            "Received an empty list in the batch request."
+                        )
+                    )  # noqa E501
+
+                if len(data) > settings.GRAPHQL_MAX_BATCH_SIZE:
+                    raise HttpError(
+                        HttpResponseBadRequest(
+                            f"A batch holds at most "
+                            f"{settings.GRAPHQL_MAX_BATCH_SIZE} operations."
+                        )
+                    )  # noqa E501
+
+                if not all(isinstance(entry, dict) for entry in data):
+                    raise HttpError(
+                        HttpResponseBadRequest(
+                            "The received data is not a valid JSON query."
+                        )
+                    )  # noqa E501
+
+                return data
+
+            if isinstance(data, dict):
+                return data
+
+        # and its errors
+        return super().parse_body(request)
+
+    def get_operation_type(
+        self, request: HttpRequest, query, operation_name
+    ) -> Optional[str]:  # noqa E501
+        try:
+            document = self.get_backend(request).document_from_string(
+                self.schema, query
+            )  # noqa E501
+        except Exception:
+            return None
+
+        return document.get_operation_type(operation_name)
+
+    def get_batch_entry_operation_type(
+        self, request: HttpRequest, data
+    ) -> Optional[str]:  # noqa E501
+        try:
+            query, _, operation_name, _ = self.get_graphql_params(
+                request, data
+            )  # noqa E501
+        except HttpError:
+            return None
+
+        return self.get_operation_type(request, query, operation_name)
+
+    def get_batch_entry_response(self, request: HttpRequest, data):
+        """
+        The response to an operation of a batch - errors of the operation
+        are reported in its response, as for a request of its own.
+        """
+        try:
+            return self.get_response(request, data)
+        except HttpError as e:
+            return (
+                self.json_encode(request, {"errors": [self.format_error(e)]}),
+                e.response.status_code,
+            )
+
+    def encode_batch_responses(self, responses) -> HttpResponse:
+        return HttpResponse(
+            status=max(status_code for _, status_code in responses),
+            content=f"[{','.join(result for result, _ in responses)}]",
+            content_type="application/json",
+        )
+
+    def get_batch_cost(self, request: HttpRequest, data) -> int:
+        """
+        The cost of the operations of the batch, together. Operations whose
+        cost can not be worked out (because they are invalid) are reported
+        when they are executed.
+        """
+        total = 0
+
+        for entry in data:
+            try:
+                query, variables, operation_name, _ = self.get_graphql_params(
+                    request, entry
+                )  # noqa E501
+            except HttpError:
+                continue
+
+            cost = self.backend.get_operation_cost(
+                self.schema, query, operation_name, variables
+            )  # noqa E501
+
+            if cost is not None:
+                total += cost.cost
+
+        return total
+
+    def get_batch_over_budget_response(
+        self, request: HttpRequest, data
+    ) -> Optional[HttpResponse]:  # noqa E501
+        """
+        The response rejecting the batch (none of its operations is
+        executed) - `None` if it is within the budget.
+        """
+        error = cost_over_budget_error(
+            self.get_batch_cost(request, data), "batch"
+        )  # noqa E501
+
+        if error is None:
+            return None
+
+        errors = {"errors": [self.format_error(error)]}
+        response = (self.json_encode(request, errors), 400)
+
+        return self.encode_batch_responses([response] * len(data))
+
+    def dispatch_batch(self, request: HttpRequest, data) -> HttpResponse:
+        """
+        Execute the operations of the batch in order, with the data loader
+        (and user) of the request. Queries share what the loader fetched,
+        which is dropped after each mutation.
+        """
+        over_budget_response = self.get_batch_over_budget_response(
+            request, data
+        )  # noqa E501
+
+        if over_budget_response is not None:
+            return over_budget_response
+
+        responses = []
+
+        for entry in data:
+            responses.append(self.get_batch_entry_response(request, entry))
+
+            if self.get_batch_entry_operation_type(request, entry) != "query":
+                request.app_data_loader.clear_all()
+
+        return self.encode_batch_responses(responses)
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            data = self.parse_body(request)
+        except HttpError:
+            # reported by `GraphQLView.dispatch`
+            data = None
+
+        if isinstance(data, list) and request.method.lower() == "post":
+            return self.dispatch_batch(request, data)
+
+        etag = self.get_resume_etag(request, data)
+
+        if etag is not None and etag_matches(request, etag):
+            return set_etag(HttpResponseNotModified(), etag)
+
+        response = super().dispatch(request, *args, **kwargs)
+
+        if etag is not None and response.status_code == 200:
+            set_etag(response, etag)
+
+        return response
+
+    def get_resume_etag(
+        self, request: HttpRequest, data
+    ) -> Optional[str]:  # noqa E501
+        params = self.get_resume_etag_params(request, data)
+
+        if params is None:
+            return None
+
+        versions = ResumesLogic.get_resume_versions(
+            params.resume_ids, params.user_id
+        )  # noqa E501
+
+        return make_resume_etag(params, versions)
+
+    def get_resume_etag_params(
+        self, request: HttpRequest, data
+    ) -> Optional[ResumeETagParams]:  # noqa E501
+        """
+        What the `ETag` of the response to the request (whose body parsed to
+        `data`) is made of - `None` if the request is not a `getResume` query
+        (by an authenticated user). Failures are left for the request
+        handling to report.
+        """
+        user = getattr(request, "current_user", None)
+
+        if (
+            user is None
+            or data is None
+            or self.batch
+            or request.method.lower() not in ("get", "post")
+        ):  # noqa E501
+            return None
+
+        try:
+            if self.graphiql and self.can_display_graphiql(request, data):
+                return None
+
+            query, variables, operation_name, _ = self.get_graphql_params(
+                request, data
+            )  # noqa E501
+
+            document = self.get_backend(request).document_from_string(
+                self.schema, query
+            )  # noqa E501
+        except Exception:
+            return None
+
+        resume_ids = resume_ids_of_get_resume_query(
+            document.document_ast, operation_name, variables
+        )  # noqa E501
+
+        if not resume_ids:
+            return None
+
+        return ResumeETagParams(
+            user_id=user.id,
+            resume_ids=resume_ids,
+            request_key=[query, variables, operation_name],
+        )
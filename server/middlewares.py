@@ -1,26 +1,53 @@
 # -*- coding: utf-8 -*-
 
+from typing import Optional
+
+from django.conf import settings
+
 from logics.accounts import user_from_jwt
-from logics.data_loader import AppDataLoader
+from logics.data_loader import AppDataLoader, DispatchMode
+from server.thread_pool import data_loader_thread_pool
 
 
-def set_graphql_context_middleware(get_response):
-    def middleware(request):
-        setattr(request, "app_data_loader", AppDataLoader())
-        authorization = request.headers.get("Authorization")
+def jwt_from_authorization_header(
+    authorization: Optional[str],
+) -> Optional[str]:  # noqa E501
+    if authorization is None:
+        return None
+
+    prefix_jwt = authorization.split()
+
+    if len(prefix_jwt) != 2:
+        return None
 
-        if authorization is None:
-            return get_response(request)
+    if prefix_jwt[0] != "Bearer":
+        return None
 
-        prefix_jwt = authorization.split()
+    return prefix_jwt[1]
+
+
+def make_app_data_loader() -> AppDataLoader:
+    """
+    The data loader of a request, dispatching as configured
+    (`DATA_LOADER_DISPATCH_MODE`).
+    """
+    return AppDataLoader(
+        dispatch_mode=DispatchMode(settings.DATA_LOADER_DISPATCH_MODE),
+        executor=data_loader_thread_pool,
+    )
+
+
+def set_graphql_context_middleware(get_response):
+    def middleware(request):
+        setattr(request, "app_data_loader", make_app_data_loader())
 
-        if len(prefix_jwt) != 2:
-            return get_response(request)
+        jwt = jwt_from_authorization_header(
+            request.headers.get("Authorization")
+        )  # noqa E501
 
-        if prefix_jwt[0] != "Bearer":
-            return get_response(request)
+        if jwt is not None:
+            setattr(request, "current_user", user_from_jwt(jwt))
 
-        setattr(request, "current_user", user_from_jwt(prefix_jwt[1]))
         return get_response(request)
 
     return middleware
@@ -16,3 +16,99 @@ def create_index(table_name, col):
         CREATE INDEX {table_name}_{col}_index
         ON {table_name}({col});
     """
+
+
+# The children of resumes when their snapshots were introduced - tag, table,
+# owner column, table of the owner (for achievements) and ordering - as
+# `refresh_resume_snapshot` (`server/apps/resumes/resumes_django_logic.py`)
+# then gathered them.
+RESUME_SNAPSHOT_CHILDREN = [
+    ("personal_info", "personal_info", "resume_id", None, "resume_id, id"),
+    ("education", "education", "resume_id", None, "resume_id, index, id"),
+    ("experience", "experiences", "resume_id", None, "resume_id, index, id"),
+    ("skill", "skills", "resume_id", None, "resume_id, index, id"),
+    ("spoken_language", "spoken_languages", "owner_id", None, "owner_id, id"),
+    (
+        "supplementary_skill",
+        "supplementary_skills",
+        "owner_id",
+        None,
+        "owner_id, id",
+    ),
+    ("resume_hobby", "resumes_hobbies", "owner_id", None, "owner_id, id"),
+    (
+        "education_achievement",
+        "education_achievements",
+        "owner_id",
+        "education",
+        "owner_id, id",
+    ),
+    (
+        "experience_achievement",
+        "experiences_achievements",
+        "owner_id",
+        "experiences",
+        "owner_id, id",
+    ),
+    (
+        "skill_achievement",
+        "skills_achievements",
+        "owner_id",
+        "skills",
+        "owner_id, id",
+    ),
+]
+
+
+def insert_missing_resume_snapshots():
+    """
+    Create the snapshots of the resumes which have none - those written
+    before snapshots were kept.
+    """
+    arrays = []
+    laterals = []
+
+    for number, (tag, table, owner_column, owner_table, ordering) in enumerate(
+        RESUME_SNAPSHOT_CHILDREN
+    ):  # noqa E501
+        where = (
+            f"t.{owner_column} = r.id"
+            if owner_table is None
+            else f"""
+                t.{owner_column} IN (
+                    SELECT id FROM {owner_table} WHERE resume_id = r.id
+                )
+            """
+        )
+
+        arrays.append(f"'{tag}', c{number}.children")
+
+        laterals.append(
+            f"""
+            LEFT JOIN LATERAL (
+                SELECT json_agg(t ORDER BY {ordering}) AS children
+                FROM {table} t
+                WHERE {where}
+            ) c{number} ON true
+            """
+        )
+
+    return f"""
+        INSERT INTO resume_snapshots
+            (resume_id, user_id, document, version, updated_at)
+        SELECT
+            r.id,
+            r.user_id,
+            json_build_object(
+                'resume',
+                row_to_json(r),
+                'children',
+                json_build_object({", ".join(arrays)})
+            )::jsonb,
+            1,
+            now()
+        FROM resumes r {"".join(laterals)}
+        WHERE NOT EXISTS (
+            SELECT 1 FROM resume_snapshots s WHERE s.resume_id = r.id
+        );
+    """
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+"""
+Persisted queries, as sent by apollo clients: a client sends the SHA-256
+hash of its query document (in `extensions.persistedQuery.sha256Hash`)
+instead of the document. The first time, the server does not know the hash
+and answers `PersistedQueryNotFound`; the client then sends the document
+with its hash, which registers the document for all workers - the cache is
+shared by them in production (see `server/settings/environments/production.py`).
+"""
+
+from hashlib import sha256
+from typing import Optional
+
+from django.core.cache import caches
+
+PERSISTED_QUERIES_CACHE_ALIAS = "persisted_queries"
+
+PERSISTED_QUERY_VERSION = 1
+
+
+def query_hash(query: str) -> str:
+    return sha256(query.encode()).hexdigest()
+
+
+def make_persisted_query_cache_key(sha256_hash: str) -> str:
+    return f"persisted-query:{sha256_hash}"
+
+
+def get_persisted_query(sha256_hash: str) -> Optional[str]:
+    return caches[PERSISTED_QUERIES_CACHE_ALIAS].get(
+        make_persisted_query_cache_key(sha256_hash)
+    )  # noqa E501
+
+
+def persist_query(sha256_hash: str, query: str) -> None:
+    caches[PERSISTED_QUERIES_CACHE_ALIAS].set(
+        make_persisted_query_cache_key(sha256_hash), query
+    )  # noqa E501
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""
+Cache of the (serialized) responses to the graphql queries of each user,
+used by the `/graphql` views when `settings.GRAPHQL_RESPONSE_CACHE` is on.
+
+A response is cached under the user, the query, its variables and operation
+name - and the version of the responses of the user. Every write to the
+resumes of a user bumps that version (see `ResumesDjangoLogic`), so the
+responses cached before it are never read again (and expire). The cache
+must be shared by the worker processes for a bump to reach them all. A
+version evicted from it is replaced by a new one, never an older one.
+"""
+
+import json
+from functools import partial
+from hashlib import sha256
+from typing import Any, Mapping, Optional, Tuple
+from uuid import uuid4
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import caches
+from django.db import transaction
+
+from logics.logics_utils import UUIDType
+
+GRAPHQL_RESPONSES_CACHE_ALIAS = "graphql_responses"
+
+# backends whose entries only the process writing them sees
+PER_PROCESS_CACHE_BACKENDS = {
+    "django.core.cache.backends.locmem.LocMemCache",
+}
+
+
+def make_responses_version_cache_key(user_id: UUIDType) -> str:
+    return f"graphql-responses-version:{user_id}"
+
+
+def make_response_cache_key(
+    user_id: UUIDType,
+    version: str,
+    query: str,
+    variables: Optional[Mapping[str, Any]],  # type: ignore
+    operation_name: Optional[str],
+) -> str:
+    request_key = json.dumps(
+        [query, variables, operation_name], sort_keys=True, default=str
+    )  # noqa E501
+
+    digest = sha256(request_key.encode()).hexdigest()
+
+    return f"graphql-response:{user_id}:{version}:{digest}"
+
+
+def get_cached_response(
+    user_id: UUIDType,
+    query: str,
+    variables: Optional[Mapping[str, Any]],  # type: ignore
+    operation_name: Optional[str],
+) -> Tuple[Optional[str], str]:
+    """
+    The cached response to the query (if any) and the key to cache it under.
+    """
+    cache = caches[GRAPHQL_RESPONSES_CACHE_ALIAS]
+    version_key = make_responses_version_cache_key(user_id)
+    version = cache.get(version_key)
+
+    if version is None:
+        cache.add(version_key, uuid4().hex, None)
+        version = cache.get(version_key) or uuid4().hex
+
+    key = make_response_cache_key(
+        user_id, version, query, variables, operation_name
+    )  # noqa E501
+
+    return cache.get(key), key
+
+
+def cache_response(key: str, response: str) -> None:
+    caches[GRAPHQL_RESPONSES_CACHE_ALIAS].set(key, response)
+
+
+def bump_responses_version(user_id: UUIDType) -> None:
+    caches[GRAPHQL_RESPONSES_CACHE_ALIAS].set(
+        make_responses_version_cache_key(user_id), uuid4().hex, None
+    )  # noqa E501
+
+
+def invalidate_user_responses(user_id: UUIDType) -> None:
+    """
+    Stop serving the cached responses of the user. As for the resume
+    children cache, the version is bumped right away and again once the
+    current transaction commits.
+    """
+    bump = partial(bump_responses_version, user_id)
+    bump()
+    transaction.on_commit(bump)
+
+
+def check_responses_cache(app_configs, **kwargs):
+    """
+    Refuse to cache responses in a cache each worker process has its own
+    of: bumping the version of a user in one would leave the others serving
+    stale responses.
+    """
+    if not settings.GRAPHQL_RESPONSE_CACHE:
+        return []
+
+    backend = settings.CACHES[GRAPHQL_RESPONSES_CACHE_ALIAS]["BACKEND"]
+
+    if backend not in PER_PROCESS_CACHE_BACKENDS:
+        return []
+
+    return [
+        checks.Error(
+            f"GRAPHQL_RESPONSE_CACHE is on but the "
+            f"'{GRAPHQL_RESPONSES_CACHE_ALIAS}' cache ({backend}) is not "
+            f"shared by the worker processes.",
+            hint="Use a file based (or another shared) cache backend.",
+            id="server.E001",
+        )
+    ]
@@ -6,6 +6,30 @@
 CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
     "axes_cache": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    # Resume children shared across requests.
+    # See `server/apps/resumes/resumes_cache.py`
+    "resumes": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "resumes",
+        "TIMEOUT": 60 * 60,
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+    # Documents of persisted graphql queries, by hash.
+    # See `server/persisted_queries.py`
+    "persisted_queries": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "persisted_queries",
+        "TIMEOUT": 24 * 60 * 60,
+        "OPTIONS": {"MAX_ENTRIES": 1000},
+    },
+    # Responses to the graphql queries of users.
+    # See `server/response_cache.py`
+    "graphql_responses": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "graphql_responses",
+        "TIMEOUT": 5 * 60,
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
 }
 
 
@@ -155,3 +155,61 @@ EMAIL_TIMEOUT = 5
 
 
 GRAPHENE = {"SCHEMA": "logics.graphql_schema.graphql_schema"}
+
+# Graphql documents (and persisted queries) each worker keeps parsed and
+# validated (see `server/graphql_backend.py`)
+GRAPHQL_DOCUMENTS_CACHE_SIZE = config(
+    "GRAPHQL_DOCUMENTS_CACHE_SIZE", cast=int, default=500
+)
+
+# Budget of a graphql operation - its depth and its cost: a point per object
+# fetched, lists counting `first` (or this many) items (see
+# `server/graphql_cost.py`). Operations over budget are not executed. The
+# deepest selections the clients make (`listResumes` down to achievements)
+# are 5 deep, and a whole resume costs about 360: 2 of them fit the budget.
+GRAPHQL_MAX_QUERY_DEPTH = config("GRAPHQL_MAX_QUERY_DEPTH", cast=int, default=6)
+
+GRAPHQL_MAX_QUERY_COST = config(
+    "GRAPHQL_MAX_QUERY_COST", cast=int, default=1000
+)
+
+GRAPHQL_COST_LIST_SIZE = config("GRAPHQL_COST_LIST_SIZE", cast=int, default=10)
+
+# Whether the `/graphql` views cache the responses to the queries of each
+# user until the user writes to a resume (see `server/response_cache.py`)
+GRAPHQL_RESPONSE_CACHE = config(
+    "GRAPHQL_RESPONSE_CACHE", cast=bool, default=False
+)
+
+# Operations a batch request to `/graphql` may hold
+GRAPHQL_MAX_BATCH_SIZE = config("GRAPHQL_MAX_BATCH_SIZE", cast=int, default=10)
+
+
+# Data loader (see `logics/data_loader.py`)
+# `sequential`, `combined` or `threaded`
+
+DATA_LOADER_DISPATCH_MODE = config(
+    "DATA_LOADER_DISPATCH_MODE", default="combined"
+)
+
+# Threads (each with its own database connection) of `server/thread_pool.py`
+DB_THREAD_POOL_SIZE = config("DB_THREAD_POOL_SIZE", cast=int, default=4)
+
+# Threads running the queries of the `threaded` data loader dispatch mode
+DATA_LOADER_THREAD_POOL_SIZE = config(
+    "DATA_LOADER_THREAD_POOL_SIZE", cast=int, default=4
+)
+
+# `getResume` fetches the whole resume in a single query (instead of its
+# children per kind) when it selects at least this share of the kinds of
+# children of a resume (see `logics/resumes/resumes_graphql_schema.py`).
+# Above 1, it never does.
+GET_RESUME_FULL_FETCH_RATIO = config(
+    "GET_RESUME_FULL_FETCH_RATIO", cast=float, default=0.8
+)
+
+# Whether such a whole resume is read from its snapshot (one row, kept up to
+# date on every write) instead of from the tables of its children
+GET_RESUME_FROM_SNAPSHOT = config(
+    "GET_RESUME_FROM_SNAPSHOT", cast=bool, default=True
+)
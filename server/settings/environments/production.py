@@ -8,6 +8,7 @@ values are overridden.
 """
 
 from server.settings.components import config
+from server.settings.components.caches import CACHES
 
 # Production flags:
 
@@ -36,6 +37,38 @@ STATICFILES_STORAGE = (
 MEDIA_ROOT = "/var/www/django/media"
 
 
+# Caching
+# The resumes, persisted queries and graphql responses caches must be shared
+# by all gunicorn workers (and all replicas of `web`), so they live in the
+# memcached service (see `docker/docker-compose.prod.yml`). Every worker then
+# sees the same keys and versions, so a delete or a version bump made by one
+# worker on invalidation is seen by all. Memcached evicts least recently used
+# entries by itself, so there is no `MAX_ENTRIES` to cull on every write.
+
+MEMCACHED_LOCATION = config("MEMCACHED_LOCATION", default="memcached:11211")
+
+CACHES["resumes"] = {
+    "BACKEND": "django.core.cache.backends.memcached.MemcachedCache",
+    "LOCATION": MEMCACHED_LOCATION,
+    "KEY_PREFIX": "resumes",
+    "TIMEOUT": 60 * 60,
+}
+
+CACHES["persisted_queries"] = {
+    "BACKEND": "django.core.cache.backends.memcached.MemcachedCache",
+    "LOCATION": MEMCACHED_LOCATION,
+    "KEY_PREFIX": "persisted_queries",
+    "TIMEOUT": 24 * 60 * 60,
+}
+
+CACHES["graphql_responses"] = {
+    "BACKEND": "django.core.cache.backends.memcached.MemcachedCache",
+    "LOCATION": MEMCACHED_LOCATION,
+    "KEY_PREFIX": "graphql_responses",
+    "TIMEOUT": 5 * 60,
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
 
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from django.conf import settings
+from django.db import close_old_connections
+
+T = TypeVar("T")
+
+
+class DBThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    A thread pool whose tasks may use the django ORM. Django keeps one
+    connection per thread, so each worker thread has its own connection.
+    As with a request, connections that are broken or older than
+    `CONN_MAX_AGE` are closed before and after every task.
+    """
+
+    def submit(  # type: ignore
+        self, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> Future:
+        return super().submit(run_with_db_connection, fn, *args, **kwargs)
+
+
+def run_with_db_connection(
+    fn: Callable[..., T], *args: Any, **kwargs: Any  # type: ignore
+) -> T:
+    close_old_connections()
+
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+db_thread_pool = DBThreadPoolExecutor(
+    max_workers=settings.DB_THREAD_POOL_SIZE, thread_name_prefix="db"
+)
+
+# Runs the queries of data loaders in `threaded` dispatch mode. Loaders wait
+# on these queries from `db_thread_pool` threads (under ASGI): were they run
+# there too, busy threads would wait on queries queued behind themselves.
+data_loader_thread_pool = DBThreadPoolExecutor(
+    max_workers=settings.DATA_LOADER_THREAD_POOL_SIZE,
+    thread_name_prefix="data-loader",
+)
+
+
+async def run_in_db_thread(
+    fn: Callable[..., T], *args: Any, **kwargs: Any  # type: ignore
+) -> T:
+    """
+    Run the blocking (ORM) call `fn` on `db_thread_pool` so that it does not
+    block the event loop.
+    """
+    return await asyncio.get_event_loop().run_in_executor(
+        db_thread_pool, partial(fn, *args, **kwargs)
+    )
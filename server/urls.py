@@ -18,7 +18,7 @@ from django.urls import include, path
 from django.views.generic import TemplateView
 from health_check import urls as health_urls
 
-from graphene_django.views import GraphQLView
+from server.graphql_view import AppGraphQLView
 import os
 
 
@@ -46,7 +46,7 @@ urlpatterns = [
     ),
     path(
         "graphql",
-        GraphQLView.as_view(
+        AppGraphQLView.as_view(
             graphiql=os.environ.get("DJANGO_ENV") == "development"
         ),  # noqa
     ),
@@ -68,7 +68,10 @@ def graphql_client():
 
 
 @pytest.fixture()
-def data_url_encoded_file(settings, test_root):
+def data_url_encoded_file(settings, test_root, tmp_path):
+    # the files uploaded are written to `MEDIA_ROOT`
+    settings.MEDIA_ROOT = str(tmp_path)
+
     with open(test_root.joinpath("test-files/dog.jpeg"), "rb") as dog_file:
         dog_string = base64.urlsafe_b64encode(dog_file.read()).decode()
         return f"data:image/jpeg{data_url_encoded_string_delimiter}{dog_string}"
@@ -302,6 +305,32 @@ def get_resume_query(resume_fragment):
     """
 
 
+@pytest.fixture()
+def save_resume_query(resume_fragment):
+    return f"""
+        mutation SaveResume($input: SaveResumeInput!) {{
+            saveResume(input: $input) {{
+                {typename}
+
+                ... on SavedResumeSuccess {{
+                    version
+                    resume {{
+                        ...{resume_fragment_name}
+                    }}
+                }}
+
+                ... on SaveResumeErrors {{
+                    errors {{
+                        resume
+                        error
+                    }}
+                }}
+            }}
+        }}
+        {resume_fragment}
+    """
+
+
 @pytest.fixture()
 def create_personal_info_query(personal_info_fragment):
     return f"""
@@ -369,6 +398,32 @@ def create_experience_query(experience_fragment):
     """
 
 
+@pytest.fixture()
+def create_experiences_query(experience_fragment):
+    return f"""
+        mutation CreateExperiences($input: [CreateExperienceInput!]!) {{
+            createExperiences(input: $input) {{
+
+                {typename}
+
+                ... on ExperiencesSuccess {{
+                    experiences {{
+                        ...{experience_fragment_name}
+                    }}
+                }}
+
+                ... on CreateExperienceErrors {{
+                    errors {{
+                        resume
+                        error
+                    }}
+                }}
+            }}
+        }}
+        {experience_fragment}
+    """
+
+
 @pytest.fixture()
 def create_education_query(education_fragment):
     return f"""
@@ -472,6 +527,32 @@ def create_text_only_query():
     """
 
 
+@pytest.fixture()
+def create_many_text_only_query():
+    return f"""
+        mutation CreateManyTextOnly($input: [CreateTextOnlyInput!]!) {{
+            createManyTextOnly(input: $input) {{
+                {typename}
+
+                ... on ManyTextOnlySuccess {{
+                    textOnlyList {{
+                        {text_only_fragment}
+                        tag
+                    }}
+                }}
+
+                ... on CreateTextOnlyErrors {{
+                    errors {{
+                        owner
+                        tag
+                        error
+                    }}
+                }}
+            }}
+        }}
+    """
+
+
 @pytest.fixture()
 def make_skill_fixture():
     def create_skill(resume_id, index=0):
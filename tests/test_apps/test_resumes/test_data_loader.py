@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+from django.core.cache import caches
+from promise import Promise
+
+from logics.resumes import ResumesLogic
+from logics.resumes.resumes_types import (  # noqa
+    CreatePersonalInfoAttrs,
+    CreateRatableAttrs,
+    CreateTextOnlyAttr,
+    RatableEnumType,
+    TextOnlyEnumType,
+)
+from logics.data_loader import (  # noqa E501
+    AppDataLoader,
+    AsyncAppDataLoader,
+    DispatchMode,
+    make_achievement_from_education_id_loader_hash,
+    make_education_from_resume_id_loader_hash,
+    make_experience_from_resume_id_loader_hash,
+    make_hobby_from_resume_id_loader_hash,
+    make_language_from_resume_id_loader_hash,
+    make_personal_info_from_resume_id_loader_hash,
+    make_skill_from_resume_id_loader_hash,
+    make_supplementary_skill_from_resume_id_loader_hash,
+)
+from server.apps.resumes.resumes_records import ResumeChildRecord
+from server.thread_pool import DBThreadPoolExecutor
+
+pytestmark = pytest.mark.django_db
+
+
+def load_many(loader, keys):
+    # Loads are only batched when issued from within a promise chain, which
+    # is what happens during graphql execution.
+    return Promise.resolve(None).then(lambda _: loader.load_many(keys)).get()
+
+
+@pytest.fixture()
+def resume_tree_fixture(user_and_resume_fixture, make_education_fixture):
+    _, resume = user_and_resume_fixture
+    resume_id = str(resume.id)
+
+    personal_info = ResumesLogic.create_personal_info(
+        CreatePersonalInfoAttrs(resume_id=resume_id, first_name="kanmii")
+    )
+
+    education = make_education_fixture(resume_id)
+
+    achievement = ResumesLogic.create_text_only(
+        CreateTextOnlyAttr(
+            tag=TextOnlyEnumType.education_achievement,
+            owner_id=education.id,
+            text="ea",
+        )
+    )
+
+    language = ResumesLogic.create_ratable(
+        CreateRatableAttrs(
+            owner_id=resume_id,
+            tag=RatableEnumType.spoken_language,
+            description="aa",
+        )
+    )
+
+    return resume, personal_info, education, achievement, language
+
+
+def test_combined_dispatch_loads_all_tags_in_one_query(
+    resume_tree_fixture, django_assert_num_queries
+):
+    resume, personal_info, education, achievement, language = (
+        resume_tree_fixture
+    )  # noqa E501
+
+    keys = [
+        make_personal_info_from_resume_id_loader_hash(resume.id),
+        make_education_from_resume_id_loader_hash(resume.id),
+        make_experience_from_resume_id_loader_hash(resume.id),
+        make_skill_from_resume_id_loader_hash(resume.id),
+        make_hobby_from_resume_id_loader_hash(resume.id),
+        make_language_from_resume_id_loader_hash(resume.id),
+        make_supplementary_skill_from_resume_id_loader_hash(resume.id),
+        make_achievement_from_education_id_loader_hash(education.id),
+    ]
+
+    loader = AppDataLoader(dispatch_mode=DispatchMode.combined)
+
+    with django_assert_num_queries(1):
+        results = load_many(loader, keys)
+
+    (
+        personal_info_obj,
+        educations,
+        experiences,
+        skills,
+        hobbies,
+        languages,
+        supplementary_skills,
+        achievements,
+    ) = results
+
+    assert personal_info_obj.id == personal_info.id
+    assert [e.id for e in educations] == [education.id]
+    assert experiences == skills == hobbies == supplementary_skills == []
+    assert [x.id for x in achievements] == [achievement.id]
+    assert achievements[0].tag == TextOnlyEnumType.education_achievement
+    assert [x.id for x in languages] == [language.id]
+    assert languages[0].tag == RatableEnumType.spoken_language
+    assert languages[0].inserted_at == language.inserted_at
+
+
+def test_combined_and_sequential_dispatch_agree(resume_tree_fixture):
+    resume, _, education, _, _ = resume_tree_fixture
+
+    keys = [
+        make_personal_info_from_resume_id_loader_hash(resume.id),
+        make_education_from_resume_id_loader_hash(resume.id),
+        make_language_from_resume_id_loader_hash(resume.id),
+        make_achievement_from_education_id_loader_hash(education.id),
+    ]
+
+    def load_ids(dispatch_mode):
+        loader = AppDataLoader(dispatch_mode=dispatch_mode)
+        personal_info, *lists = load_many(loader, keys)
+        return personal_info.id, [[x.id for x in xs] for xs in lists]
+
+    assert load_ids(DispatchMode.combined) == load_ids(DispatchMode.sequential)
+
+
+# The pool threads use their own connections and so must see committed rows
+@pytest.mark.django_db(transaction=True)
+def test_threaded_and_sequential_dispatch_agree(resume_tree_fixture):
+    resume, _, education, _, _ = resume_tree_fixture
+
+    keys = [
+        make_personal_info_from_resume_id_loader_hash(resume.id),
+        make_education_from_resume_id_loader_hash(resume.id),
+        make_experience_from_resume_id_loader_hash(resume.id),
+        make_language_from_resume_id_loader_hash(resume.id),
+        make_achievement_from_education_id_loader_hash(education.id),
+    ]
+
+    def load_ids(**kwargs):
+        caches["resumes"].clear()
+        loader = AppDataLoader(**kwargs)
+        personal_info, *lists = load_many(loader, keys)
+        return personal_info.id, [[x.id for x in xs] for xs in lists]
+
+    with DBThreadPoolExecutor(max_workers=2) as executor:
+        threaded_ids = load_ids(
+            dispatch_mode=DispatchMode.threaded, executor=executor
+        )
+
+    assert threaded_ids == load_ids(dispatch_mode=DispatchMode.sequential)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_loader_agrees_with_sync_loader(resume_tree_fixture):
+    resume, _, education, _, _ = resume_tree_fixture
+
+    keys = [
+        make_personal_info_from_resume_id_loader_hash(resume.id),
+        make_education_from_resume_id_loader_hash(resume.id),
+        make_hobby_from_resume_id_loader_hash(resume.id),
+        make_language_from_resume_id_loader_hash(resume.id),
+        make_achievement_from_education_id_loader_hash(education.id),
+    ]
+
+    def ids(results):
+        personal_info, *lists = results
+        return personal_info.id, [[x.id for x in xs] for xs in lists]
+
+    caches["resumes"].clear()
+    loop = asyncio.get_event_loop()
+    loader = AsyncAppDataLoader(loop=loop)
+
+    async def load():
+        # loads made in the same turn of the loop are batched
+        first, *rest = await asyncio.gather(
+            loader.load(keys[0]), loader.load_many(keys[1:])
+        )
+
+        return [first, *rest[0]]
+
+    async_ids = ids(loop.run_until_complete(load()))
+    assert async_ids == ids(load_many(AppDataLoader(), keys))
+    assert loader.load(keys[0]).done()
+
+
+def test_threaded_dispatch_requires_executor():
+    with pytest.raises(ValueError):
+        AppDataLoader(dispatch_mode=DispatchMode.threaded)
+
+
+def test_children_are_cached_across_loaders(
+    resume_tree_fixture, make_education_fixture, django_assert_num_queries
+):
+    resume, *_ = resume_tree_fixture
+    key = make_education_from_resume_id_loader_hash(resume.id)
+
+    educations = load_many(AppDataLoader(), [key])[0]
+
+    with django_assert_num_queries(0):
+        assert load_many(AppDataLoader(), [key])[0] == educations
+
+    new_education = make_education_fixture(str(resume.id), index=1)
+
+    with django_assert_num_queries(1):
+        educations = load_many(AppDataLoader(), [key])[0]
+
+    assert new_education.id in [e.id for e in educations]
+
+
+def test_loader_refetches_projected_children_when_selection_widens(
+    resume_tree_fixture,
+):
+    resume, *_, language = resume_tree_fixture
+    key = make_language_from_resume_id_loader_hash(resume.id)
+    loader = AppDataLoader(dispatch_mode=DispatchMode.combined)
+
+    loader.select_fields(key[0], ["description"])
+    (languages,) = load_many(loader, [key])
+
+    assert isinstance(languages[0], ResumeChildRecord)
+    assert languages[0].tag == RatableEnumType.spoken_language
+    assert languages[0].description == language.description
+    assert not hasattr(languages[0], "level")
+
+    # already selected fields do not drop the loaded children
+    loader.select_fields(key[0], ["description"])
+    assert load_many(loader, [key])[0] is languages
+
+    loader.select_fields(key[0], ["level"])
+    (languages,) = load_many(loader, [key])
+
+    assert languages[0].level == language.level
+    assert languages[0].description == language.description
+
+
+@pytest.mark.parametrize(
+    "dispatch_mode", [DispatchMode.combined, DispatchMode.sequential]
+)
+def test_loader_returns_children_in_index_order(
+    user_and_resume_fixture, make_education_fixture, dispatch_mode
+):
+    user, resume = user_and_resume_fixture
+
+    other_resume = ResumesLogic.create_resume(
+        dict(user_id=user.id, title="title 2")
+    )  # noqa E501
+
+    index_ids_map = {}
+
+    for index in [2, 0, 1]:
+        for owner in [other_resume, resume]:
+            education = make_education_fixture(str(owner.id), index=index)
+            index_ids_map.setdefault(owner.id, {})[index] = education.id
+
+    keys = [
+        make_education_from_resume_id_loader_hash(resume.id),
+        make_personal_info_from_resume_id_loader_hash(resume.id),
+        make_education_from_resume_id_loader_hash(other_resume.id),
+    ]
+
+    caches["resumes"].clear()
+    loader = AppDataLoader(dispatch_mode=dispatch_mode)
+    educations, personal_info, other_educations = load_many(loader, keys)
+
+    assert personal_info is None
+
+    assert [e.id for e in educations] == [
+        index_ids_map[resume.id][index] for index in range(3)
+    ]
+
+    assert [e.id for e in other_educations] == [
+        index_ids_map[other_resume.id][index] for index in range(3)
+    ]
@@ -1,10 +1,17 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 from typing import cast, NamedTuple
+from unittest.mock import ANY
 
 import pytest
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from graphene import Context
+from promise import Promise
 
+from logics.accounts import AccountsLogic
 from logics.resumes import ResumesLogic
 from logics.resumes.resumes_types import (  # noqa
     CreatePersonalInfoAttrs,
@@ -23,7 +30,14 @@ from logics.resumes.resumes_types import (  # noqa
     CreateRatableAttrs,
     Ratable,
 )
-from logics.data_loader import AppDataLoader
+from logics.data_loader import (  # noqa E501
+    AppDataLoader,
+    AsyncAppDataLoader,
+    make_education_from_resume_id_loader_hash,
+)
+from logics.graphql_schema import execute_graphql_async
+from server.apps.resumes.models import ResumeSnapshot
+from server.migration_utils import insert_missing_resume_snapshots
 
 pytestmark = pytest.mark.django_db
 
@@ -51,6 +65,30 @@ def test_create_resume_succeeds(
     assert resume["userId"] == str(registered_user.id)
 
 
+def test_create_resume_payload_is_served_from_data_loader(
+    graphql_client, create_resume_query, registered_user, monkeypatch
+):
+    def get_resume_children(*args):
+        raise AssertionError("children of a new resume must not be fetched")
+
+    monkeypatch.setattr(
+        ResumesLogic, "get_resume_children", staticmethod(get_resume_children)
+    )
+
+    result = graphql_client.execute(
+        create_resume_query,
+        variables={"input": {"title": "t 13"}},
+        context=Context(
+            current_user=registered_user, app_data_loader=AppDataLoader()
+        ),  # noqa
+    )
+
+    assert "errors" not in result
+    resume = result["data"]["createResume"]["resume"]
+    assert resume["personalInfo"] is None
+    assert resume["educations"] == []
+
+
 def test_create_resume_with_non_unique_title_succeeds(registered_user):
     title = "title 1"
     resume1 = ResumesLogic.create_resume(
@@ -165,6 +203,345 @@ def test_create_experience_fails_cos_resume_not_found(
     assert type(errors["resume"]) == str
 
 
+def test_create_experiences_then_achievements_in_bulk(
+    graphql_client,
+    create_experiences_query,
+    create_many_text_only_query,
+    user_and_resume_fixture,
+    bogus_uuid,
+):
+    user, resume = user_and_resume_fixture
+    resume_id = str(resume.id)
+    context = Context(current_user=user, app_data_loader=AppDataLoader())
+
+    params_list = [
+        {"resumeId": resume_id, "index": index, "position": f"pos {index}"}
+        for index in range(3)
+    ]
+
+    with CaptureQueriesContext(connection) as context_queries:
+        result = graphql_client.execute(
+            create_experiences_query,
+            variables={"input": params_list},
+            context=context,
+        )
+
+    experiences = result["data"]["createExperiences"]["experiences"]
+    assert [e["position"] for e in experiences] == ["pos 0", "pos 1", "pos 2"]
+
+    # one statement for all the experiences
+    assert [
+        query["sql"]
+        for query in context_queries.captured_queries
+        if query["sql"].startswith('INSERT INTO "experiences"')
+    ] == [ANY]
+
+    achievements_params = [
+        {
+            "ownerId": experience["id"],
+            "text": f"achievement {index}",
+            "tag": TextOnlyEnumType.experience_achievement.name,
+        }
+        for index, experience in enumerate(experiences)
+    ] + [
+        {
+            "ownerId": resume_id,
+            "text": "hobby",
+            "tag": TextOnlyEnumType.resume_hobby.name,
+        }
+    ]
+
+    result = graphql_client.execute(
+        create_many_text_only_query,
+        variables={"input": achievements_params},
+        context=context,
+    )
+
+    text_only_list = result["data"]["createManyTextOnly"]["textOnlyList"]
+
+    assert [t["text"] for t in text_only_list] == [
+        "achievement 0",
+        "achievement 1",
+        "achievement 2",
+        "hobby",
+    ]
+
+    assert sorted(
+        str(a.owner_id)
+        for a in ResumesLogic.get_many_text_only(
+            [e["id"] for e in experiences],
+            TextOnlyEnumType.experience_achievement,
+        )
+    ) == sorted(e["id"] for e in experiences)
+
+    # nothing is created unless all the resumes are of the user
+    result = graphql_client.execute(
+        create_experiences_query,
+        variables={
+            "input": params_list + [{"resumeId": bogus_uuid, "index": 3}]
+        },  # noqa E501
+        context=context,
+    )
+
+    assert result["data"]["createExperiences"]["errors"]["resume"]
+    assert len(ResumesLogic.get_experiences([resume.id])) == 3
+
+
+def test_save_resume_writes_only_what_changed(
+    graphql_client,
+    save_resume_query,
+    get_resume_query,
+    registered_user,
+    bogus_uuid,
+):
+    def save_resume(document):
+        with CaptureQueriesContext(connection) as context:
+            result = graphql_client.execute(
+                save_resume_query,
+                variables={"input": document},
+                context=Context(
+                    current_user=registered_user,
+                    app_data_loader=AppDataLoader(),
+                ),  # noqa E501
+            )
+
+        writes = [
+            " ".join(query["sql"].split()[:3])
+            for query in context.captured_queries
+            if query["sql"].split()[0] in ("INSERT", "UPDATE", "DELETE")
+        ]
+
+        return result["data"]["saveResume"], writes
+
+    saved, _ = save_resume(
+        {
+            "title": "t",
+            "personalInfo": {"firstName": "kanmii"},
+            "educations": [
+                {"school": "s1", "achievements": [{"text": "a1"}]},
+                {"school": "s2", "achievements": [{"text": "a2"}]},
+            ],
+            "hobbies": [{"text": "h1"}, {"text": "h2"}],
+        }
+    )
+
+    assert saved["version"] == 1
+    resume = saved["resume"]
+    e1, e2 = resume["educations"]
+    assert [h["text"] for h in resume["hobbies"]] == ["h1", "h2"]
+
+    saved, writes = save_resume(
+        {
+            "id": resume["id"],
+            "title": "t",
+            "personalInfo": {"firstName": "kanmii"},
+            "educations": [
+                {
+                    "id": e2["id"],
+                    "school": "s2",
+                    "achievements": [
+                        {"id": e2["achievements"][0]["id"], "text": "a2"},
+                        {"text": "a3"},
+                        {"text": "a4"},
+                    ],
+                },
+                {"school": "s3"},
+            ],
+            "languages": [{"description": "yoruba"}],
+        }
+    )
+
+    assert saved["version"] == 2
+
+    # e1 and its achievement are dropped, e2 moves up, hobbies are kept -
+    # one statement per table and kind of write
+    assert sorted(writes) == [
+        'DELETE FROM "education"',
+        'DELETE FROM "education_achievements"',
+        'INSERT INTO "education"',
+        'INSERT INTO "education_achievements"',
+        'INSERT INTO "spoken_languages"',
+        'UPDATE "education" AS',
+    ]
+
+    resume = saved["resume"]
+    assert [e["id"] for e in resume["educations"]][:1] == [e2["id"]]
+
+    assert [
+        a["text"] for e in resume["educations"] for a in e["achievements"]
+    ] == ["a2", "a3", "a4"]
+
+    assert [h["text"] for h in resume["hobbies"]] == ["h1", "h2"]
+    assert [r["description"] for r in resume["languages"]] == ["yoruba"]
+    caches["resumes"].clear()
+
+    result = graphql_client.execute(
+        get_resume_query,
+        variables={"input": {"id": resume["id"]}},
+        context=Context(
+            current_user=registered_user, app_data_loader=AppDataLoader()
+        ),  # noqa E501
+    )
+
+    assert result["data"]["getResume"] == resume
+
+    assert [
+        e.school for e in ResumesLogic.get_educations([resume["id"]])
+    ] == ["s2", "s3"]
+
+    saved, writes = save_resume({"id": resume["id"], "title": "t2"})
+    assert writes == ['UPDATE "resumes" SET']
+    assert saved["resume"]["updatedAt"] > resume["updatedAt"]
+
+    saved, _ = save_resume({"id": bogus_uuid, "title": "t"})
+    assert saved["errors"]["resume"]
+
+
+def test_save_resume_keeps_order_of_children_without_index(
+    graphql_client, save_resume_query, get_resume_query, registered_user
+):
+    def save_resume(document):
+        result = graphql_client.execute(
+            save_resume_query,
+            variables={"input": document},
+            context=Context(
+                current_user=registered_user, app_data_loader=AppDataLoader()
+            ),  # noqa E501
+        )
+
+        return result["data"]["saveResume"]["resume"]
+
+    resume = save_resume(
+        {
+            "title": "t",
+            "hobbies": [{"text": "h1"}, {"text": "h2"}, {"text": "h3"}],
+        }
+    )
+
+    h1, h2, h3 = [{"id": h["id"], "text": h["text"]} for h in resume["hobbies"]]
+
+    resume = save_resume(
+        {
+            "id": resume["id"],
+            "title": "t",
+            "hobbies": [h1, {"text": "h0"}, h3, h2],
+        }
+    )
+
+    hobbies = resume["hobbies"]
+    assert [h["text"] for h in hobbies] == ["h1", "h0", "h3", "h2"]
+
+    # those following the new hobby are saved anew
+    assert hobbies[0]["id"] == h1["id"]
+    assert not {h["id"] for h in hobbies[1:]} & {h2["id"], h3["id"]}
+
+    # a `null` list leaves the hobbies as they are
+    assert save_resume(
+        {"id": resume["id"], "title": "t", "hobbies": None}
+    )["hobbies"] == hobbies
+
+    caches["resumes"].clear()
+
+    result = graphql_client.execute(
+        get_resume_query,
+        variables={"input": {"id": resume["id"]}},
+        context=Context(
+            current_user=registered_user, app_data_loader=AppDataLoader()
+        ),  # noqa E501
+    )
+
+    assert result["data"]["getResume"]["hobbies"] == hobbies
+
+
+def test_reorder_resume_items_in_one_statement(
+    graphql_client,
+    user_and_resume_fixture,
+    make_experience_fixture,
+    make_skill_fixture,
+):
+    user, resume = user_and_resume_fixture
+    resume_id = str(resume.id)
+    ids = [
+        str(make_experience_fixture(resume_id, index).id) for index in range(3)
+    ]
+    skill = make_skill_fixture(resume_id)
+
+    def reorder_experiences(ids):
+        with CaptureQueriesContext(connection) as context:
+            result = graphql_client.execute(
+                """
+                mutation($resumeId: ID!, $ids: [ID!]!) {
+                    reorderResumeItems(
+                        resumeId: $resumeId, kind: experience, ids: $ids
+                    ) {
+                        ... on ReorderResumeItemsSuccess {
+                            resume { experiences { id index } }
+                        }
+                        ... on ReorderResumeItemsErrors {
+                            errors { resume error }
+                        }
+                    }
+                }
+                """,
+                variables={"resumeId": resume_id, "ids": ids},
+                context=Context(
+                    current_user=user, app_data_loader=AppDataLoader()
+                ),  # noqa E501
+            )
+
+        updates = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].split()[0] == "UPDATE"
+        ]
+
+        return result["data"]["reorderResumeItems"], updates
+
+    reordered, updates = reorder_experiences(ids[::-1])
+
+    assert reordered["resume"]["experiences"] == [
+        {"id": id, "index": index} for index, id in enumerate(ids[::-1])
+    ]
+
+    assert len(updates) == 1
+
+    # ids not of experiences of the resume reorder nothing
+    reordered, _ = reorder_experiences([ids[0], str(skill.id)])
+    assert reordered["errors"]["error"]
+
+    # neither do the ids of some of them
+    reordered, updates = reorder_experiences(ids[:2])
+    assert reordered["errors"]["error"]
+    assert updates == []
+
+    assert [
+        str(e.id) for e in ResumesLogic.get_experiences([resume.id])
+    ] == ids[::-1]
+
+
+def test_create_education_clears_stale_educations_of_data_loader(
+    graphql_client, create_education_query, user_and_resume_fixture
+):
+    user, resume = user_and_resume_fixture
+    loader = AppDataLoader()
+    key = make_education_from_resume_id_loader_hash(resume.id)
+
+    def load_educations():
+        return Promise.resolve(None).then(lambda _: loader.load(key)).get()
+
+    assert load_educations() == []
+
+    result = graphql_client.execute(
+        create_education_query,
+        variables={"input": {"resumeId": str(resume.id), "index": 1}},
+        context=Context(current_user=user, app_data_loader=loader),
+    )
+
+    education = result["data"]["createEducation"]["education"]
+    assert education["achievements"] == []
+    assert [str(e.id) for e in load_educations()] == [education["id"]]
+
+
 def test_create_education_succeeds(
     graphql_client, create_education_query, user_and_resume_fixture
 ):
@@ -452,6 +829,590 @@ def test_get_all_resume_fields_succeeds(
     assert supplementary_skill_obj["id"] == str(supplementary_skill.id)
 
 
+def test_get_resume_prefetches_whole_tree(
+    graphql_client,
+    user_and_resume_fixture,
+    get_resume_query,
+    make_education_fixture,
+    django_assert_num_queries,
+    settings,
+):
+    settings.GET_RESUME_FULL_FETCH_RATIO = 2  # never fetch the whole resume
+    user, resume = user_and_resume_fixture
+    resume_id = str(resume.id)
+    education = make_education_fixture(resume_id)
+
+    achievement = ResumesLogic.create_text_only(
+        CreateTextOnlyAttr(
+            tag=TextOnlyEnumType.education_achievement,
+            owner_id=education.id,
+            text="ea",
+        )
+    )
+
+    caches["resumes"].clear()
+
+    def get_resume():
+        result = graphql_client.execute(
+            get_resume_query,
+            variables={"input": {"id": resume_id}},
+            context=Context(
+                current_user=user, app_data_loader=AppDataLoader()
+            ),  # noqa E501
+        )
+
+        return result["data"]["getResume"]
+
+    # the resume, then all its children and grand children
+    with django_assert_num_queries(2):
+        resume_map = get_resume()
+
+    education_obj = resume_map["educations"][0]
+    assert education_obj["achievements"][0]["id"] == str(achievement.id)
+
+    # children are now cached
+    with django_assert_num_queries(1):
+        assert get_resume() == resume_map
+
+
+def test_get_resume_fetches_only_selected_columns(
+    graphql_client, user_and_resume_fixture, get_resume_query,
+    make_education_fixture, settings,
+):
+    settings.GET_RESUME_FULL_FETCH_RATIO = 2  # never fetch the whole resume
+    user, resume = user_and_resume_fixture
+    resume_id = str(resume.id)
+    make_education_fixture(resume_id)
+    caches["resumes"].clear()
+
+    query = """
+        query GetResume($input: GetResumeInput!) {
+            getResume(input: $input) {
+                educations {
+                    id
+                    school
+                }
+            }
+        }
+    """
+
+    def get_resume(query):
+        result = graphql_client.execute(
+            query,
+            variables={"input": {"id": resume_id}},
+            context=Context(
+                current_user=user, app_data_loader=AppDataLoader()
+            ),  # noqa E501
+        )
+
+        assert "errors" not in result
+        return result["data"]["getResume"]
+
+    with CaptureQueriesContext(connection) as context:
+        educations = get_resume(query)["educations"]
+
+    # no query for the columns that were not fetched
+    assert len(context.captured_queries) == 2
+    tree_sql = context.captured_queries[1]["sql"]
+    assert "jsonb_build_object" in tree_sql
+    assert "course" not in tree_sql
+
+    # the whole rows are not cached yet
+    with CaptureQueriesContext(connection) as context:
+        resume_map = get_resume(get_resume_query)
+
+    assert len(context.captured_queries) == 2
+    assert resume_map["educations"][0]["id"] == educations[0]["id"]
+
+    # whole rows will do for any selection
+    with CaptureQueriesContext(connection) as context:
+        assert get_resume(query)["educations"] == educations
+
+    assert len(context.captured_queries) == 1
+
+
+def test_get_resume_fetches_full_resume_in_one_query(
+    graphql_client,
+    user_and_resume_fixture,
+    get_resume_query,
+    make_education_fixture,
+    make_skill_fixture,
+    settings,
+):
+    settings.GET_RESUME_FROM_SNAPSHOT = False
+    user, resume = user_and_resume_fixture
+    resume_id = str(resume.id)
+    education = make_education_fixture(resume_id, index=1)
+    make_education_fixture(resume_id, index=0)
+    make_skill_fixture(resume_id)
+
+    ResumesLogic.create_text_only(
+        CreateTextOnlyAttr(
+            tag=TextOnlyEnumType.education_achievement,
+            owner_id=education.id,
+            text="ea",
+        )
+    )
+
+    def get_resume(ratio, user=user, **params):
+        settings.GET_RESUME_FULL_FETCH_RATIO = ratio
+        caches["resumes"].clear()
+
+        with CaptureQueriesContext(connection) as context:
+            result = graphql_client.execute(
+                get_resume_query,
+                variables={"input": {"id": resume_id, **params}},
+                context=Context(
+                    current_user=user, app_data_loader=AppDataLoader()
+                ),  # noqa E501
+            )
+
+        assert "errors" not in result
+        return result["data"]["getResume"], len(context.captured_queries)
+
+    resume_map, num_queries = get_resume(1)
+    assert num_queries == 1
+    assert get_resume(2) == (resume_map, 2)
+
+    assert [e["id"] for e in resume_map["educations"]][1] == str(education.id)
+    assert resume_map["educations"][1]["achievements"][0]["text"] == "ea"
+
+    assert get_resume(1, BogusUser(id=str(resume.id))) == (None, 1)
+    assert get_resume(1, title=f"not {resume.title}")[0] is None
+
+
+def test_aliased_get_resumes_are_fetched_together(
+    graphql_client,
+    user_and_resume_fixture,
+    resume_fragment,
+    make_education_fixture,
+    settings,
+):
+    settings.GET_RESUME_FROM_SNAPSHOT = False
+    user, resume = user_and_resume_fixture
+    make_education_fixture(str(resume.id))
+
+    other_resume = ResumesLogic.create_resume(
+        CreateResumeAttrs(user_id=user.id, title=f"not {resume.title}")
+    )
+
+    make_education_fixture(str(other_resume.id))
+
+    query = f"""
+        query GetResumes($input1: GetResumeInput!, $input2: GetResumeInput!) {{
+            r1: getResume(input: $input1) {{ ...ResumeFragment }}
+            r2: getResume(input: $input2) {{ ...ResumeFragment }}
+        }}
+        {resume_fragment}
+    """
+
+    def get_resumes(ratio):
+        settings.GET_RESUME_FULL_FETCH_RATIO = ratio
+        caches["resumes"].clear()
+
+        with CaptureQueriesContext(connection) as context:
+            result = graphql_client.execute(
+                query,
+                variables={
+                    "input1": {"id": str(resume.id)},
+                    "input2": {"id": str(other_resume.id)},
+                },
+                context=Context(
+                    current_user=user, app_data_loader=AppDataLoader()
+                ),  # noqa E501
+            )
+
+        assert "errors" not in result
+        return result["data"], len(context.captured_queries)
+
+    # the resumes, then the children of both
+    data, num_queries = get_resumes(1)
+    assert num_queries == 2
+    assert get_resumes(2) == (data, 2)
+
+    assert [data["r1"]["id"], data["r2"]["id"]] == [
+        str(resume.id),
+        str(other_resume.id),
+    ]
+
+    assert all(len(data[alias]["educations"]) == 1 for alias in data)
+
+
+def test_resume_snapshot_is_refreshed_on_write(
+    user_and_resume_fixture, make_education_fixture
+):
+    user, resume = user_and_resume_fixture
+    resume_id = str(resume.id)
+
+    def children_ids(full_resume):
+        return {
+            tag: [child.id for child in children]
+            for tag, children in full_resume.children_map.items()
+        }
+
+    def assert_snapshot_is_fresh():
+        snapshot = ResumesLogic.get_resume_snapshot(resume_id, user.id)
+        full_resume = ResumesLogic.get_full_resume(resume_id, user.id)
+        assert snapshot.resume.id == full_resume.resume.id == resume.id
+        assert snapshot.resume.title == resume.title
+        assert children_ids(snapshot) == children_ids(full_resume)
+
+    assert_snapshot_is_fresh()
+
+    education = make_education_fixture(resume_id)
+    assert_snapshot_is_fresh()
+
+    achievement = ResumesLogic.create_text_only(
+        CreateTextOnlyAttr(
+            tag=TextOnlyEnumType.education_achievement,
+            owner_id=education.id,
+            text="ea",
+        )
+    )
+
+    assert_snapshot_is_fresh()
+
+    snapshot = ResumesLogic.get_resume_snapshot(resume_id, user.id)
+    (snapshot_achievement,) = snapshot.children_map[
+        TextOnlyEnumType.education_achievement
+    ]  # noqa E501
+    assert snapshot_achievement.id == achievement.id
+    assert snapshot_achievement.tag == TextOnlyEnumType.education_achievement
+
+    assert ResumesLogic.get_resume_snapshot(resume_id, resume.id) is None
+
+
+def test_missing_resume_snapshot_is_not_written_on_read(
+    user_and_resume_fixture, make_education_fixture
+):
+    user, resume = user_and_resume_fixture
+    make_education_fixture(str(resume.id))
+
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM resume_snapshots")
+
+    assert ResumesLogic.get_resume_snapshot(resume.id, resume.id) is None
+    full_resume = ResumesLogic.get_resume_snapshot(resume.id, user.id)
+    assert full_resume.resume.id == resume.id
+    assert not ResumeSnapshot.objects.exists()
+
+    # as migrating the resumes written before snapshots were kept does
+    with connection.cursor() as cursor:
+        cursor.execute(insert_missing_resume_snapshots())
+
+    snapshot = ResumesLogic.get_resume_snapshot(resume.id, user.id)
+    assert snapshot.resume.title == resume.title
+    assert snapshot.children_map == full_resume.children_map
+
+
+def test_list_resumes_pages_by_id(
+    graphql_client, user_and_resume_fixture, django_assert_num_queries
+):
+    user, resume = user_and_resume_fixture
+    resume_ids = [str(resume.id)]
+
+    for index in range(4):
+        new_resume = ResumesLogic.create_resume(
+            CreateResumeAttrs(user_id=user.id, title=f"resume {index}")
+        )
+
+        ResumesLogic.create_personal_info(
+            CreatePersonalInfoAttrs(
+                resume_id=str(new_resume.id), first_name=f"kanmii {index}"
+            )
+        )
+
+        resume_ids.append(str(new_resume.id))
+
+    query = """
+        query ListResumes($first: Int, $after: String) {
+            listResumes(first: $first, after: $after) {
+                edges {
+                    cursor
+                    node {
+                        id
+                        personalInfo {
+                            firstName
+                        }
+                    }
+                }
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+            }
+        }
+    """
+
+    def list_resumes(after=None):
+        result = graphql_client.execute(
+            query,
+            variables={"first": 2, "after": after},
+            context=Context(
+                current_user=user, app_data_loader=AppDataLoader()
+            ),  # noqa E501
+        )
+
+        assert "errors" not in result
+        return result["data"]["listResumes"]
+
+    ids = []
+    personal_infos = []
+    after = None
+    caches["resumes"].clear()
+
+    for has_next_page in [True, True, False]:
+        # the page, then the personal infos of all its resumes
+        with django_assert_num_queries(2):
+            connection_map = list_resumes(after)
+
+        edges = connection_map["edges"]
+        ids.extend(edge["node"]["id"] for edge in edges)
+        personal_infos.extend(edge["node"]["personalInfo"] for edge in edges)
+        after = connection_map["pageInfo"]["endCursor"]
+        assert after == edges[-1]["cursor"]
+        assert connection_map["pageInfo"]["hasNextPage"] == has_next_page
+
+    # newest first
+    assert ids == resume_ids[::-1]
+
+    assert personal_infos == [
+        {"firstName": f"kanmii {index}"} for index in [3, 2, 1, 0]
+    ] + [None]
+
+
+def test_get_resumes_loads_resumes_of_user_together(
+    graphql_client,
+    user_and_resume_fixture,
+    create_user_params,
+    make_education_fixture,
+    django_assert_num_queries,
+):
+    user, resume = user_and_resume_fixture
+    other_resume = ResumesLogic.create_resume(
+        CreateResumeAttrs(user_id=user.id, title="title 2")
+    )
+
+    other_user, _ = AccountsLogic.register_user_with_password(
+        {**create_user_params, "email": "c@d.com"}
+    )
+
+    not_owned_resume = ResumesLogic.create_resume(
+        CreateResumeAttrs(user_id=other_user.id, title="title 3")
+    )
+
+    education = make_education_fixture(str(resume.id))
+    other_education = make_education_fixture(str(other_resume.id))
+    make_education_fixture(str(not_owned_resume.id))
+
+    query = """
+        query GetResumes($ids: [ID!]!) {
+            getResumes(ids: $ids) {
+                id
+                educations {
+                    id
+                }
+            }
+        }
+    """
+
+    caches["resumes"].clear()
+
+    # the resumes, then the educations of all of them
+    with django_assert_num_queries(2):
+        result = graphql_client.execute(
+            query,
+            variables={
+                "ids": [
+                    str(resume.id),
+                    str(not_owned_resume.id),
+                    str(other_resume.id),
+                    "bogus",
+                ]
+            },
+            context=Context(
+                current_user=user, app_data_loader=AppDataLoader()
+            ),  # noqa E501
+        )
+
+    assert "errors" not in result
+
+    assert result["data"]["getResumes"] == [
+        {"id": str(resume.id), "educations": [{"id": str(education.id)}]},
+        None,
+        {
+            "id": str(other_resume.id),
+            "educations": [{"id": str(other_education.id)}],
+        },
+        None,
+    ]
+
+    # the resume of the other user is not even read
+    assert ResumesLogic.get_resumes([not_owned_resume.id], user.id) == []
+
+
+def test_search_resumes_ranks_matches_of_user(
+    graphql_client,
+    user_and_resume_fixture,
+    create_user_params,
+    django_assert_num_queries,
+):
+    user, resume = user_and_resume_fixture
+
+    titled_resume = ResumesLogic.create_resume(
+        CreateResumeAttrs(user_id=user.id, title="Python developers")
+    )
+
+    ResumesLogic.create_education(
+        CreateEducationAttrs(
+            resume_id=str(resume.id), index=0, school="Python academy"
+        )
+    )
+
+    other_user, _ = AccountsLogic.register_user_with_password(
+        {**create_user_params, "email": "c@d.com"}
+    )
+
+    ResumesLogic.create_resume(
+        CreateResumeAttrs(user_id=other_user.id, title="python")
+    )
+
+    query = """
+        query SearchResumes($query: String!) {
+            searchResumes(query: $query) {
+                id
+                title
+            }
+        }
+    """
+
+    def search_resumes(text):
+        result = graphql_client.execute(
+            query,
+            variables={"query": text},
+            context=Context(
+                current_user=user, app_data_loader=AppDataLoader()
+            ),  # noqa E501
+        )
+
+        assert "errors" not in result
+        return [resume["id"] for resume in result["data"]["searchResumes"]]
+
+    # words of the title rank higher than those of the children
+    with django_assert_num_queries(1):
+        assert search_resumes("python") == [
+            str(titled_resume.id),
+            str(resume.id),
+        ]
+
+    assert search_resumes("python -academy") == [str(titled_resume.id)]
+    assert search_resumes('"python academy"') == [str(resume.id)]
+    assert search_resumes("ruby") == []
+
+
+def test_suggest_resume_titles_of_user_by_prefix(
+    graphql_client, user_and_resume_fixture, create_user_params
+):
+    user, _ = user_and_resume_fixture
+
+    engineer, architect, data_science, _ = [
+        ResumesLogic.create_resume(
+            CreateResumeAttrs(user_id=user.id, title=title)
+        )
+        for title in [
+            "Software engineer",
+            "software architect",
+            "data_science",
+            "dataxscience",
+        ]
+    ]
+
+    other_user, _ = AccountsLogic.register_user_with_password(
+        {**create_user_params, "email": "c@d.com"}
+    )
+
+    ResumesLogic.create_resume(
+        CreateResumeAttrs(user_id=other_user.id, title="Software tester")
+    )
+
+    query = """
+        query SuggestResumeTitles($query: String!) {
+            suggestResumeTitles(query: $query) {
+                id
+                title
+            }
+        }
+    """
+
+    def suggest_resume_titles(text):
+        result = graphql_client.execute(
+            query,
+            variables={"query": text},
+            context=Context(
+                current_user=user, app_data_loader=AppDataLoader()
+            ),  # noqa E501
+        )
+
+        assert "errors" not in result
+        return [
+            resume["id"] for resume in result["data"]["suggestResumeTitles"]
+        ]  # noqa E501
+
+    # titles with a similar word (where supported) come after the prefixes
+    assert suggest_resume_titles("SOFT")[:2] == [
+        str(architect.id),
+        str(engineer.id),
+    ]
+
+    # `_` is not a wildcard
+    assert suggest_resume_titles("data_")[:1] == [str(data_science.id)]
+    assert suggest_resume_titles("  ") == []
+
+
+# The async getters run on the database thread pool, whose connections only
+# see committed rows
+@pytest.mark.django_db(transaction=True)
+def test_get_resume_async_agrees_with_sync(
+    graphql_client, user_and_resume_fixture, get_resume_query,
+    make_education_fixture,
+):
+    user, resume = user_and_resume_fixture
+    resume_id = str(resume.id)
+    education = make_education_fixture(resume_id)
+
+    ResumesLogic.create_text_only(
+        CreateTextOnlyAttr(
+            tag=TextOnlyEnumType.education_achievement,
+            owner_id=education.id,
+            text="ea",
+        )
+    )
+
+    variables = {"input": {"id": resume_id}}
+
+    sync_result = graphql_client.execute(
+        get_resume_query,
+        variables=variables,
+        context=Context(current_user=user, app_data_loader=AppDataLoader()),
+    )
+
+    caches["resumes"].clear()
+
+    async def get_resume():
+        return await execute_graphql_async(
+            get_resume_query,
+            variables=variables,
+            context=Context(
+                current_user=user, app_data_loader=AsyncAppDataLoader()
+            ),  # noqa E501
+        )
+
+    result = asyncio.get_event_loop().run_until_complete(get_resume())
+
+    assert result.errors is None
+    assert result.data == sync_result["data"]
+
+
 @pytest.mark.skip("")
 def test_create_resume_hobby_succeeds(
     user_and_resume_fixture, create_text_only_query, graphql_client
@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+from functools import partial
+
+import pytest
+
+from logics.accounts import user_to_jwt
+from server import asgi
+from server.asgi import application
+
+
+def asgi_request(method, path, body=b"", headers=(), start=False):
+    sent = asyncio.get_event_loop().run_until_complete(
+        asgi_call(method, path, body, headers)
+    )
+
+    start_message, *bodies = sent
+    body = b"".join(message["body"] for message in bodies)
+
+    if start:
+        return start_message, body
+
+    return start_message["status"], body
+
+
+async def asgi_call(method, path, body=b"", headers=()):
+    messages = [
+        {"type": "http.request", "body": body[:10], "more_body": True},
+        {"type": "http.request", "body": body[10:], "more_body": False},
+    ]
+
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": b"",
+        "http_version": "1.1",
+        "server": ("testserver", 80),
+        "headers": [
+            (name.encode(), value.encode()) for name, value in headers
+        ],
+    }
+
+    await application(scope, receive, send)
+    return sent
+
+
+def test_non_graphql_paths_are_served_by_wsgi_application():
+    status, body = asgi_request("GET", "/robots.txt")
+
+    assert status == 200
+    assert body
+
+
+def test_wsgi_application_finishes_requests(monkeypatch):
+    finished = []
+    monkeypatch.setattr(
+        "server.asgi.wsgi_application",
+        partial(finish_wsgi_request, asgi.wsgi_application, finished),
+    )
+
+    status, _ = asgi_request("GET", "/robots.txt")
+
+    assert status == 200
+    assert finished == [True]
+
+
+def finish_wsgi_request(application, finished, environ, start_response):
+    response = application(environ, start_response)
+    close = response.close
+
+    def close_response():
+        finished.append(True)
+        close()
+
+    response.close = close_response
+    return response
+
+
+def test_wsgi_responses_are_sent_as_produced(monkeypatch):
+    def streaming_application(environ, start_response):
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        yield from [b"a", b"b", b"c"]
+
+    monkeypatch.setattr("server.asgi.wsgi_application", streaming_application)
+
+    _, *bodies = asyncio.get_event_loop().run_until_complete(
+        asgi_call("GET", "/stream")
+    )
+
+    assert [message["body"] for message in bodies] == [b"a", b"b", b"c", b""]
+
+
+@pytest.mark.parametrize("path", ["/graphql", "/robots.txt"])
+def test_request_bodies_over_limit_are_refused(path, settings):
+    settings.DATA_UPLOAD_MAX_MEMORY_SIZE = 15
+
+    # as declared, before it is read
+    status, _ = asgi_request("POST", path, b"", [("content-length", "16")])
+    assert status == 413
+
+    # as read, sent chunked
+    status, body = asgi_request("POST", path, b"x" * 16)
+    assert status == 413
+    assert body == b"Request body too large."
+
+
+# The async view runs the database calls on the database thread pool, whose
+# connections only see committed rows
+@pytest.mark.django_db(transaction=True)
+def test_get_resume_via_graphql_view(
+    user_and_resume_fixture, get_resume_query
+):
+    user, resume = user_and_resume_fixture
+
+    status, body = asgi_request(
+        "POST",
+        "/graphql",
+        json.dumps(
+            {
+                "query": get_resume_query,
+                "variables": {"input": {"id": str(resume.id)}},
+            }
+        ).encode(),
+        [
+            ("content-type", "application/json"),
+            ("authorization", f"Bearer {user_to_jwt(user)}"),
+        ],
+    )
+
+    assert status == 200
+    result = json.loads(body)
+    assert "errors" not in result
+    assert result["data"]["getResume"]["id"] == str(resume.id)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_resume_via_graphql_view_is_conditional(
+    user_and_resume_fixture, get_resume_query
+):
+    user, resume = user_and_resume_fixture
+
+    body = json.dumps(
+        {
+            "query": get_resume_query,
+            "variables": {"input": {"id": str(resume.id)}},
+        }
+    ).encode()
+
+    headers = [
+        ("content-type", "application/json"),
+        ("authorization", f"Bearer {user_to_jwt(user)}"),
+    ]
+
+    start, _ = asgi_request("POST", "/graphql", body, headers, start=True)
+    etag = {
+        name.lower(): value.decode() for name, value in start["headers"]
+    }[b"etag"]
+
+    status, body = asgi_request(
+        "POST", "/graphql", body, headers + [("if-none-match", etag)]
+    )
+
+    assert status == 304
+    assert body == b""
+
+
+@pytest.mark.django_db(transaction=True)
+def test_batch_of_operations_via_graphql_view(user_and_resume_fixture):
+    user, resume = user_and_resume_fixture
+    get_first_name = """
+        query($input: GetResumeInput!) {
+            getResume(input: $input) { personalInfo { firstName } }
+        }
+    """
+    create_personal_info = """
+        mutation($input: CreatePersonalInfoInput!) {
+            createPersonalInfo(input: $input) { __typename }
+        }
+    """
+    get_first_name_operation = {
+        "query": get_first_name,
+        "variables": {"input": {"id": str(resume.id)}},
+    }
+
+    status, body = asgi_request(
+        "POST",
+        "/graphql",
+        json.dumps(
+            [
+                get_first_name_operation,
+                get_first_name_operation,
+                {
+                    "query": create_personal_info,
+                    "variables": {
+                        "input": {
+                            "resumeId": str(resume.id),
+                            "firstName": "kanmii",
+                        }
+                    },
+                },
+                get_first_name_operation,
+            ]
+        ).encode(),
+        [
+            ("content-type", "application/json"),
+            ("authorization", f"Bearer {user_to_jwt(user)}"),
+        ],
+    )
+
+    assert status == 200
+
+    assert [result["data"] for result in json.loads(body)] == [
+        {"getResume": {"personalInfo": None}},
+        {"getResume": {"personalInfo": None}},
+        {"createPersonalInfo": {"__typename": "PersonalInfoSuccess"}},
+        {"getResume": {"personalInfo": {"firstName": "kanmii"}}},
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_batches_over_budget_are_not_executed(
+    user_and_resume_fixture, settings
+):
+    user, resume = user_and_resume_fixture
+    settings.GRAPHQL_MAX_QUERY_COST = 100
+
+    fields = " ".join(
+        f"r{index}: getResume(input: $input) {{ id educations {{ id }} }}"
+        for index in range(5)
+    )
+
+    # 55 each
+    operation = {
+        "query": f"query($input: GetResumeInput!) {{ {fields} }}",
+        "variables": {"input": {"id": str(resume.id)}},
+    }
+
+    status, body = asgi_request(
+        "POST",
+        "/graphql",
+        json.dumps([operation, operation]).encode(),
+        [
+            ("content-type", "application/json"),
+            ("authorization", f"Bearer {user_to_jwt(user)}"),
+        ],
+    )
+
+    assert status == 400
+
+    assert [result["errors"] for result in json.loads(body)] == [
+        [{"message": "batch cost 110 exceeds the budget of 100"}]
+    ] * 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_threaded_data_loaders_of_concurrent_mutations(
+    user_and_resume_fixture, settings
+):
+    user, resume = user_and_resume_fixture
+    settings.DATA_LOADER_DISPATCH_MODE = "threaded"
+    # the children of the resume are loaded once it is "reordered"
+    reorder = """
+        mutation($resumeId: ID!) {
+            reorderResumeItems(resumeId: $resumeId, kind: skill, ids: []) {
+                ... on ReorderResumeItemsSuccess {
+                    resume { educations { id } hobbies { id } }
+                }
+            }
+        }
+    """
+    body = json.dumps(
+        {"query": reorder, "variables": {"resumeId": str(resume.id)}}
+    ).encode()
+    headers = [
+        ("content-type", "application/json"),
+        ("authorization", f"Bearer {user_to_jwt(user)}"),
+    ]
+
+    # more mutations than threads of the database pool, all waiting on
+    # their loaders at once
+    async def reorder_concurrently():
+        return await asyncio.wait_for(
+            asyncio.gather(
+                *(
+                    asgi_call("POST", "/graphql", body, headers)
+                    for _ in range(3 * settings.DB_THREAD_POOL_SIZE)
+                )
+            ),
+            timeout=3,
+        )
+
+    for sent in asyncio.get_event_loop().run_until_complete(
+        reorder_concurrently()
+    ):  # noqa E501
+        start_message, *bodies = sent
+        assert start_message["status"] == 200
+
+        assert json.loads(b"".join(message["body"] for message in bodies)) == {
+            "data": {
+                "reorderResumeItems": {
+                    "resume": {"educations": [], "hobbies": []}
+                }
+            }
+        }
+
+
+@pytest.mark.parametrize("query", ["{ nope", "{ nope }"])
+def test_graphql_view_rejects_invalid_query(query):
+    status, body = asgi_request(
+        "POST",
+        "/graphql",
+        json.dumps({"query": query}).encode(),
+        [("content-type", "application/json")],
+    )
+
+    assert status == 400
+    assert json.loads(body)["errors"]
+
+
+def test_graphql_view_responds_with_headers_of_wsgi_application(client):
+    body = json.dumps({"query": "{ __typename }"})
+
+    wsgi_response = client.post(
+        "/graphql", body, content_type="application/json"
+    )  # noqa E501
+
+    start_message, _ = asgi_request(
+        "POST",
+        "/graphql",
+        body.encode(),
+        [("content-type", "application/json")],
+        start=True,
+    )
+
+    headers = {
+        name.decode().lower(): value.decode()
+        for name, value in start_message["headers"]
+        if name != b"set-cookie"
+    }
+
+    assert headers == {
+        name.lower(): value for name, value in wsgi_response.items()
+    }
+    assert headers["x-frame-options"] == "DENY"
+    assert headers["x-content-type-options"] == "nosniff"
@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+
+import json
+from hashlib import sha256
+
+import pytest
+from django.core.cache import caches
+from graphql import parse
+
+from logics.accounts import user_to_jwt
+from logics.graphql_schema import graphql_max_items, graphql_schema
+from logics.resumes.resumes_graphql_schema import (
+    LIST_RESUMES_DEFAULT_PAGE_SIZE,
+    LIST_RESUMES_MAX_PAGE_SIZE,
+)
+from server.graphql_cost import operation_cost
+from server.graphql_view import graphql_backend
+from server.response_cache import (
+    check_responses_cache,
+    make_responses_version_cache_key,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def post_graphql(client, user, query, variables, extensions=None, **headers):
+    return client.post(
+        "/graphql",
+        json.dumps(
+            {"query": query, "variables": variables, "extensions": extensions}
+        ),
+        content_type="application/json",
+        HTTP_AUTHORIZATION=f"Bearer {user_to_jwt(user)}",
+        **headers,
+    )
+
+
+def test_get_resume_is_not_modified_until_resume_is_written(
+    client,
+    user_and_resume_fixture,
+    get_resume_query,
+    make_education_fixture,
+    django_assert_num_queries,
+):
+    user, resume = user_and_resume_fixture
+    variables = {"input": {"id": str(resume.id)}}
+
+    response = post_graphql(client, user, get_resume_query, variables)
+
+    assert response.status_code == 200
+    etag = response["ETag"]
+    assert json.loads(response.content)["data"]["getResume"]
+
+    # the user, then the version of the resume - and no resolver runs
+    with django_assert_num_queries(2):
+        response = post_graphql(
+            client,
+            user,
+            get_resume_query,
+            variables,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    assert not response.content
+
+    # another query of the same resume has a tag of its own
+    response = post_graphql(
+        client,
+        user,
+        "query($input: GetResumeInput!) { getResume(input: $input) { id } }",
+        variables,
+        HTTP_IF_NONE_MATCH=etag,
+    )
+
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+    make_education_fixture(str(resume.id))
+
+    response = post_graphql(
+        client, user, get_resume_query, variables, HTTP_IF_NONE_MATCH=etag
+    )
+
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+    assert json.loads(response.content)["data"]["getResume"]["educations"]
+
+
+def test_responses_of_other_queries_have_no_etag(
+    client, user_and_resume_fixture
+):
+    user, _ = user_and_resume_fixture
+
+    response = post_graphql(
+        client, user, "query { listResumes { edges { cursor } } }", {}
+    )
+
+    assert response.status_code == 200
+    assert not response.has_header("ETag")
+
+
+def test_persisted_query_is_registered_then_sent_by_hash(
+    client, user_and_resume_fixture, get_resume_query
+):
+    user, resume = user_and_resume_fixture
+    variables = {"input": {"id": str(resume.id)}}
+    sha256_hash = sha256(get_resume_query.encode()).hexdigest()
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": sha256_hash}}
+    caches["persisted_queries"].clear()
+    graphql_backend.persisted_queries.clear()
+
+    def get_resume(query):
+        response = post_graphql(client, user, query, variables, extensions)
+        return response.status_code, json.loads(response.content)
+
+    # not known yet: the client then sends the document along
+    status, result = get_resume(None)
+    assert status == 200
+    assert result["errors"][0]["message"] == "PersistedQueryNotFound"
+
+    status, result = get_resume(get_resume_query)
+    assert status == 200
+    assert result["data"]["getResume"]["id"] == str(resume.id)
+    # parsed and validated once, for the following requests
+    assert graphql_backend.get_persisted_query(sha256_hash)
+
+    status, result = get_resume(None)
+    assert result["data"]["getResume"]["id"] == str(resume.id)
+
+    # as another worker would, which parses the registered document itself
+    graphql_backend.persisted_queries.clear()
+    status, result = get_resume(None)
+    assert result["data"]["getResume"]["id"] == str(resume.id)
+
+    status, result = get_resume(get_resume_query + " ")
+    assert status == 400
+    assert result["errors"][0]["message"] == "provided sha does not match query"
+
+
+def test_documents_are_parsed_and_validated_once(
+    client, user_and_resume_fixture
+):
+    user, _ = user_and_resume_fixture
+    query = "query { listResumes { edges { cursor } } }"
+    invalid_query = "query { listResumes { nope } }"
+    graphql_backend.documents.clear()
+
+    for _ in range(2):
+        response = post_graphql(client, user, query, {})
+        assert response.status_code == 200
+
+        # validation errors are kept as well
+        response = post_graphql(client, user, invalid_query, {})
+        assert response.status_code == 400
+        assert json.loads(response.content)["errors"]
+
+    # each request looks its document up twice: to tell whether it may be
+    # answered conditionally, then to execute it
+    hits, misses, _, size = graphql_backend.documents.info()
+    assert (hits, misses, size) == (6, 2, 2)
+
+
+def test_request_body_is_parsed_once(
+    client, user_and_resume_fixture, get_resume_query, monkeypatch
+):
+    user, resume = user_and_resume_fixture
+    variables = {"input": {"id": str(resume.id)}}
+    body = json.dumps(
+        {"query": get_resume_query, "variables": variables, "extensions": None}
+    )  # noqa E501
+    loads = json.loads
+    bodies = []
+
+    def counting_loads(s, *args, **kwargs):
+        bodies.append(s)
+        return loads(s, *args, **kwargs)
+
+    monkeypatch.setattr(json, "loads", counting_loads)
+    response = post_graphql(client, user, get_resume_query, variables)
+    monkeypatch.undo()
+
+    assert response.status_code == 200
+    assert response["ETag"]
+    assert bodies.count(body) == 1
+
+
+def test_operation_cost_counts_expected_items_of_lists():
+    document_ast = parse(
+        """
+        query ListResumes($first: Int) {
+            listResumes(first: $first) {
+                edges {
+                    node {
+                        title
+                        educations {
+                            achievements {
+                                id
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        """
+    )
+
+    # 10 achievements per education, 10 educations per resume, `first` resumes
+    assert operation_cost(
+        graphql_schema, document_ast, None, {"first": 5}, 10
+    ) == (1 + 5 * (1 + 1 + 10 * (1 + 10 * 1)), 5)
+
+
+def test_operation_cost_counts_items_resolvers_return():
+    document_ast = parse(
+        """
+        query ListResumes($first: Int) {
+            listResumes(first: $first) { edges { node { title } } }
+        }
+        """
+    )
+
+    def cost(variables):
+        return operation_cost(
+            graphql_schema,
+            document_ast,
+            None,
+            variables,
+            10,
+            graphql_max_items,
+        ).cost
+
+    # `first` omitted: the default page size of `listResumes`
+    assert cost({}) == 1 + LIST_RESUMES_DEFAULT_PAGE_SIZE * (1 + 1)
+
+    # no more than the most `listResumes` returns
+    assert cost({"first": 10 ** 6}) == 1 + LIST_RESUMES_MAX_PAGE_SIZE * (1 + 1)
+
+
+def test_operations_over_budget_are_not_executed(
+    client, user_and_resume_fixture, settings
+):
+    user, resume = user_and_resume_fixture
+    settings.GRAPHQL_MAX_QUERY_COST = 100
+
+    fields = " ".join(
+        f"r{index}: getResume(input: $input) {{ id educations {{ id }} }}"
+        for index in range(10)
+    )
+
+    response = post_graphql(
+        client,
+        user,
+        f"query($input: GetResumeInput!) {{ {fields} }}",
+        {"input": {"id": str(resume.id)}},
+    )
+
+    assert response.status_code == 400
+    [error] = json.loads(response.content)["errors"]
+    assert error["message"] == "query cost 110 exceeds the budget of 100"
+
+
+def test_batches_over_budget_are_not_executed(
+    client, user_and_resume_fixture, settings
+):
+    user, resume = user_and_resume_fixture
+    settings.GRAPHQL_MAX_QUERY_COST = 100
+
+    fields = " ".join(
+        f"r{index}: getResume(input: $input) {{ id educations {{ id }} }}"
+        for index in range(5)
+    )
+
+    # 55 each: within the budget on its own
+    operation = {
+        "query": f"query($input: GetResumeInput!) {{ {fields} }}",
+        "variables": {"input": {"id": str(resume.id)}},
+    }
+
+    def post_batch(operations):
+        return client.post(
+            "/graphql",
+            json.dumps(operations),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {user_to_jwt(user)}",
+        )
+
+    response = post_batch([operation])
+    assert response.status_code == 200
+
+    response = post_batch([operation, operation])
+    assert response.status_code == 400
+
+    for result in json.loads(response.content):
+        assert "data" not in result
+        [error] = result["errors"]
+        assert error["message"] == "batch cost 110 exceeds the budget of 100"
+
+
+def test_aliased_whole_resumes_are_over_default_budget(
+    client, user_and_resume_fixture, resume_fragment
+):
+    user, resume = user_and_resume_fixture
+
+    def get_resumes(count):
+        fields = " ".join(
+            f"r{index}: getResume(input: $input) {{ ...ResumeFragment }}"
+            for index in range(count)
+        )
+
+        return post_graphql(
+            client,
+            user,
+            f"query($input: GetResumeInput!) {{ {fields} }} {resume_fragment}",
+            {"input": {"id": str(resume.id)}},
+        )
+
+    assert get_resumes(2).status_code == 200
+
+    response = get_resumes(3)
+    assert response.status_code == 400
+    [error] = json.loads(response.content)["errors"]
+    assert error["message"].endswith("exceeds the budget of 1000")
+
+
+def test_responses_are_cached_until_resumes_of_user_are_written(
+    client,
+    user_and_resume_fixture,
+    make_education_fixture,
+    settings,
+    django_assert_num_queries,
+):
+    user, resume = user_and_resume_fixture
+    settings.GRAPHQL_RESPONSE_CACHE = True
+    caches["graphql_responses"].clear()
+    query = "query { listResumes { edges { node { educations { id } } } } }"
+
+    def list_educations():
+        response = post_graphql(client, user, query, {})
+        assert response.status_code == 200
+        edges = json.loads(response.content)["data"]["listResumes"]["edges"]
+        return edges[0]["node"]["educations"]
+
+    assert list_educations() == []
+
+    # only the user is fetched
+    with django_assert_num_queries(1):
+        assert list_educations() == []
+
+    education = make_education_fixture(str(resume.id))
+
+    assert list_educations() == [{"id": str(education.id)}]
+
+    # a version evicted from the cache does not bring older responses back
+    caches["graphql_responses"].delete(
+        make_responses_version_cache_key(user.id)
+    )  # noqa E501
+
+    assert list_educations() == [{"id": str(education.id)}]
+
+
+def test_responses_cache_must_be_shared_by_workers(settings):
+    settings.GRAPHQL_RESPONSE_CACHE = True
+
+    [error] = check_responses_cache(None)
+    assert error.id == "server.E001"
+
+    settings.CACHES = {
+        **settings.CACHES,
+        "graphql_responses": {
+            "BACKEND": "django.core.cache.backends.memcached.MemcachedCache",
+            "LOCATION": "memcached:11211",
+        },
+    }
+
+    assert check_responses_cache(None) == []
+
+
+def test_batch_of_operations_shares_loader_of_request(
+    client, user_and_resume_fixture, django_assert_num_queries
+):
+    user, resume = user_and_resume_fixture
+    get_first_name = """
+        query($input: GetResumeInput!) {
+            getResume(input: $input) { personalInfo { firstName } }
+        }
+    """
+    create_personal_info = """
+        mutation($input: CreatePersonalInfoInput!) {
+            createPersonalInfo(input: $input) { __typename }
+        }
+    """
+    get_first_name_variables = {"input": {"id": str(resume.id)}}
+
+    def post_batch(operations):
+        response = client.post(
+            "/graphql",
+            json.dumps(
+                [
+                    {"query": query, "variables": variables}
+                    for query, variables in operations
+                ]
+            ),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {user_to_jwt(user)}",
+        )
+
+        return response.status_code, json.loads(response.content)
+
+    caches["resumes"].clear()
+
+    # the user, the resume and its personal info - once for both queries
+    with django_assert_num_queries(3):
+        status, results = post_batch(
+            [(get_first_name, get_first_name_variables)] * 2
+        )  # noqa E501
+
+    assert status == 200
+    assert results == [{"data": {"getResume": {"personalInfo": None}}}] * 2
+
+    status, results = post_batch(
+        [
+            (get_first_name, get_first_name_variables),
+            (
+                create_personal_info,
+                {"input": {"resumeId": str(resume.id), "firstName": "kanmii"}},
+            ),
+            (get_first_name, get_first_name_variables),
+            ("{ nope }", {}),
+        ]
+    )
+
+    # a query after a mutation sees what it wrote
+    assert [result.get("data") for result in results] == [
+        {"getResume": {"personalInfo": None}},
+        {"createPersonalInfo": {"__typename": "PersonalInfoSuccess"}},
+        {"getResume": {"personalInfo": {"firstName": "kanmii"}}},
+        None,
+    ]
+
+    # the batch has the status of its worst operation
+    assert status == 400
+    assert results[-1]["errors"]